@@ -2,9 +2,7 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import pathlib
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
@@ -14,6 +12,7 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import issue_registry as ir
+from homeassistant.loader import async_get_integration
 
 from .const import (
     CONF_CAL_HUMIDITY,
@@ -46,6 +45,24 @@ SERVICE_APPLY_CALIBRATION = "apply_calibration"
 ATTR_ENTRY_ID = "entry_id"
 
 SERVICE_RESET_RAIN_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+# Service schemas are built once at import rather than on every entry setup.
+SERVICE_RESET_LEARNING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional("target", default="all"): vol.In(("all", "solar", "forecast", "streaks")),
+    }
+)
+SERVICE_EXPORT_LEARNING_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+# Calibration bounds must match number.py entity limits.
+SERVICE_APPLY_CALIBRATION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(CONF_CAL_TEMP_C): vol.All(vol.Coerce(float), vol.Range(min=-10.0, max=10.0)),
+        vol.Optional(CONF_CAL_HUMIDITY): vol.All(vol.Coerce(float), vol.Range(min=-20.0, max=20.0)),
+        vol.Optional(CONF_CAL_PRESSURE_HPA): vol.All(vol.Coerce(float), vol.Range(min=-10.0, max=10.0)),
+        vol.Optional(CONF_CAL_WIND_MS): vol.All(vol.Coerce(float), vol.Range(min=-5.0, max=5.0)),
+    }
+)
 
 
 async def async_migrate_entry(hass: HomeAssistant, entry) -> bool:
@@ -187,20 +204,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Do NOT re-raise - a failed initial fetch must not block entry creation.
         # The 60s tick scheduler will retry all fetches automatically.
 
-    # Create a device for the station.
-    # Use executor_job so that the manifest.json read does not block the HA
-    # event loop (HA logs "Detected blocking call to read_text" otherwise).
+    # Create a device for the station. The version comes from the manifest
+    # HA's loader already parsed, so no file read is needed on each setup.
     dev_reg = dr.async_get(hass)
-    _manifest_path = pathlib.Path(__file__).parent / "manifest.json"
-    _manifest_text = await hass.async_add_executor_job(_manifest_path.read_text, "utf-8")
-    _manifest = json.loads(_manifest_text)
+    integration = await async_get_integration(hass, DOMAIN)
     dev_reg.async_get_or_create(
         config_entry_id=entry.entry_id,
         identifiers={(DOMAIN, entry.entry_id)},
         name=entry.title,
         manufacturer="Weather Station Core",
         model="Derived Weather Package",
-        sw_version=_manifest.get("version", "unknown"),
+        sw_version=str(integration.version or "unknown"),
     )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -229,14 +243,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # ── Learning state services ──────────────────────────────────────────
     # v0.3.0: removed apply_learned_calibration (was tied to cut METAR family)
-    SERVICE_RESET_LEARNING_SCHEMA = vol.Schema(
-        {
-            vol.Optional(ATTR_ENTRY_ID): cv.string,
-            vol.Optional("target", default="all"): vol.In(["all", "solar", "forecast", "streaks"]),
-        }
-    )
-    SERVICE_EXPORT_LEARNING_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
-
     def _get_targets(call: ServiceCall) -> list:
         entry_id = call.data.get(ATTR_ENTRY_ID)
         if entry_id:
@@ -284,7 +290,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     # ── Apply calibration service ────────────────────────────────────────
-    # Calibration bounds must match number.py entity limits.
     # Threshold for the "large offset" Repairs advisory is 50 % of each max.
     _CAL_LARGE_THRESHOLD = {
         CONF_CAL_TEMP_C: 5.0,  # 50 % of 10.0
@@ -293,16 +298,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         CONF_CAL_WIND_MS: 2.5,  # 50 % of 5.0
     }
 
-    SERVICE_APPLY_CALIBRATION_SCHEMA = vol.Schema(
-        {
-            vol.Optional(ATTR_ENTRY_ID): cv.string,
-            vol.Optional(CONF_CAL_TEMP_C): vol.All(vol.Coerce(float), vol.Range(min=-10.0, max=10.0)),
-            vol.Optional(CONF_CAL_HUMIDITY): vol.All(vol.Coerce(float), vol.Range(min=-20.0, max=20.0)),
-            vol.Optional(CONF_CAL_PRESSURE_HPA): vol.All(vol.Coerce(float), vol.Range(min=-10.0, max=10.0)),
-            vol.Optional(CONF_CAL_WIND_MS): vol.All(vol.Coerce(float), vol.Range(min=-5.0, max=5.0)),
-        }
-    )
-
     async def _apply_calibration(call: ServiceCall) -> None:
         """Write calibration offsets into config entry options and reload."""
         entry_id = call.data.get(ATTR_ENTRY_ID)
@@ -16,9 +16,14 @@ References:
 
 from __future__ import annotations
 
+import functools
 import math
+from bisect import bisect_right
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 
+from .const import BEAUFORT_BOUNDARIES, MAGNUS_ICE, MAGNUS_WATER, PRESSURE_TREND_BOUNDARIES, WIND_SMOOTH_ALPHA
+
 # ---------------------------------------------------------------------------
 # Moon phase UI helpers
 # ---------------------------------------------------------------------------
@@ -51,7 +56,7 @@ def calculate_dew_point(temp_c: float, humidity: float) -> float:
     Valid range: -45 C to +60 C, 1%-100% RH.
     Max error < 0.1 C across valid range.
     """
-    a, b = 17.625, 243.04
+    a, b = MAGNUS_WATER
     rh_clamped = max(1.0, min(100.0, humidity))
     gamma = (a * temp_c) / (b + temp_c) + math.log(rh_clamped / 100.0)
     return round((b * gamma) / (a - gamma), 2)
@@ -68,7 +73,7 @@ def calculate_frost_point(temp_c: float, humidity: float) -> float:
     point at the same conditions, because ice requires less vapour
     pressure to saturate than liquid water does.
     """
-    a, b = 22.587, 273.86
+    a, b = MAGNUS_ICE
     rh_clamped = max(1.0, min(100.0, humidity))
     gamma = (a * temp_c) / (b + temp_c) + math.log(rh_clamped / 100.0)
     return round((b * gamma) / (a - gamma), 2)
@@ -328,32 +333,34 @@ def feels_like_comfort_level(feels_like_c: float) -> str:
 
 
 def wind_speed_to_beaufort(wind_speed_ms: float) -> int:
-    """Convert wind speed (m/s) to Beaufort number (WMO No. 8)."""
-    boundaries = [0.3, 1.6, 3.4, 5.5, 8.0, 10.8, 13.9, 17.2, 20.8, 24.5, 28.5, 32.7]
-    for i, b in enumerate(boundaries):
-        if wind_speed_ms < b:
-            return i
-    return 12
+    """Convert wind speed (m/s) to Beaufort number (WMO No. 8).
+
+    The force is the number of lower bounds at or below the speed, i.e.
+    ``bisect_right`` over the sorted boundaries (NaN falls through to 12).
+    """
+    return bisect_right(BEAUFORT_BOUNDARIES, wind_speed_ms)
+
+
+_BEAUFORT_DESCRIPTIONS = (
+    "Calm",
+    "Light Air",
+    "Light Breeze",
+    "Gentle Breeze",
+    "Moderate Breeze",
+    "Fresh Breeze",
+    "Strong Breeze",
+    "Near Gale",
+    "Gale",
+    "Strong Gale",
+    "Storm",
+    "Violent Storm",
+    "Hurricane",
+)
 
 
 def beaufort_description(beaufort: int) -> str:
     """WMO Beaufort scale description."""
-    descriptions = [
-        "Calm",
-        "Light Air",
-        "Light Breeze",
-        "Gentle Breeze",
-        "Moderate Breeze",
-        "Fresh Breeze",
-        "Strong Breeze",
-        "Near Gale",
-        "Gale",
-        "Strong Gale",
-        "Storm",
-        "Violent Storm",
-        "Hurricane",
-    ]
-    return descriptions[min(beaufort, 12)]
+    return _BEAUFORT_DESCRIPTIONS[min(beaufort, 12)]
 
 
 # ---------------------------------------------------------------------------
@@ -379,7 +386,7 @@ def direction_to_quadrant(degrees: float) -> str:
     return "W"
 
 
-def smooth_wind_direction(current_deg: float, previous_deg: float, alpha: float = 0.3) -> float:
+def smooth_wind_direction(current_deg: float, previous_deg: float, alpha: float = WIND_SMOOTH_ALPHA) -> float:
     """Circular exponential smoothing for wind direction."""
     diff = current_deg - previous_deg
     if diff > 180:
@@ -399,15 +406,19 @@ def smooth_wind_direction(current_deg: float, previous_deg: float, alpha: float
 # ---------------------------------------------------------------------------
 
 
-def least_squares_pressure_trend(pressure_readings: list, interval_minutes: int = 15) -> float:
-    """Least-squares linear trend over pressure history, extrapolated to 3h."""
+def least_squares_pressure_trend(pressure_readings: Sequence[float], interval_minutes: int = 15) -> float:
+    """Least-squares linear trend over pressure history, extrapolated to 3h.
+
+    Accepts any sized sequence, including the runtime's bounded deque, so the
+    caller does not need to copy its ring buffer into a list first.
+    """
     n = len(pressure_readings)
     if n < 2:
         return 0.0
     sum_x = n * (n - 1) / 2
     sum_x2 = n * (n - 1) * (2 * n - 1) / 6
     sum_y = sum(pressure_readings)
-    sum_xy = sum(i * pressure_readings[i] for i in range(n))
+    sum_xy = sum(i * p for i, p in enumerate(pressure_readings))
     denom = (n * sum_x2) - (sum_x * sum_x)
     if denom == 0:
         return 0.0
@@ -416,30 +427,27 @@ def least_squares_pressure_trend(pressure_readings: list, interval_minutes: int
     return round(slope * intervals_per_3h, 2)
 
 
+# Indexed by bisect_right(PRESSURE_TREND_BOUNDARIES, trend_3h).
+_PRESSURE_TREND_LABELS = ("falling_rapidly", "falling", "steady", "rising", "rising_rapidly")
+_PRESSURE_TREND_ARROWS = ("\u2193\u2193", "\u2193", "\u2192", "\u2191", "\u2191\u2191")
+
+
+def _pressure_trend_class(trend_3h: float) -> int:
+    # bisect_right would put NaN in the top class; the original if-chain
+    # fell through every comparison to "falling_rapidly", so keep that.
+    if math.isnan(trend_3h):
+        return 0
+    return bisect_right(PRESSURE_TREND_BOUNDARIES, trend_3h)
+
+
 def pressure_trend_display(trend_3h: float) -> str:
     """Classify 3-hour pressure tendency (WMO No. 306, Table 4680)."""
-    if trend_3h >= 1.6:
-        return "rising_rapidly"
-    if trend_3h >= 0.8:
-        return "rising"
-    if trend_3h > -0.8:
-        return "steady"
-    if trend_3h > -1.6:
-        return "falling"
-    return "falling_rapidly"
+    return _PRESSURE_TREND_LABELS[_pressure_trend_class(trend_3h)]
 
 
 def pressure_trend_arrow(trend_3h: float) -> str:
     """Arrow symbol for pressure tendency."""
-    if trend_3h >= 1.6:
-        return "\u2191\u2191"
-    if trend_3h >= 0.8:
-        return "\u2191"
-    if trend_3h > -0.8:
-        return "\u2192"
-    if trend_3h > -1.6:
-        return "\u2193"
-    return "\u2193\u2193"
+    return _PRESSURE_TREND_ARROWS[_pressure_trend_class(trend_3h)]
 
 
 # ---------------------------------------------------------------------------
@@ -510,6 +518,23 @@ ZAMBRETTI_TEXTS = [
 ]
 
 
+# Wind-quadrant adjustment per climate region (CLIMATE_REGION_OPTIONS):
+# -1 for the region's fair-weather quadrants, +1 for its wet ones.
+_ZAMBRETTI_WIND_ADJ: dict[str, dict[str, float]] = {
+    region: {**dict.fromkeys(good, -1.0), **dict.fromkeys(bad, 1.0)}
+    for region, good, bad in (
+        ("atlantic_europe", ("E", "N"), ("W", "S")),
+        ("mediterranean", ("N", "E"), ("S", "W")),
+        ("continental_europe", ("E", "N"), ("W", "S")),
+        ("scandinavia", ("E", "N"), ("S", "W")),
+        ("north_america_east", ("N", "W"), ("S", "E")),
+        ("north_america_west", ("E", "N"), ("W", "S")),
+        ("australia", ("S", "E"), ("N", "W")),
+        ("custom", ("N", "E"), ("S", "W")),
+    )
+}
+
+
 def zambretti_forecast(
     mslp: float,
     pressure_trend_3h: float,
@@ -555,19 +580,21 @@ def zambretti_forecast(
     # ----------------------------------------------------------------
     # Base Z-number: piecewise map from MSLP (matches Zambretti dial bands)
     # ----------------------------------------------------------------
+    # Band slopes are written as (Z span / hPa span) constant expressions so the
+    # compiler folds them and each evaluation is a single multiply.
     p = max(950.0, min(1060.0, mslp))
     if p >= 1050.0:
-        z_base = 1.0 + (1060.0 - p) / 10.0 * 2.0
+        z_base = 1.0 + (1060.0 - p) * (2.0 / 10.0)
     elif p >= 1030.0:
-        z_base = 3.0 + (1050.0 - p) / 20.0 * 4.0
+        z_base = 3.0 + (1050.0 - p) * (4.0 / 20.0)
     elif p >= 1015.0:
-        z_base = 7.0 + (1030.0 - p) / 15.0 * 4.0
+        z_base = 7.0 + (1030.0 - p) * (4.0 / 15.0)
     elif p >= 1000.0:
-        z_base = 11.0 + (1015.0 - p) / 15.0 * 6.0
+        z_base = 11.0 + (1015.0 - p) * (6.0 / 15.0)
     elif p >= 985.0:
-        z_base = 17.0 + (1000.0 - p) / 15.0 * 5.0
+        z_base = 17.0 + (1000.0 - p) * (5.0 / 15.0)
     else:
-        z_base = 22.0 + (985.0 - p) / 35.0 * 4.0
+        z_base = 22.0 + (985.0 - p) * (4.0 / 35.0)
 
     # Seasonal adjustment
     is_winter = (month <= 3 or month >= 10) if hemisphere == "northern" else (4 <= month <= 9)
@@ -590,25 +617,10 @@ def zambretti_forecast(
         trend_adj = 0.0
 
     # Wind direction adjustment (climate-region-aware, suppressed at low wind)
-    wind_patterns = {
-        "atlantic_europe": {"good": ["E", "N"], "bad": ["W", "S"]},
-        "mediterranean": {"good": ["N", "E"], "bad": ["S", "W"]},
-        "continental_europe": {"good": ["E", "N"], "bad": ["W", "S"]},
-        "scandinavia": {"good": ["E", "N"], "bad": ["S", "W"]},
-        "north_america_east": {"good": ["N", "W"], "bad": ["S", "E"]},
-        "north_america_west": {"good": ["E", "N"], "bad": ["W", "S"]},
-        "australia": {"good": ["S", "E"], "bad": ["N", "W"]},
-        "custom": {"good": ["N", "E"], "bad": ["S", "W"]},
-    }
-    pattern = wind_patterns.get(climate, wind_patterns["mediterranean"])
     if wind_speed_ms is not None and wind_speed_ms < 1.0:
         wind_adj = 0.0
-    elif wind_quadrant in pattern["good"]:
-        wind_adj = -1.0
-    elif wind_quadrant in pattern["bad"]:
-        wind_adj = 1.0
     else:
-        wind_adj = 0.0
+        wind_adj = _ZAMBRETTI_WIND_ADJ.get(climate, _ZAMBRETTI_WIND_ADJ["mediterranean"]).get(wind_quadrant, 0.0)
 
     # Humidity adjustment
     if humidity > 85:
@@ -775,7 +787,13 @@ def format_rain_display(rain_rate_mmph: float) -> str:
 
 
 class KalmanFilter:
-    """Simple 1D Kalman filter for rain rate de-noising."""
+    """Simple 1D Kalman filter for rain rate de-noising.
+
+    Scalar closed form per update (Q = process noise, R = measurement noise):
+      P' = P + Q;  K = P' / (P' + R);  x += K * (z - x);  P = (1 - K) * P'
+    """
+
+    __slots__ = ("error_variance", "estimate", "measurement_noise", "process_noise")
 
     def __init__(self, process_noise=0.01, measurement_noise=0.5, initial_estimate=0.0, initial_error_variance=0.5):
         self.process_noise = process_noise
@@ -786,9 +804,11 @@ class KalmanFilter:
     def update(self, measurement: float) -> float:
         predicted_error_var = self.error_variance + self.process_noise
         kalman_gain = predicted_error_var / (predicted_error_var + self.measurement_noise)
-        self.estimate = self.estimate + kalman_gain * (measurement - self.estimate)
+        estimate = self.estimate
+        estimate += kalman_gain * (measurement - estimate)
+        self.estimate = estimate
         self.error_variance = (1 - kalman_gain) * predicted_error_var
-        return max(0.0, round(self.estimate, 1))
+        return max(0.0, round(estimate, 1))
 
     def filter_quality(self) -> str:
         if self.error_variance < 0.1:
@@ -1024,6 +1044,26 @@ def get_condition_severity(condition: str) -> str:
     return "normal"
 
 
+# (icon, color, description, severity) per condition, resolved at import.
+CONDITION_META: dict[str, tuple[str, str, str, str]] = {
+    c: (
+        CONDITION_ICONS.get(c, "mdi:weather-partly-cloudy"),
+        CONDITION_COLORS.get(c, "#FCD34D"),
+        CONDITION_DESCRIPTIONS.get(c, c),
+        get_condition_severity(c),
+    )
+    for c in CONDITION_DESCRIPTIONS.keys() | CONDITION_ICONS.keys() | CONDITION_COLORS.keys()
+}
+
+
+def condition_meta(condition: str) -> tuple[str, str, str, str]:
+    """Return (icon, color, description, severity) for a condition."""
+    meta = CONDITION_META.get(condition)
+    if meta is None:
+        meta = ("mdi:weather-partly-cloudy", "#FCD34D", condition, get_condition_severity(condition))
+    return meta
+
+
 # ---------------------------------------------------------------------------
 # Humidity / UV helpers
 # ---------------------------------------------------------------------------
@@ -1341,10 +1381,11 @@ def calculate_moon_phase(year: int, month: int, day: int) -> str:
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=16)
 def extraterrestrial_radiation_mj(lat_deg: float, day_of_year: int) -> float:
     """Return extraterrestrial radiation Ra in MJ m⁻² day⁻¹.
 
-    Uses FAO-56 equations 21-24.
+    Uses FAO-56 equations 21-24. Cached: the inputs only change once a day.
     """
     phi = math.radians(lat_deg)
     dr = 1 + 0.033 * math.cos(2 * math.pi * day_of_year / 365)
@@ -2254,9 +2295,12 @@ def calculate_leaf_wetness(temp_c: float, dew_c: float, rh: float) -> bool:
 # ===========================================================================
 
 
+@functools.lru_cache(maxsize=16)
 def calculate_max_solar_radiation(lat_deg: float, day_of_year: int, elevation_m: float = 0.0) -> float:
     """Maximum possible (clear-sky) solar radiation at the surface (W/m²).
 
+    Cached: for a given station the inputs only change once a day.
+
     Uses the Bras (1990) clear-sky model:
       Ra = extra-terrestrial radiation * (a + b × n/N)
     Simplified to use the FAO-56 top-of-atmosphere radiation (Ra) and the
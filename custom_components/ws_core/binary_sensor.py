@@ -21,6 +21,19 @@ from .const import (
     KEY_RAIN_EXPECTED_1H,
 )
 
+# v2.0: per-sensor problem binary sensors (gated by diagnostics toggle):
+# (coordinator data key, entity slug, icon)
+_PROBLEM_SENSORS: tuple[tuple[str, str, str], ...] = (
+    ("_temp_stuck", "temperature_stuck", "mdi:thermometer-alert"),
+    ("_humidity_stuck", "humidity_stuck", "mdi:water-percent-alert"),
+    ("_pressure_stuck", "pressure_stuck", "mdi:gauge-empty"),
+    ("_temp_out_of_range", "temperature_out_of_range", "mdi:thermometer-off"),
+    ("_humidity_out_of_range", "humidity_out_of_range", "mdi:water-alert"),
+    ("_pressure_out_of_range", "pressure_out_of_range", "mdi:gauge-low"),
+    ("_wind_gust_below_wind", "wind_gust_below_wind", "mdi:weather-windy-variant"),
+    ("_dew_exceeds_temp", "dew_exceeds_temp", "mdi:water-thermometer"),
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
@@ -32,20 +45,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     if opts.get(CONF_ENABLE_NOWCAST, DEFAULT_ENABLE_NOWCAST):
         entities.append(WSRainExpected1h(coordinator, entry, prefix))
 
-    # v2.0: per-sensor problem binary sensors (gated by diagnostics toggle)
     if opts.get(CONF_ENABLE_DIAGNOSTICS, DEFAULT_ENABLE_DIAGNOSTICS):
-        problem_sensors = [
-            ("_temp_stuck", "temperature_stuck", "mdi:thermometer-alert"),
-            ("_humidity_stuck", "humidity_stuck", "mdi:water-percent-alert"),
-            ("_pressure_stuck", "pressure_stuck", "mdi:gauge-empty"),
-            ("_temp_out_of_range", "temperature_out_of_range", "mdi:thermometer-off"),
-            ("_humidity_out_of_range", "humidity_out_of_range", "mdi:water-alert"),
-            ("_pressure_out_of_range", "pressure_out_of_range", "mdi:gauge-low"),
-            ("_wind_gust_below_wind", "wind_gust_below_wind", "mdi:weather-windy-variant"),
-            ("_dew_exceeds_temp", "dew_exceeds_temp", "mdi:water-thermometer"),
-        ]
-        for data_key, slug, icon in problem_sensors:
-            entities.append(WSProblemBinarySensor(coordinator, entry, prefix, data_key, slug, icon))
+        entities.extend(
+            WSProblemBinarySensor(coordinator, entry, prefix, data_key, slug, icon)
+            for data_key, slug, icon in _PROBLEM_SENSORS
+        )
 
     async_add_entities(entities)
 
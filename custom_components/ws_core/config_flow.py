@@ -14,15 +14,20 @@ The Options flow (Configure button) exposes all settings for post-install change
 
 from __future__ import annotations
 
+import bisect
+import functools
 import logging
+import string
 import uuid
+from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     ALTITUDE_UNIT_OPTIONS,
@@ -215,6 +220,7 @@ from .const import (
     FORECAST_PROVIDER_PIRATE,
     HEMISPHERE_OPTIONS,
     OPTIONAL_SOURCES,
+    OPTIONAL_SOURCES_SET,
     PRESSURE_UNIT_OPTIONS,
     PROVIDERS_REQUIRING_API_KEY,
     PROVIDERS_REQUIRING_ENTITY,
@@ -251,7 +257,7 @@ _LOGGER = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-async def _validate_wu_credentials(station_id: str, api_key: str) -> tuple[bool, str]:
+async def _validate_wu_credentials(hass: HomeAssistant, station_id: str, api_key: str) -> tuple[bool, str]:
     """Validate Weather Underground station ID + station key using the upload endpoint.
 
     The field stored as ``wu_api_key`` is the station key (PASSWORD) used by the PWS
@@ -276,26 +282,45 @@ async def _validate_wu_credentials(station_id: str, api_key: str) -> tuple[bool,
             "action": "updateraw",
             "dateutc": "now",
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                body = (await resp.text()).lower().strip()
-                if resp.status == 200 and "success" in body:
-                    return True, ""
-                # 401 = bad PASSWORD (station key); 403 = station exists but rejected
-                if resp.status in (401, 403):
-                    return False, "invalid_api_key"
-                # station ID not recognised
-                if resp.status == 404:
-                    return False, "station_not_found"
-                return False, "cannot_connect"
+        # HA's shared session keeps the connection to the upload host alive,
+        # so the first real upload after setup reuses it.
+        session = async_get_clientsession(hass)
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            body = (await resp.text()).lower().strip()
+            if resp.status == 200 and "success" in body:
+                return True, ""
+            # 401 = bad PASSWORD (station key); 403 = station exists but rejected
+            if resp.status in (401, 403):
+                return False, "invalid_api_key"
+            # station ID not recognised
+            if resp.status == 404:
+                return False, "station_not_found"
+            return False, "cannot_connect"
     except Exception:
         return False, "cannot_connect"
 
 
+_PREFIX_ALLOWED = frozenset(string.ascii_lowercase + string.digits + "_")
+
+
+class _PrefixTranslation(dict):
+    """``str.translate`` table mapping every character outside ``[a-z0-9_]`` to ``_``.
+
+    The ASCII range is filled up front; any other code point is resolved on
+    first use and remembered, so the table covers the full Unicode range.
+    """
+
+    def __missing__(self, cp: int) -> int:
+        out = cp if chr(cp) in _PREFIX_ALLOWED else ord("_")
+        self[cp] = out
+        return out
+
+
+_PREFIX_XLATE = _PrefixTranslation({cp: cp if chr(cp) in _PREFIX_ALLOWED else ord("_") for cp in range(128)})
+
+
 def _sanitize_prefix(prefix: str) -> str:
-    p = (prefix or "").strip().lower()
-    p = "".join(ch if (ch.isalnum() or ch == "_") else "_" for ch in p)
-    p = p.strip("_")
+    p = (prefix or "").strip().lower().translate(_PREFIX_XLATE).strip("_")
     return p or DEFAULT_PREFIX
 
 
@@ -362,69 +387,80 @@ def _ensure_selected_stations_present(options: list[dict], existing: list[dict])
     return options
 
 
+# Entity-id name patterns per source slot, most specific first.
+_GUESS_PATTERNS: dict[str, tuple[str, ...]] = {
+    SRC_TEMP: (
+        "_outdoor_temperature",
+        "_air_temperature",
+        "_temp_out",
+        "ws_01_temperature",
+        "ws90_temperature",
+        "temperature",
+    ),
+    SRC_HUM: (
+        "_outdoor_humidity",
+        "_relative_humidity",
+        "_humidity_out",
+        "ws_01_humidity",
+        "ws90_humidity",
+        "humidity",
+    ),
+    SRC_PRESS: ("_absolute_pressure", "_station_pressure", "ws_01_pressure", "ws90_pressure", "pressure"),
+    SRC_WIND: ("_wind_speed", "ws_01_speed_1", "speed_1"),
+    SRC_GUST: ("_wind_gust", "ws_01_speed_2", "speed_2", "gust"),
+    SRC_WIND_DIR: ("_wind_direction", "_wind_dir", "ws_01_direction", "direction"),
+    SRC_RAIN_TOTAL: ("_rain_total", "_precipitation", "_yearly_rain", "ws_01_precipitation", "rainfall"),
+    SRC_LUX: ("_illuminance", "ws_01_illuminance", "lux"),
+    SRC_UV: ("_uv_index", "ws_01_uv_index", "uv"),
+    SRC_DEW_POINT: ("_dew_point", "ws_01_dew_point"),
+    SRC_BATTERY: ("_battery", "ws_01_battery", "ws90_battery", "wh90_battery"),
+}
+
+# Words that mark an entity as belonging to an outdoor weather station.
+_STATION_HINTS = ("outdoor", "absolute", "wind", "rain", "precipitation", "station", "air")
+
+
 def _guess_defaults(hass: HomeAssistant) -> dict[str, str]:
-    """Best-effort auto-detection of sensor entity IDs by name pattern."""
-    guess: dict[str, str] = {}
-    candidates = [s.entity_id for s in hass.states.async_all()]
-
-    def pick(subs: list[str]) -> str | None:
-        # First priority: Match exact weather station integration suffixes
-        for sub in subs:
-            for eid in candidates:
-                if eid.endswith(sub) and (
-                    "outdoor" in eid
-                    or "absolute" in eid
-                    or "wind" in eid
-                    or "rain" in eid
-                    or "precipitation" in eid
-                    or "station" in eid
-                    or "air" in eid
-                ):
-                    return eid
-        # Second priority: Any matching suffix
-        for sub in subs:
-            for eid in candidates:
-                if eid.endswith(sub):
-                    return eid
-        # Fallback: substring match
-        for sub in subs:
-            for eid in candidates:
-                if sub in eid:
-                    return eid
-        return None
+    """Best-effort auto-detection of sensor entity IDs by name pattern.
 
-    mapping = {
-        SRC_TEMP: [
-            "_outdoor_temperature",
-            "_air_temperature",
-            "_temp_out",
-            "ws_01_temperature",
-            "ws90_temperature",
-            "temperature",
-        ],
-        SRC_HUM: [
-            "_outdoor_humidity",
-            "_relative_humidity",
-            "_humidity_out",
-            "ws_01_humidity",
-            "ws90_humidity",
-            "humidity",
-        ],
-        SRC_PRESS: ["_absolute_pressure", "_station_pressure", "ws_01_pressure", "ws90_pressure", "pressure"],
-        SRC_WIND: ["_wind_speed", "ws_01_speed_1", "speed_1"],
-        SRC_GUST: ["_wind_gust", "ws_01_speed_2", "speed_2", "gust"],
-        SRC_WIND_DIR: ["_wind_direction", "_wind_dir", "ws_01_direction", "direction"],
-        SRC_RAIN_TOTAL: ["_rain_total", "_precipitation", "_yearly_rain", "ws_01_precipitation", "rainfall"],
-        SRC_LUX: ["_illuminance", "ws_01_illuminance", "lux"],
-        SRC_UV: ["_uv_index", "ws_01_uv_index", "uv"],
-        SRC_DEW_POINT: ["_dew_point", "ws_01_dew_point"],
-        SRC_BATTERY: ["_battery", "ws_01_battery", "ws90_battery", "wh90_battery"],
-    }
-
-    for k, subs in mapping.items():
-        eid = pick(subs)
-        if eid:
-            guess[k] = eid
+    Each candidate is ranked per slot by (tier, pattern index), where tier 0
+    is a suffix match on a station-looking entity, tier 1 any suffix match and
+    tier 2 a plain substring match; the first entity seen wins ties.
+
+    Suffix matches are found by bisecting the reversed entity ids, sorted
+    once per call, so each pattern costs O(log N) plus its hits; only slots
+    with no suffix match at all fall back to a linear substring scan.
+    """
+    # Only sensor.* entities can be mapped, so use HA's per-domain index rather
+    # than walking every State object in the instance.
+    ids = hass.states.async_entity_ids("sensor")
+    rev = sorted((eid[::-1], pos) for pos, eid in enumerate(ids))
+    rev_keys = [r for r, _ in rev]
+    # Hot-loop names bound to locals (LOAD_FAST instead of global/attr lookups).
+    bisect_left = bisect.bisect_left
+    hints = _STATION_HINTS
+    guess: dict[str, str] = {}
+    for k, patterns in _GUESS_PATTERNS.items():
+        best: tuple[int, int, int] | None = None  # (tier, pattern index, position)
+        for idx, sub in enumerate(patterns):
+            r = sub[::-1]
+            lo = bisect_left(rev_keys, r)
+            hi = bisect_left(rev_keys, r + "\U0010ffff", lo)
+            for _, pos in rev[lo:hi]:
+                eid = ids[pos]
+                cand = (0 if any(h in eid for h in hints) else 1, idx, pos)
+                if best is None or cand < best:
+                    best = cand
+            if best is not None and best[0] == 0:
+                break  # later patterns cannot beat a station-like suffix match
+        if best is None:
+            for idx, sub in enumerate(patterns):
+                pos = next((p for p, eid in enumerate(ids) if sub in eid), None)
+                if pos is not None:
+                    best = (2, idx, pos)
+                    break
+        if best is not None:
+            guess[k] = ids[best[2]]
     return guess
 
 
@@ -515,35 +551,341 @@ def _is_imperial(units_mode: str, hass: HomeAssistant) -> bool:
         return False
 
 
+# "auto" gust / rain units keyed by _is_imperial().
+_AUTO_UNITS: dict[bool, tuple[str, str]] = {True: ("mph", "in"), False: ("m/s", "mm")}
 _GUST_UNIT_FACTORS: dict[str, float] = {"m/s": 1.0, "km/h": 3.6, "mph": 2.23694, "kn": 1.94384}
+_MM_PER_IN = 25.4
+_IN_PER_MM = 1.0 / _MM_PER_IN
+_F_PER_C = 9.0 / 5.0
+_C_PER_F = 5.0 / 9.0
 
 
-def _convert_gust_to_display(ms: float, wind_unit: str) -> float:
-    return ms * _GUST_UNIT_FACTORS.get(wind_unit, 1.0)
+@dataclass(frozen=True, slots=True)
+class _FormUnits:
+    """Display units and conversion factors for one threshold form.
 
+    Resolved once per step from the unit settings, so every threshold field
+    converts with a plain multiply (or multiply-add for temperature) instead
+    of re-dispatching on the unit string per field.
+    """
 
-def _convert_gust_to_ms(val: float, wind_unit: str) -> float:
-    return val / _GUST_UNIT_FACTORS.get(wind_unit, 1.0)
+    gust_u: str
+    rain_meas: str
+    rain_u: str
+    temp_u: str
+    gust_to_display: float
+    gust_to_ms: float
+    rain_to_display: float
+    rain_to_mmph: float
+    temp_slope: float
+    temp_slope_inv: float
+    temp_offset: float
+    freeze_min: float
+    freeze_max: float
 
+    @classmethod
+    @functools.cache
+    def resolve(cls, imperial: bool, wind_unit_conf: str, rain_unit_conf: str, temp_unit_conf: str) -> _FormUnits:
+        # Only a handful of unit combinations exist, so instances are cached
+        # and shared across renders and flows (the dataclass is frozen).
+        auto_gust, auto_rain = _AUTO_UNITS[imperial]
+        gust_u = wind_unit_conf if wind_unit_conf != "auto" else auto_gust
+        rain_meas = rain_unit_conf if rain_unit_conf != "auto" else auto_rain
+        fahrenheit = temp_unit_conf == "F" if temp_unit_conf != "auto" else imperial
+        gust_f = _GUST_UNIT_FACTORS.get(gust_u, 1.0)
+        inches = rain_meas == "in"
+        return cls(
+            gust_u=gust_u,
+            rain_meas=rain_meas,
+            rain_u="in/h" if inches else "mm/h",
+            temp_u="°F" if fahrenheit else "°C",
+            gust_to_display=gust_f,
+            gust_to_ms=1.0 / gust_f,
+            rain_to_display=_IN_PER_MM if inches else 1.0,
+            rain_to_mmph=_MM_PER_IN if inches else 1.0,
+            temp_slope=_F_PER_C if fahrenheit else 1.0,
+            temp_slope_inv=_C_PER_F if fahrenheit else 1.0,
+            temp_offset=32.0 if fahrenheit else 0.0,
+            # Freeze-threshold box bounds (-30..10 °C) in display units, pre-rounded.
+            freeze_min=round(-30.0 * _F_PER_C + 32.0, 1) if fahrenheit else -30.0,
+            freeze_max=round(10.0 * _F_PER_C + 32.0, 1) if fahrenheit else 10.0,
+        )
 
-def _convert_rain_to_display(mmph: float, rain_unit: str) -> float:
-    return mmph / 25.4 if rain_unit == "in" else mmph
+    def temp_to_display(self, c: float) -> float:
+        return c * self.temp_slope + self.temp_offset
 
+    def temp_to_c(self, val: float) -> float:
+        return (val - self.temp_offset) * self.temp_slope_inv
 
-def _convert_rain_to_mmph(val: float, rain_unit: str) -> float:
-    return val * 25.4 if rain_unit == "in" else val
 
+# ---------------------------------------------------------------------------
+# Shared selectors
+#
+# Selector objects carry only static configuration, so the ones whose
+# arguments are constant are built once at import and shared by every form
+# render in both flows instead of being re-instantiated per step.
+# ---------------------------------------------------------------------------
 
-def _convert_temp_to_display(c: float, imperial: bool) -> float:
-    return (c * 9.0 / 5.0) + 32.0 if imperial else c
+# Plain sensor selector — no device_class filter (fixes issue #41: sensors mis-routed into wrong slots)
+_ENTITY_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
+_WEATHER_ENTITY_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="weather"))
+_BOOL_SELECTOR = selector.BooleanSelector()
+_TEXT_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(type="text"))
+_PASSWORD_SELECTOR = selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD))
+_LAT_SELECTOR = selector.NumberSelector(selector.NumberSelectorConfig(min=-90, max=90, step=0.001, mode="box"))
+_LON_SELECTOR = selector.NumberSelector(selector.NumberSelectorConfig(min=-180, max=180, step=0.001, mode="box"))
+_HEMISPHERE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=HEMISPHERE_OPTIONS, mode="list", translation_key="hemisphere")
+)
+_CLIMATE_REGION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=CLIMATE_REGION_OPTIONS, mode="dropdown", translation_key="climate_region")
+)
+_ELEVATION_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=VALID_ELEVATION_MIN_M,
+        max=VALID_ELEVATION_MAX_M,
+        step=1,
+        mode="box",
+        unit_of_measurement="m",
+    )
+)
+_UNITS_MODE_LIST_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=UNITS_MODE_OPTIONS, mode="list", translation_key="units_mode")
+)
+_TEMP_UNIT_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"value": "auto", "label": "Auto"},
+            {"value": "C", "label": "Celsius (°C)"},
+            {"value": "F", "label": "Fahrenheit (°F)"},
+        ],
+        mode="list",
+    )
+)
 
 
-def _convert_temp_to_c(val: float, imperial: bool) -> float:
-    return (val - 32.0) * 5.0 / 9.0 if imperial else val
+def _unit_select(options: list[str]) -> selector.SelectSelector:
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(options=[{"value": o, "label": o} for o in options], mode="list")
+    )
 
 
-# Plain sensor selector — no device_class filter (fixes issue #41: sensors mis-routed into wrong slots)
-_ENTITY_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
+_WIND_UNIT_SELECTOR = _unit_select(WIND_UNIT_OPTIONS)
+_PRESSURE_UNIT_SELECTOR = _unit_select(PRESSURE_UNIT_OPTIONS)
+_RAIN_UNIT_SELECTOR = _unit_select(RAIN_UNIT_OPTIONS)
+_DISTANCE_UNIT_SELECTOR = _unit_select(DISTANCE_UNIT_OPTIONS)
+_ALTITUDE_UNIT_SELECTOR = _unit_select(ALTITUDE_UNIT_OPTIONS)
+_FORECAST_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=10, max=180, step=5, mode="box", unit_of_measurement="min")
+)
+_FORECAST_PROVIDER_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            FORECAST_PROVIDER_OPEN_METEO,
+            FORECAST_PROVIDER_MET_NO,
+            FORECAST_PROVIDER_NWS,
+            FORECAST_PROVIDER_OWM,
+            FORECAST_PROVIDER_PIRATE,
+            FORECAST_PROVIDER_METEO_FRANCE,
+            FORECAST_PROVIDER_HA_ENTITY,
+        ],
+        mode=selector.SelectSelectorMode.LIST,
+        translation_key="forecast_provider",
+    )
+)
+_STALENESS_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=60, max=86400, step=60, mode="box", unit_of_measurement="s")
+)
+_RAIN_ALPHA_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0.05, max=1.0, step=0.05, mode="slider")
+)
+_TREND_WINDOW_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=12, step=1, mode="box", unit_of_measurement="h")
+)
+_UPLOAD_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
+)
+_WU_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=30, step=1, mode="box", unit_of_measurement="min")
+)
+_CWOP_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=5, max=60, step=1, mode="box", unit_of_measurement="min")
+)
+_CWOP_PORT_SELECTOR = selector.NumberSelector(selector.NumberSelectorConfig(min=1, max=65535, step=1, mode="box"))
+_AQI_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=15, max=360, step=15, mode="box", unit_of_measurement="min")
+)
+_SOLAR_PEAK_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0.1,
+        max=100.0,
+        step=0.1,
+        mode="box",
+        unit_of_measurement="kWp",
+    )
+)
+_SOLAR_AZIMUTH_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=359, step=1, mode="box", unit_of_measurement="°")
+)
+_SOLAR_TILT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=0, max=90, step=1, mode="box", unit_of_measurement="°")
+)
+_SOLAR_INTERVAL_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=30, max=360, step=30, mode="box", unit_of_measurement="min")
+)
+
+
+@functools.cache
+def _threshold_selector(min_: float, max_: float, step: float, unit: str) -> selector.NumberSelector:
+    """Unit-dependent threshold box, cached per (range, unit) combination."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(min=min_, max=max_, step=step, mode="box", unit_of_measurement=unit)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Feature / upload toggles shared by the config flow and the options flow, so
+# the two can't drift apart. Entries are (option key, default).
+# ---------------------------------------------------------------------------
+
+_FEATURE_TOGGLES: tuple[tuple[str, bool], ...] = (
+    (CONF_ENABLE_DISPLAY_SENSORS, DEFAULT_ENABLE_DISPLAY_SENSORS),
+    (CONF_ENABLE_FIRE_RISK, DEFAULT_ENABLE_FIRE_RISK),
+    (CONF_ENABLE_FOG, DEFAULT_ENABLE_FOG),
+    (CONF_ENABLE_THUNDERSTORM, DEFAULT_ENABLE_THUNDERSTORM),
+    (CONF_ENABLE_SEA_TEMP, DEFAULT_ENABLE_SEA_TEMP),
+    (CONF_ENABLE_AIR_QUALITY, DEFAULT_ENABLE_AIR_QUALITY),
+    (CONF_ENABLE_POLLEN, DEFAULT_ENABLE_POLLEN),
+    (CONF_ENABLE_MOON, DEFAULT_ENABLE_MOON),
+    (CONF_ENABLE_SOLAR_FORECAST, DEFAULT_ENABLE_SOLAR_FORECAST),
+    (CONF_ENABLE_COMFORT_INDICES, DEFAULT_ENABLE_COMFORT_INDICES),
+    (CONF_ENABLE_VIGILANCE_METEO, DEFAULT_ENABLE_VIGILANCE_METEO),
+    (CONF_ENABLE_VIGICRUES, DEFAULT_ENABLE_VIGICRUES),
+    (CONF_ENABLE_DIAGNOSTICS, DEFAULT_ENABLE_DIAGNOSTICS),
+    (CONF_ENABLE_FWI_COMPONENTS, DEFAULT_ENABLE_FWI_COMPONENTS),
+    (CONF_ENABLE_ADVANCED_SENSORS, DEFAULT_ENABLE_ADVANCED_SENSORS),
+    (CONF_ENABLE_NOWCAST, DEFAULT_ENABLE_NOWCAST),
+    # v2.0 feature toggles
+    (CONF_ENABLE_DEGREE_DAYS, DEFAULT_ENABLE_DEGREE_DAYS),
+    (CONF_ENABLE_LIGHTNING, DEFAULT_ENABLE_LIGHTNING),
+    (CONF_ENABLE_INDOOR, DEFAULT_ENABLE_INDOOR),
+    (CONF_ENABLE_SOIL, DEFAULT_ENABLE_SOIL),
+)
+
+_UPLOAD_TOGGLES: tuple[tuple[str, bool], ...] = (
+    (CONF_ENABLE_WUNDERGROUND, DEFAULT_ENABLE_WUNDERGROUND),
+    (CONF_ENABLE_WEATHERCLOUD, DEFAULT_ENABLE_WEATHERCLOUD),
+    (CONF_ENABLE_PWSWEATHER, DEFAULT_ENABLE_PWSWEATHER),
+    (CONF_ENABLE_WOW, DEFAULT_ENABLE_WOW),
+    (CONF_ENABLE_AWEKAS, DEFAULT_ENABLE_AWEKAS),
+    (CONF_ENABLE_CWOP, DEFAULT_ENABLE_CWOP),
+    (CONF_ENABLE_OWM_STATIONS, DEFAULT_ENABLE_OWM_STATIONS),
+    (CONF_ENABLE_WINDY, DEFAULT_ENABLE_WINDY),
+    (CONF_ENABLE_MQTT, DEFAULT_ENABLE_MQTT),
+)
+
+
+@functools.cache
+def _features_schema() -> vol.Schema:
+    """Config-flow feature toggles; every default is a constant, so build once on first use.
+
+    The back toggle is included here so _show_step can use the cached schema as is.
+    """
+    return vol.Schema(
+        {
+            **{vol.Optional(k, default=d): _BOOL_SELECTOR for k, d in (*_FEATURE_TOGGLES, *_UPLOAD_TOGGLES)},
+            vol.Optional("_go_back", default=False): bool,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _alerts_schema(u: _FormUnits) -> vol.Schema:
+    """Config-flow alerts step; defaults are DEFAULT_* in display units, so the schema depends only on ``u``."""
+    gust_max = round(VALID_WIND_GUST_MAX_MS * u.gust_to_display, 1)
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_THRESH_WIND_GUST_MS,
+                default=round(DEFAULT_THRESH_WIND_GUST_MS * u.gust_to_display, 1),
+            ): _threshold_selector(0, gust_max, 0.1, u.gust_u),
+            vol.Optional(
+                CONF_THRESH_RAIN_RATE_MMPH,
+                default=round(DEFAULT_THRESH_RAIN_RATE_MMPH * u.rain_to_display, 2),
+            ): _threshold_selector(0, 200, 0.5, u.rain_u),
+            vol.Optional(
+                CONF_THRESH_FREEZE_C,
+                default=round(u.temp_to_display(DEFAULT_THRESH_FREEZE_C), 1),
+            ): _threshold_selector(u.freeze_min, u.freeze_max, 0.5, u.temp_u),
+            vol.Optional(CONF_STALENESS_S, default=DEFAULT_STALENESS_S): _STALENESS_SELECTOR,
+            vol.Optional(CONF_RAIN_FILTER_ALPHA, default=DEFAULT_RAIN_FILTER_ALPHA): _RAIN_ALPHA_SELECTOR,
+            vol.Optional(CONF_PRESSURE_TREND_WINDOW_H, default=DEFAULT_PRESSURE_TREND_WINDOW_H): _TREND_WINDOW_SELECTOR,
+            vol.Optional("_go_back", default=False): bool,
+        }
+    )
+
+
+# ---------------------------------------------------------------------------
+# Options "init" form: fields whose default is simply the current value
+# (options, then data, then DEFAULT_*). Unit-dependent and location-derived
+# fields are added explicitly in WSStationOptionsFlowHandler._build_core_schema.
+# ---------------------------------------------------------------------------
+
+_CORE_FIELDS_GENERAL: tuple[tuple[str, Any, Any], ...] = (
+    (CONF_PREFIX, DEFAULT_PREFIX, str),
+    (CONF_HEMISPHERE, DEFAULT_HEMISPHERE, _HEMISPHERE_SELECTOR),
+    (CONF_CLIMATE_REGION, DEFAULT_CLIMATE_REGION, _CLIMATE_REGION_SELECTOR),
+    (CONF_ELEVATION_M, DEFAULT_ELEVATION_M, _ELEVATION_SELECTOR),
+    (
+        CONF_UNITS_MODE,
+        DEFAULT_UNITS_MODE,
+        selector.SelectSelector(
+            selector.SelectSelectorConfig(options=UNITS_MODE_OPTIONS, mode="dropdown", translation_key="units_mode")
+        ),
+    ),
+    (CONF_TEMP_UNIT, DEFAULT_TEMP_UNIT, _TEMP_UNIT_SELECTOR),
+    (CONF_WIND_UNIT, DEFAULT_WIND_UNIT, _WIND_UNIT_SELECTOR),
+    (CONF_PRESSURE_UNIT, DEFAULT_PRESSURE_UNIT, _PRESSURE_UNIT_SELECTOR),
+    (CONF_RAIN_UNIT, DEFAULT_RAIN_UNIT, _RAIN_UNIT_SELECTOR),
+    (CONF_DISTANCE_UNIT, DEFAULT_DISTANCE_UNIT, _DISTANCE_UNIT_SELECTOR),
+    (CONF_ALTITUDE_UNIT, DEFAULT_ALTITUDE_UNIT, _ALTITUDE_UNIT_SELECTOR),
+    (CONF_FORECAST_ENABLED, DEFAULT_FORECAST_ENABLED, _BOOL_SELECTOR),
+    (CONF_FORECAST_INTERVAL_MIN, DEFAULT_FORECAST_INTERVAL_MIN, _FORECAST_INTERVAL_SELECTOR),
+)
+
+_CORE_FIELDS_TUNING: tuple[tuple[str, Any, Any], ...] = (
+    (CONF_STALENESS_S, DEFAULT_STALENESS_S, _STALENESS_SELECTOR),
+    (CONF_RAIN_FILTER_ALPHA, DEFAULT_RAIN_FILTER_ALPHA, _RAIN_ALPHA_SELECTOR),
+    (CONF_PRESSURE_TREND_WINDOW_H, DEFAULT_PRESSURE_TREND_WINDOW_H, _TREND_WINDOW_SELECTOR),
+    (
+        CONF_CAL_TEMP_C,
+        DEFAULT_CAL_TEMP_C,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(min=-10, max=10, step=0.1, mode="box", unit_of_measurement="°C")
+        ),
+    ),
+    (
+        CONF_CAL_HUMIDITY,
+        DEFAULT_CAL_HUMIDITY,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(min=-20, max=20, step=0.5, mode="box", unit_of_measurement="%")
+        ),
+    ),
+    (
+        CONF_CAL_PRESSURE_HPA,
+        DEFAULT_CAL_PRESSURE_HPA,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(min=-10, max=10, step=0.1, mode="box", unit_of_measurement="hPa")
+        ),
+    ),
+    (
+        CONF_CAL_WIND_MS,
+        DEFAULT_CAL_WIND_MS,
+        selector.NumberSelector(
+            selector.NumberSelectorConfig(min=-5, max=5, step=0.1, mode="box", unit_of_measurement="m/s")
+        ),
+    ),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -551,9 +893,29 @@ _ENTITY_SELECTOR = selector.EntitySelector(selector.EntitySelectorConfig(domain=
 # ---------------------------------------------------------------------------
 
 
-def _validate_numeric_sensor(hass: HomeAssistant, eid: str, allow_unknown: bool = False) -> str | None:
+def _is_numeric_state(state: str) -> bool:
+    """Return True when ``float(state)`` would succeed.
+
+    Plain decimals ("21.4", "-3", "1013") are recognised with str methods;
+    only exotic spellings (exponents, whitespace, "nan") reach ``float``.
+    """
+    body = state[1:] if state[:1] in ("-", "+") else state
+    if body.isascii() and body.replace(".", "", 1).isdigit():
+        return True
+    try:
+        float(state)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def _validate_numeric_state(st: State | None, allow_unknown: bool = False) -> str | None:
     """Validate that a sensor entity exists and has a numeric state.
 
+    Takes the already looked-up ``State`` (or ``None`` when the entity is
+    missing) so callers validating several sources share one bound
+    ``hass.states.get``.
+
     Returns an error key string on failure, or ``None`` when acceptable.
     Device-class filtering has been removed (issue #41) - any numeric sensor
     is accepted regardless of its declared device_class.
@@ -567,16 +929,11 @@ def _validate_numeric_sensor(hass: HomeAssistant, eid: str, allow_unknown: bool
     still exist in HA, but "unknown"/"unavailable" states are accepted
     instead of being rejected as "entity_not_found" (issue #88).
     """
-    st = hass.states.get(eid)
     if st is None:
         return "entity_not_found"
     if st.state in ("unknown", "unavailable"):
         return None if allow_unknown else "entity_not_found"
-    try:
-        float(st.state)
-    except (ValueError, TypeError):
-        return "not_numeric"
-    return None
+    return None if _is_numeric_state(st.state) else "not_numeric"
 
 
 # Optional source keys whose sensors are normally idle/"unknown" outside of
@@ -585,6 +942,17 @@ def _validate_numeric_sensor(hass: HomeAssistant, eid: str, allow_unknown: bool
 _ALLOW_UNKNOWN_SOURCE_KEYS = {SRC_LIGHTNING_DISTANCE, SRC_LIGHTNING_AZIMUTH, SRC_LIGHTNING_COUNT}
 
 
+def _validate_sources(hass: HomeAssistant, picked: dict[str, str]) -> dict[str, str]:
+    """Validate a ``{source_key: entity_id}`` submission, returning per-field error keys."""
+    get_state = hass.states.get
+    errors: dict[str, str] = {}
+    for k, eid in picked.items():
+        err = _validate_numeric_state(get_state(eid), allow_unknown=k in _ALLOW_UNKNOWN_SOURCE_KEYS)
+        if err:
+            errors[k] = err
+    return errors
+
+
 # ---------------------------------------------------------------------------
 # Config Flow
 # ---------------------------------------------------------------------------
@@ -600,6 +968,13 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         self._data: dict[str, Any] = {}
         self._step_history: list[str] = []
+        self._guessed: dict[str, str] | None = None
+
+    def _guess(self) -> dict[str, str]:
+        """Sensor auto-detection, run once per flow and reused by both source steps and their re-renders."""
+        if self._guessed is None:
+            self._guessed = _guess_defaults(self.hass)
+        return self._guessed
 
     def _show_step(
         self,
@@ -613,8 +988,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Avoid duplicating the same step when re-rendering due to validation errors
         if not self._step_history or self._step_history[-1] != step_id:
             self._step_history.append(step_id)
-        # Add go-back toggle to every step except the first one
-        if step_id != "user" and len(self._step_history) > 1:
+        # Add go-back toggle to every step except the first one (cached
+        # schemas already carry it, so they are passed through unchanged)
+        if step_id != "user" and len(self._step_history) > 1 and "_go_back" not in data_schema.schema:
             try:
                 extended = {**data_schema.schema, vol.Optional("_go_back", default=False): bool}
                 data_schema = vol.Schema(extended)
@@ -640,16 +1016,6 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await handler()
         return None
 
-    def _validate_numeric_sensor(self, eid: str, source_key: str | None = None) -> str | None:
-        """Validate a source sensor (delegates to the shared module-level helper).
-
-        When ``source_key`` identifies a sensor that is normally idle/"unknown"
-        outside of an active event (lightning distance/azimuth/count), the
-        "unknown"/"unavailable" state is tolerated (issue #88).
-        """
-        allow_unknown = source_key in _ALLOW_UNKNOWN_SOURCE_KEYS
-        return _validate_numeric_sensor(self.hass, eid, allow_unknown=allow_unknown)
-
     # ------------------------------------------------------------------
     # Step 1: Name & prefix
     # ------------------------------------------------------------------
@@ -676,26 +1042,20 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # Step 2: Required sensor mapping
     # ------------------------------------------------------------------
     async def async_step_required_sources(self, user_input: dict[str, Any] | None = None):
-        defaults = _guess_defaults(self.hass)
         errors: dict[str, str] = {}
 
         if user_input is not None:
             back = await self._handle_back(user_input)
             if back:
                 return back
-            for k in REQUIRED_SOURCES:
-                eid = user_input.get(k)
-                if not eid:
-                    errors[k] = "required"
-                else:
-                    err = self._validate_numeric_sensor(eid, source_key=k)
-                    if err:
-                        errors[k] = err
+            errors = {k: "required" for k in REQUIRED_SOURCES if not user_input.get(k)}
+            errors.update(_validate_sources(self.hass, {k: user_input[k] for k in REQUIRED_SOURCES if k not in errors}))
             if not errors:
                 sources = {k: user_input[k] for k in REQUIRED_SOURCES}
                 self._data[CONF_SOURCES] = sources
                 return await self.async_step_optional_sources()
 
+        defaults = self._guess()
         fields = {vol.Required(k, default=defaults.get(k)): _ENTITY_SELECTOR for k in REQUIRED_SOURCES}
         return self._show_step(
             step_id="required_sources",
@@ -708,27 +1068,19 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # Step 3: Optional sensor mapping
     # ------------------------------------------------------------------
     async def async_step_optional_sources(self, user_input: dict[str, Any] | None = None):
-        defaults = _guess_defaults(self.hass)
         errors: dict[str, str] = {}
 
         if user_input is not None:
             back = await self._handle_back(user_input)
             if back:
                 return back
-            sources = dict(self._data.get(CONF_SOURCES, {}))
-            for k in OPTIONAL_SOURCES:
-                eid = user_input.get(k)
-                if not eid:
-                    continue
-                err = self._validate_numeric_sensor(eid, source_key=k)
-                if err:
-                    errors[k] = err
-                else:
-                    sources[k] = eid
+            picked = {k: user_input[k] for k in OPTIONAL_SOURCES if user_input.get(k)}
+            errors = _validate_sources(self.hass, picked)
             if not errors:
-                self._data[CONF_SOURCES] = sources
+                self._data[CONF_SOURCES] = {**self._data.get(CONF_SOURCES, {}), **picked}
                 return await self.async_step_location()
 
+        defaults = self._guess()
         # fmt: off
         fields = {
             (vol.Optional(k, default=defaults[k]) if k in defaults else vol.Optional(k)): _ENTITY_SELECTOR
@@ -770,29 +1122,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="location",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_HEMISPHERE, default=auto_hemi): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=HEMISPHERE_OPTIONS,
-                            mode="list",
-                            translation_key="hemisphere",
-                        )
-                    ),
-                    vol.Required(CONF_CLIMATE_REGION, default=auto_region): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=CLIMATE_REGION_OPTIONS,
-                            mode="dropdown",
-                            translation_key="climate_region",
-                        )
-                    ),
-                    vol.Optional(CONF_ELEVATION_M, default=auto_elev): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=VALID_ELEVATION_MIN_M,
-                            max=VALID_ELEVATION_MAX_M,
-                            step=1,
-                            mode="box",
-                            unit_of_measurement="m",
-                        )
-                    ),
+                    vol.Required(CONF_HEMISPHERE, default=auto_hemi): _HEMISPHERE_SELECTOR,
+                    vol.Required(CONF_CLIMATE_REGION, default=auto_region): _CLIMATE_REGION_SELECTOR,
+                    vol.Optional(CONF_ELEVATION_M, default=auto_elev): _ELEVATION_SELECTOR,
                 }
             ),
             errors=errors,
@@ -829,48 +1161,13 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="display",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_UNITS_MODE, default=default_units): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=["auto", "metric", "imperial"],
-                            mode="list",
-                            translation_key="units_mode",
-                        )
-                    ),
-                    vol.Required(CONF_TEMP_UNIT, default=default_temp): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                {"value": "auto", "label": "Auto"},
-                                {"value": "C", "label": "Celsius (°C)"},
-                                {"value": "F", "label": "Fahrenheit (°F)"},
-                            ],
-                            mode="list",
-                        )
-                    ),
-                    vol.Required(CONF_WIND_UNIT, default=DEFAULT_WIND_UNIT): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[{"value": o, "label": o} for o in WIND_UNIT_OPTIONS], mode="list"
-                        )
-                    ),
-                    vol.Required(CONF_PRESSURE_UNIT, default=DEFAULT_PRESSURE_UNIT): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[{"value": o, "label": o} for o in PRESSURE_UNIT_OPTIONS], mode="list"
-                        )
-                    ),
-                    vol.Required(CONF_RAIN_UNIT, default=DEFAULT_RAIN_UNIT): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[{"value": o, "label": o} for o in RAIN_UNIT_OPTIONS], mode="list"
-                        )
-                    ),
-                    vol.Required(CONF_DISTANCE_UNIT, default=DEFAULT_DISTANCE_UNIT): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[{"value": o, "label": o} for o in DISTANCE_UNIT_OPTIONS], mode="list"
-                        )
-                    ),
-                    vol.Required(CONF_ALTITUDE_UNIT, default=DEFAULT_ALTITUDE_UNIT): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[{"value": o, "label": o} for o in ALTITUDE_UNIT_OPTIONS], mode="list"
-                        )
-                    ),
+                    vol.Required(CONF_UNITS_MODE, default=default_units): _UNITS_MODE_LIST_SELECTOR,
+                    vol.Required(CONF_TEMP_UNIT, default=default_temp): _TEMP_UNIT_SELECTOR,
+                    vol.Required(CONF_WIND_UNIT, default=DEFAULT_WIND_UNIT): _WIND_UNIT_SELECTOR,
+                    vol.Required(CONF_PRESSURE_UNIT, default=DEFAULT_PRESSURE_UNIT): _PRESSURE_UNIT_SELECTOR,
+                    vol.Required(CONF_RAIN_UNIT, default=DEFAULT_RAIN_UNIT): _RAIN_UNIT_SELECTOR,
+                    vol.Required(CONF_DISTANCE_UNIT, default=DEFAULT_DISTANCE_UNIT): _DISTANCE_UNIT_SELECTOR,
+                    vol.Required(CONF_ALTITUDE_UNIT, default=DEFAULT_ALTITUDE_UNIT): _ALTITUDE_UNIT_SELECTOR,
                 }
             ),
             last_step=False,
@@ -898,33 +1195,15 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="forecast",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_FORECAST_ENABLED, default=DEFAULT_FORECAST_ENABLED): selector.BooleanSelector(),
+                    vol.Required(CONF_FORECAST_ENABLED, default=DEFAULT_FORECAST_ENABLED): _BOOL_SELECTOR,
                     vol.Optional(
                         CONF_FORECAST_INTERVAL_MIN, default=DEFAULT_FORECAST_INTERVAL_MIN
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=10, max=180, step=5, mode="box", unit_of_measurement="min")
-                    ),
-                    vol.Optional(CONF_FORECAST_LAT, default=round(default_lat, 4)): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=-90, max=90, step=0.001, mode="box")
-                    ),
-                    vol.Optional(CONF_FORECAST_LON, default=round(default_lon, 4)): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=-180, max=180, step=0.001, mode="box")
-                    ),
-                    vol.Optional(CONF_FORECAST_PROVIDER, default=DEFAULT_FORECAST_PROVIDER): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                FORECAST_PROVIDER_OPEN_METEO,
-                                FORECAST_PROVIDER_MET_NO,
-                                FORECAST_PROVIDER_NWS,
-                                FORECAST_PROVIDER_OWM,
-                                FORECAST_PROVIDER_PIRATE,
-                                FORECAST_PROVIDER_METEO_FRANCE,
-                                FORECAST_PROVIDER_HA_ENTITY,
-                            ],
-                            mode=selector.SelectSelectorMode.LIST,
-                            translation_key="forecast_provider",
-                        )
-                    ),
+                    ): _FORECAST_INTERVAL_SELECTOR,
+                    vol.Optional(CONF_FORECAST_LAT, default=round(default_lat, 4)): _LAT_SELECTOR,
+                    vol.Optional(CONF_FORECAST_LON, default=round(default_lon, 4)): _LON_SELECTOR,
+                    vol.Optional(
+                        CONF_FORECAST_PROVIDER, default=DEFAULT_FORECAST_PROVIDER
+                    ): _FORECAST_PROVIDER_SELECTOR,
                 }
             ),
             last_step=False,
@@ -949,8 +1228,8 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_FORECAST_ENTITY,
                         default=self._data.get(CONF_FORECAST_ENTITY, ""),
-                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="weather")),
-                    vol.Optional("_go_back", default=False): selector.BooleanSelector(),
+                    ): _WEATHER_ENTITY_SELECTOR,
+                    vol.Optional("_go_back", default=False): _BOOL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -989,8 +1268,8 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_FORECAST_API_KEY,
                         default=self._data.get(CONF_FORECAST_API_KEY, ""),
-                    ): selector.TextSelector(selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD)),
-                    vol.Optional("_go_back", default=False): selector.BooleanSelector(),
+                    ): _PASSWORD_SELECTOR,
+                    vol.Optional("_go_back", default=False): _BOOL_SELECTOR,
                 }
             ),
             description_placeholders={"provider_name": provider_name, "api_url": api_url},
@@ -1078,70 +1357,7 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_mqtt_config()
             return await self.async_step_alerts()
 
-        return self._show_step(
-            step_id="features",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_ENABLE_DISPLAY_SENSORS, default=DEFAULT_ENABLE_DISPLAY_SENSORS
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_FIRE_RISK, default=DEFAULT_ENABLE_FIRE_RISK): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_FOG, default=DEFAULT_ENABLE_FOG): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_THUNDERSTORM, default=DEFAULT_ENABLE_THUNDERSTORM
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_SEA_TEMP, default=DEFAULT_ENABLE_SEA_TEMP): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_WUNDERGROUND, default=DEFAULT_ENABLE_WUNDERGROUND
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_AIR_QUALITY, default=DEFAULT_ENABLE_AIR_QUALITY
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_POLLEN, default=DEFAULT_ENABLE_POLLEN): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_MOON, default=DEFAULT_ENABLE_MOON): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_SOLAR_FORECAST, default=DEFAULT_ENABLE_SOLAR_FORECAST
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_COMFORT_INDICES, default=DEFAULT_ENABLE_COMFORT_INDICES
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_VIGILANCE_METEO, default=DEFAULT_ENABLE_VIGILANCE_METEO
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_VIGICRUES, default=DEFAULT_ENABLE_VIGICRUES): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_DIAGNOSTICS, default=DEFAULT_ENABLE_DIAGNOSTICS
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_FWI_COMPONENTS, default=DEFAULT_ENABLE_FWI_COMPONENTS
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_ADVANCED_SENSORS, default=DEFAULT_ENABLE_ADVANCED_SENSORS
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_NOWCAST, default=DEFAULT_ENABLE_NOWCAST): selector.BooleanSelector(),
-                    # v2.0 feature toggles
-                    vol.Optional(
-                        CONF_ENABLE_DEGREE_DAYS, default=DEFAULT_ENABLE_DEGREE_DAYS
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_LIGHTNING, default=DEFAULT_ENABLE_LIGHTNING): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_INDOOR, default=DEFAULT_ENABLE_INDOOR): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_SOIL, default=DEFAULT_ENABLE_SOIL): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_WEATHERCLOUD, default=DEFAULT_ENABLE_WEATHERCLOUD
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_PWSWEATHER, default=DEFAULT_ENABLE_PWSWEATHER): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_WOW, default=DEFAULT_ENABLE_WOW): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_AWEKAS, default=DEFAULT_ENABLE_AWEKAS): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_OWM_STATIONS, default=DEFAULT_ENABLE_OWM_STATIONS
-                    ): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_WINDY, default=DEFAULT_ENABLE_WINDY): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_CWOP, default=DEFAULT_ENABLE_CWOP): selector.BooleanSelector(),
-                    vol.Optional(CONF_ENABLE_MQTT, default=DEFAULT_ENABLE_MQTT): selector.BooleanSelector(),
-                }
-            ),
-            last_step=False,
-        )
+        return self._show_step(step_id="features", data_schema=_features_schema(), last_step=False)
 
     # ------------------------------------------------------------------
     # Step 7b: Sea temperature location (only shown if sea temp enabled)
@@ -1174,12 +1390,8 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="sea_temp",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_SEA_TEMP_LAT, default=round(default_lat, 4)): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=-90, max=90, step=0.001, mode="box")
-                    ),
-                    vol.Optional(CONF_SEA_TEMP_LON, default=round(default_lon, 4)): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=-180, max=180, step=0.001, mode="box")
-                    ),
+                    vol.Optional(CONF_SEA_TEMP_LAT, default=round(default_lat, 4)): _LAT_SELECTOR,
+                    vol.Optional(CONF_SEA_TEMP_LON, default=round(default_lon, 4)): _LON_SELECTOR,
                 }
             ),
             last_step=False,
@@ -1212,7 +1424,7 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self._data[CONF_WU_API_KEY] = ""
             else:
                 # Validate credentials
-                valid, err = await _validate_wu_credentials(station_id, api_key)
+                valid, err = await _validate_wu_credentials(self.hass, station_id, api_key)
                 if not valid:
                     errors[CONF_WU_API_KEY] = err or "invalid_api_key"
                 else:
@@ -1239,15 +1451,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="wunderground",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WU_STATION_ID, default=existing_station): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_WU_API_KEY, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
-                    vol.Optional(CONF_WU_INTERVAL_MIN, default=DEFAULT_WU_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=30, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_WU_STATION_ID, default=existing_station): _TEXT_SELECTOR,
+                    vol.Optional(CONF_WU_API_KEY, default=""): _PASSWORD_SELECTOR,
+                    vol.Optional(CONF_WU_INTERVAL_MIN, default=DEFAULT_WU_INTERVAL_MIN): _WU_INTERVAL_SELECTOR,
                 }
             ),
             errors=errors,
@@ -1280,9 +1486,7 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="air_quality",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_AQI_INTERVAL_MIN, default=DEFAULT_AQI_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=15, max=360, step=15, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_AQI_INTERVAL_MIN, default=DEFAULT_AQI_INTERVAL_MIN): _AQI_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -1341,26 +1545,12 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="solar_forecast",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_SOLAR_PEAK_KW, default=DEFAULT_SOLAR_PEAK_KW): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0.1,
-                            max=100.0,
-                            step=0.1,
-                            mode="box",
-                            unit_of_measurement="kWp",
-                        )
-                    ),
+                    vol.Optional(CONF_SOLAR_PEAK_KW, default=DEFAULT_SOLAR_PEAK_KW): _SOLAR_PEAK_SELECTOR,
                     vol.Optional(
                         CONF_SOLAR_PANEL_AZIMUTH, default=DEFAULT_SOLAR_PANEL_AZIMUTH
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0, max=359, step=1, mode="box", unit_of_measurement="°")
-                    ),
-                    vol.Optional(CONF_SOLAR_PANEL_TILT, default=DEFAULT_SOLAR_PANEL_TILT): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0, max=90, step=1, mode="box", unit_of_measurement="°")
-                    ),
-                    vol.Optional(CONF_SOLAR_INTERVAL_MIN, default=DEFAULT_SOLAR_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=30, max=360, step=30, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _SOLAR_AZIMUTH_SELECTOR,
+                    vol.Optional(CONF_SOLAR_PANEL_TILT, default=DEFAULT_SOLAR_PANEL_TILT): _SOLAR_TILT_SELECTOR,
+                    vol.Optional(CONF_SOLAR_INTERVAL_MIN, default=DEFAULT_SOLAR_INTERVAL_MIN): _SOLAR_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1437,9 +1627,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _room_form_schema(self, src: dict | None) -> vol.Schema:
         src = src or {}
-        sensor_sel = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
+        sensor_sel = _ENTITY_SELECTOR
         schema: dict[Any, Any] = {
-            vol.Required("name", default=src.get("name", "")): selector.TextSelector(),
+            vol.Required("name", default=src.get("name", "")): _TEXT_SELECTOR,
         }
         for field in ("temp", "humidity", "co2"):
             cur = src.get(field)
@@ -1585,15 +1775,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="weathercloud",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WC_STATION_ID, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_WC_API_KEY, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
-                    vol.Optional(CONF_WC_INTERVAL_MIN, default=DEFAULT_WC_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_WC_STATION_ID, default=""): _TEXT_SELECTOR,
+                    vol.Optional(CONF_WC_API_KEY, default=""): _PASSWORD_SELECTOR,
+                    vol.Optional(CONF_WC_INTERVAL_MIN, default=DEFAULT_WC_INTERVAL_MIN): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1636,15 +1820,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="pwsweather",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_PWS_STATION_ID, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_PWS_API_KEY, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
-                    vol.Optional(CONF_PWS_INTERVAL_MIN, default=DEFAULT_PWS_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_PWS_STATION_ID, default=""): _TEXT_SELECTOR,
+                    vol.Optional(CONF_PWS_API_KEY, default=""): _PASSWORD_SELECTOR,
+                    vol.Optional(CONF_PWS_INTERVAL_MIN, default=DEFAULT_PWS_INTERVAL_MIN): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1685,15 +1863,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="wow",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WOW_SITE_ID, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_WOW_AUTH_KEY, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
-                    vol.Optional(CONF_WOW_INTERVAL_MIN, default=DEFAULT_WOW_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_WOW_SITE_ID, default=""): _TEXT_SELECTOR,
+                    vol.Optional(CONF_WOW_AUTH_KEY, default=""): _PASSWORD_SELECTOR,
+                    vol.Optional(CONF_WOW_INTERVAL_MIN, default=DEFAULT_WOW_INTERVAL_MIN): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1734,17 +1906,11 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="awekas",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_AWEKAS_USERNAME, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_AWEKAS_PASSWORD, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
+                    vol.Optional(CONF_AWEKAS_USERNAME, default=""): _TEXT_SELECTOR,
+                    vol.Optional(CONF_AWEKAS_PASSWORD, default=""): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_AWEKAS_INTERVAL_MIN, default=DEFAULT_AWEKAS_INTERVAL_MIN
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={"info": "AWEKAS username and password from awekas.at. Leave blank to skip."},
@@ -1781,17 +1947,11 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="owm_stations",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_OWM_STATIONS_API_KEY, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
-                    vol.Optional(CONF_OWM_STATIONS_STATION_ID, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
+                    vol.Optional(CONF_OWM_STATIONS_API_KEY, default=""): _PASSWORD_SELECTOR,
+                    vol.Optional(CONF_OWM_STATIONS_STATION_ID, default=""): _TEXT_SELECTOR,
                     vol.Optional(
                         CONF_OWM_STATIONS_INTERVAL_MIN, default=DEFAULT_OWM_STATIONS_INTERVAL_MIN
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1830,15 +1990,11 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="windy",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WINDY_API_KEY, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
-                    vol.Optional(CONF_WINDY_STATION_ID, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_WINDY_INTERVAL_MIN, default=DEFAULT_WINDY_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_WINDY_API_KEY, default=""): _PASSWORD_SELECTOR,
+                    vol.Optional(CONF_WINDY_STATION_ID, default=""): _TEXT_SELECTOR,
+                    vol.Optional(
+                        CONF_WINDY_INTERVAL_MIN, default=DEFAULT_WINDY_INTERVAL_MIN
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1877,15 +2033,11 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="cwop",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_CWOP_CALLSIGN, default=""): selector.TextSelector(),
-                    vol.Optional(CONF_CWOP_PASSCODE, default="-1"): selector.TextSelector(),
-                    vol.Optional(CONF_CWOP_SERVER, default=DEFAULT_CWOP_SERVER): selector.TextSelector(),
-                    vol.Optional(CONF_CWOP_PORT, default=DEFAULT_CWOP_PORT): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=65535, step=1, mode="box")
-                    ),
-                    vol.Optional(CONF_CWOP_INTERVAL_MIN, default=DEFAULT_CWOP_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=5, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_CWOP_CALLSIGN, default=""): _TEXT_SELECTOR,
+                    vol.Optional(CONF_CWOP_PASSCODE, default="-1"): _TEXT_SELECTOR,
+                    vol.Optional(CONF_CWOP_SERVER, default=DEFAULT_CWOP_SERVER): _TEXT_SELECTOR,
+                    vol.Optional(CONF_CWOP_PORT, default=DEFAULT_CWOP_PORT): _CWOP_PORT_SELECTOR,
+                    vol.Optional(CONF_CWOP_INTERVAL_MIN, default=DEFAULT_CWOP_INTERVAL_MIN): _CWOP_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1922,15 +2074,9 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="mqtt_config",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(
-                        CONF_MQTT_DISCOVERY_PREFIX, default=DEFAULT_MQTT_DISCOVERY_PREFIX
-                    ): selector.TextSelector(selector.TextSelectorConfig(type="text")),
-                    vol.Optional(CONF_MQTT_STATE_PREFIX, default=DEFAULT_MQTT_STATE_PREFIX): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_MQTT_INTERVAL_MIN, default=DEFAULT_MQTT_INTERVAL_MIN): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    vol.Optional(CONF_MQTT_DISCOVERY_PREFIX, default=DEFAULT_MQTT_DISCOVERY_PREFIX): _TEXT_SELECTOR,
+                    vol.Optional(CONF_MQTT_STATE_PREFIX, default=DEFAULT_MQTT_STATE_PREFIX): _TEXT_SELECTOR,
+                    vol.Optional(CONF_MQTT_INTERVAL_MIN, default=DEFAULT_MQTT_INTERVAL_MIN): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={
@@ -1947,96 +2093,45 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # ------------------------------------------------------------------
     async def async_step_alerts(self, user_input: dict[str, Any] | None = None):
         units_mode = str(self._data.get(CONF_UNITS_MODE, DEFAULT_UNITS_MODE))
-        imperial = _is_imperial(units_mode, self.hass)
-        wind_unit_conf = str(self._data.get(CONF_WIND_UNIT, DEFAULT_WIND_UNIT))
-        rain_unit_conf = str(self._data.get(CONF_RAIN_UNIT, DEFAULT_RAIN_UNIT))
-        temp_unit_conf = str(self._data.get(CONF_TEMP_UNIT, DEFAULT_TEMP_UNIT))
-        gust_u = wind_unit_conf if wind_unit_conf != "auto" else ("mph" if imperial else "m/s")
-        rain_meas = rain_unit_conf if rain_unit_conf != "auto" else ("in" if imperial else "mm")
-        rain_u = "in/h" if rain_meas == "in" else "mm/h"
-        temp_u = ("°F" if temp_unit_conf == "F" else "°C") if temp_unit_conf != "auto" else ("°F" if imperial else "°C")
+        u = _FormUnits.resolve(
+            _is_imperial(units_mode, self.hass),
+            str(self._data.get(CONF_WIND_UNIT, DEFAULT_WIND_UNIT)),
+            str(self._data.get(CONF_RAIN_UNIT, DEFAULT_RAIN_UNIT)),
+            str(self._data.get(CONF_TEMP_UNIT, DEFAULT_TEMP_UNIT)),
+        )
 
         if user_input is not None:
             back = await self._handle_back(user_input)
             if back:
                 return back
-            errors = self._validate_alert_inputs(user_input, gust_u, temp_u)
+            # NumberSelector already delivers numbers and the schema fills every
+            # default, so convert each threshold once and reuse it for both
+            # validation and storage. Only the whole-number fields need int().
+            gust_ms = user_input[CONF_THRESH_WIND_GUST_MS] * u.gust_to_ms
+            freeze_c = u.temp_to_c(user_input[CONF_THRESH_FREEZE_C])
+            errors = self._validate_alert_inputs(gust_ms, freeze_c)
             if not errors:
-                self._data[CONF_THRESH_WIND_GUST_MS] = _convert_gust_to_ms(
-                    float(user_input[CONF_THRESH_WIND_GUST_MS]), gust_u
-                )
-                self._data[CONF_THRESH_RAIN_RATE_MMPH] = _convert_rain_to_mmph(
-                    float(user_input[CONF_THRESH_RAIN_RATE_MMPH]), rain_meas
-                )
-                self._data[CONF_THRESH_FREEZE_C] = _convert_temp_to_c(
-                    float(user_input[CONF_THRESH_FREEZE_C]), temp_u == "°F"
-                )
-                self._data[CONF_RAIN_FILTER_ALPHA] = float(user_input[CONF_RAIN_FILTER_ALPHA])
+                self._data[CONF_THRESH_WIND_GUST_MS] = gust_ms
+                self._data[CONF_THRESH_RAIN_RATE_MMPH] = user_input[CONF_THRESH_RAIN_RATE_MMPH] * u.rain_to_mmph
+                self._data[CONF_THRESH_FREEZE_C] = freeze_c
+                self._data[CONF_RAIN_FILTER_ALPHA] = user_input[CONF_RAIN_FILTER_ALPHA]
                 self._data[CONF_PRESSURE_TREND_WINDOW_H] = int(user_input[CONF_PRESSURE_TREND_WINDOW_H])
                 self._data[CONF_STALENESS_S] = int(user_input[CONF_STALENESS_S])
 
                 title = self._data.get(CONF_NAME, DEFAULT_NAME)
                 return self.async_create_entry(title=title, data=self._data)
 
-        gust_max = round(_convert_gust_to_display(VALID_WIND_GUST_MAX_MS, gust_u), 1)
-
         return self._show_step(
             step_id="alerts",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_THRESH_WIND_GUST_MS,
-                        default=round(_convert_gust_to_display(DEFAULT_THRESH_WIND_GUST_MS, gust_u), 1),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0,
-                            max=gust_max,
-                            step=0.1,
-                            mode="box",
-                            unit_of_measurement=gust_u,
-                        )
-                    ),
-                    vol.Optional(
-                        CONF_THRESH_RAIN_RATE_MMPH,
-                        default=round(_convert_rain_to_display(DEFAULT_THRESH_RAIN_RATE_MMPH, rain_meas), 2),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0, max=200, step=0.5, mode="box", unit_of_measurement=rain_u)
-                    ),
-                    vol.Optional(
-                        CONF_THRESH_FREEZE_C,
-                        default=round(_convert_temp_to_display(DEFAULT_THRESH_FREEZE_C, temp_u == "°F"), 1),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=round(_convert_temp_to_display(-30.0, temp_u == "°F"), 1),
-                            max=round(_convert_temp_to_display(10.0, temp_u == "°F"), 1),
-                            step=0.5,
-                            mode="box",
-                            unit_of_measurement=temp_u,
-                        )
-                    ),
-                    vol.Optional(CONF_STALENESS_S, default=DEFAULT_STALENESS_S): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=60, max=86400, step=60, mode="box", unit_of_measurement="s")
-                    ),
-                    vol.Optional(CONF_RAIN_FILTER_ALPHA, default=DEFAULT_RAIN_FILTER_ALPHA): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0.05, max=1.0, step=0.05, mode="slider")
-                    ),
-                    vol.Optional(
-                        CONF_PRESSURE_TREND_WINDOW_H, default=DEFAULT_PRESSURE_TREND_WINDOW_H
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=12, step=1, mode="box", unit_of_measurement="h")
-                    ),
-                }
-            ),
+            data_schema=_alerts_schema(u),
             last_step=True,
         )
 
     @staticmethod
-    def _validate_alert_inputs(user_input: dict, gust_u: str, temp_u: str) -> dict[str, str]:
+    def _validate_alert_inputs(gust_ms: float, freeze_c: float) -> dict[str, str]:
         errors: dict[str, str] = {}
-        gust_ms = _convert_gust_to_ms(float(user_input.get(CONF_THRESH_WIND_GUST_MS, 0)), gust_u)
         if gust_ms > VALID_WIND_GUST_MAX_MS:
             errors[CONF_THRESH_WIND_GUST_MS] = "wind_gust_too_high"
-        freeze_c = _convert_temp_to_c(float(user_input.get(CONF_THRESH_FREEZE_C, 0)), temp_u == "°F")
         if not (VALID_TEMP_MIN_C <= freeze_c <= VALID_TEMP_MAX_C):
             errors[CONF_THRESH_FREEZE_C] = "temp_out_of_range"
         return errors
@@ -2050,22 +2145,28 @@ class WSStationConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
     """Multi-step options flow - mirrors the config flow so every setting is accessible post-install."""
 
+    # Entry data overlaid with options, merged on first lookup: every form
+    # render reads dozens of current values and the entry does not change
+    # while the flow is open.
+    _current: dict[str, Any] | None = None
+
     def _get(self, key: str, default: Any) -> Any:
-        return self.config_entry.options.get(key, self.config_entry.data.get(key, default))
+        current = self._current
+        if current is None:
+            current = self._current = {**self.config_entry.data, **self.config_entry.options}
+        return current.get(key, default)
 
     # ------------------------------------------------------------------
     # Step 1: Core - identity, location, units, forecast, calibration, alerts
     # ------------------------------------------------------------------
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         units_mode = str(self._get(CONF_UNITS_MODE, DEFAULT_UNITS_MODE))
-        imperial = _is_imperial(units_mode, self.hass)
-        wind_unit_conf = str(self._get(CONF_WIND_UNIT, DEFAULT_WIND_UNIT))
-        rain_unit_conf = str(self._get(CONF_RAIN_UNIT, DEFAULT_RAIN_UNIT))
-        temp_unit_conf = str(self._get(CONF_TEMP_UNIT, DEFAULT_TEMP_UNIT))
-        gust_u = wind_unit_conf if wind_unit_conf != "auto" else ("mph" if imperial else "m/s")
-        rain_meas = rain_unit_conf if rain_unit_conf != "auto" else ("in" if imperial else "mm")
-        rain_u = "in/h" if rain_meas == "in" else "mm/h"
-        temp_u = ("°F" if temp_unit_conf == "F" else "°C") if temp_unit_conf != "auto" else ("°F" if imperial else "°C")
+        u = _FormUnits.resolve(
+            _is_imperial(units_mode, self.hass),
+            str(self._get(CONF_WIND_UNIT, DEFAULT_WIND_UNIT)),
+            str(self._get(CONF_RAIN_UNIT, DEFAULT_RAIN_UNIT)),
+            str(self._get(CONF_TEMP_UNIT, DEFAULT_TEMP_UNIT)),
+        )
 
         if user_input is not None:
             out = dict(user_input)
@@ -2076,27 +2177,25 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
                 if not (VALID_ELEVATION_MIN_M <= elev <= VALID_ELEVATION_MAX_M):
                     return self.async_show_form(
                         step_id="init",
-                        data_schema=self._build_core_schema(imperial, gust_u, rain_u, temp_u, rain_meas),
+                        data_schema=self._build_core_schema(u),
                         errors={CONF_ELEVATION_M: "elevation_out_of_range"},
                         last_step=False,
                     )
             except (TypeError, ValueError):
                 pass
             # Convert thresholds to canonical metric
-            out[CONF_THRESH_WIND_GUST_MS] = _convert_gust_to_ms(
-                float(out.get(CONF_THRESH_WIND_GUST_MS, DEFAULT_THRESH_WIND_GUST_MS)), gust_u
-            )
-            out[CONF_THRESH_RAIN_RATE_MMPH] = _convert_rain_to_mmph(
-                float(out.get(CONF_THRESH_RAIN_RATE_MMPH, DEFAULT_THRESH_RAIN_RATE_MMPH)), rain_meas
+            out[CONF_THRESH_WIND_GUST_MS] = (
+                float(out.get(CONF_THRESH_WIND_GUST_MS, DEFAULT_THRESH_WIND_GUST_MS)) * u.gust_to_ms
             )
-            out[CONF_THRESH_FREEZE_C] = _convert_temp_to_c(
-                float(out.get(CONF_THRESH_FREEZE_C, DEFAULT_THRESH_FREEZE_C)), temp_u == "°F"
+            out[CONF_THRESH_RAIN_RATE_MMPH] = (
+                float(out.get(CONF_THRESH_RAIN_RATE_MMPH, DEFAULT_THRESH_RAIN_RATE_MMPH)) * u.rain_to_mmph
             )
-            out[CONF_RAIN_PENALTY_LIGHT_MMPH] = _convert_rain_to_mmph(
-                float(out.get(CONF_RAIN_PENALTY_LIGHT_MMPH, DEFAULT_RAIN_PENALTY_LIGHT_MMPH)), rain_meas
+            out[CONF_THRESH_FREEZE_C] = u.temp_to_c(float(out.get(CONF_THRESH_FREEZE_C, DEFAULT_THRESH_FREEZE_C)))
+            out[CONF_RAIN_PENALTY_LIGHT_MMPH] = (
+                float(out.get(CONF_RAIN_PENALTY_LIGHT_MMPH, DEFAULT_RAIN_PENALTY_LIGHT_MMPH)) * u.rain_to_mmph
             )
-            out[CONF_RAIN_PENALTY_HEAVY_MMPH] = _convert_rain_to_mmph(
-                float(out.get(CONF_RAIN_PENALTY_HEAVY_MMPH, DEFAULT_RAIN_PENALTY_HEAVY_MMPH)), rain_meas
+            out[CONF_RAIN_PENALTY_HEAVY_MMPH] = (
+                float(out.get(CONF_RAIN_PENALTY_HEAVY_MMPH, DEFAULT_RAIN_PENALTY_HEAVY_MMPH)) * u.rain_to_mmph
             )
             # Merge into options - source mapping step comes next.
             self._opt: dict[str, Any] = out
@@ -2104,36 +2203,38 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=self._build_core_schema(imperial, gust_u, rain_u, temp_u, rain_meas),
+            data_schema=self._build_core_schema(u),
             last_step=False,
         )
 
+    # Sensor auto-detection result, computed on the first source-form render
+    # and reused by re-renders after validation errors and by the next step.
+    _guessed: dict[str, str] | None = None
+
     def _current_sources_for_options(self) -> dict[str, str]:
-        defaults = _guess_defaults(self.hass)
-        current = dict(self.config_entry.data.get(CONF_SOURCES, {}))
-        current.update(self.config_entry.options.get(CONF_SOURCES, {}) or {})
+        if self._guessed is None:
+            self._guessed = _guess_defaults(self.hass)
+        defaults = self._guessed
+        current = {
+            **self.config_entry.data.get(CONF_SOURCES, {}),
+            **(self.config_entry.options.get(CONF_SOURCES, {}) or {}),
+        }
         return {**defaults, **{k: v for k, v in current.items() if v}}
 
     async def async_step_required_sources_opt(self, user_input: dict[str, Any] | None = None):
-        defaults = self._current_sources_for_options()
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            sources = dict(self._get(CONF_SOURCES, {}))
-            for k in REQUIRED_SOURCES:
-                eid = user_input.get(k)
-                if not eid:
-                    errors[k] = "required"
-                else:
-                    err = _validate_numeric_sensor(self.hass, eid, allow_unknown=k in _ALLOW_UNKNOWN_SOURCE_KEYS)
-                    if err:
-                        errors[k] = err
-                    else:
-                        sources[k] = eid
+            errors = {k: "required" for k in REQUIRED_SOURCES if not user_input.get(k)}
+            errors.update(_validate_sources(self.hass, {k: user_input[k] for k in REQUIRED_SOURCES if k not in errors}))
             if not errors:
-                self._opt[CONF_SOURCES] = sources
+                self._opt[CONF_SOURCES] = {
+                    **self._get(CONF_SOURCES, {}),
+                    **{k: user_input[k] for k in REQUIRED_SOURCES},
+                }
                 return await self.async_step_optional_sources_opt()
 
+        defaults = self._current_sources_for_options()
         fields = {vol.Required(k, default=defaults.get(k)): _ENTITY_SELECTOR for k in REQUIRED_SOURCES}
         return self.async_show_form(
             step_id="required_sources_opt",
@@ -2143,27 +2244,24 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
         )
 
     async def async_step_optional_sources_opt(self, user_input: dict[str, Any] | None = None):
-        defaults = self._current_sources_for_options()
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            sources = dict(self._opt.get(CONF_SOURCES) or self._get(CONF_SOURCES, {}))
-            for k in OPTIONAL_SOURCES:
-                sources.pop(k, None)
-                eid = user_input.get(k)
-                if not eid:
-                    continue
-                err = _validate_numeric_sensor(self.hass, eid, allow_unknown=k in _ALLOW_UNKNOWN_SOURCE_KEYS)
-                if err:
-                    errors[k] = err
-                else:
-                    sources[k] = eid
+            picked = {k: user_input[k] for k in OPTIONAL_SOURCES if user_input.get(k)}
+            errors = _validate_sources(self.hass, picked)
             if not errors:
-                self._opt[CONF_SOURCES] = sources
+                # Cleared optional fields drop out: keep only the required
+                # mappings from the previous step, then merge this step's picks.
+                base = self._opt.get(CONF_SOURCES) or self._get(CONF_SOURCES, {})
+                self._opt[CONF_SOURCES] = {
+                    **{k: v for k, v in base.items() if k not in OPTIONAL_SOURCES_SET},
+                    **picked,
+                }
                 if self._opt.get(CONF_FORECAST_PROVIDER) in PROVIDERS_REQUIRING_API_KEY:
                     return await self.async_step_forecast_api_key_opt()
                 return await self.async_step_features_opt()
 
+        defaults = self._current_sources_for_options()
         fields = {
             (vol.Optional(k, default=defaults[k]) if k in defaults else vol.Optional(k)): _ENTITY_SELECTOR
             for k in OPTIONAL_SOURCES
@@ -2175,116 +2273,22 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             last_step=False,
         )
 
-    def _build_core_schema(
-        self, imperial: bool, gust_u: str, rain_u: str, temp_u: str, rain_meas: str = "mm"
-    ) -> vol.Schema:
+    def _build_core_schema(self, u: _FormUnits) -> vol.Schema:
         g = self._get
         default_lat = getattr(self.hass.config, "latitude", 0.0) or 0.0
         default_lon = getattr(self.hass.config, "longitude", 0.0) or 0.0
-        cur_gust_ms = float(g(CONF_THRESH_WIND_GUST_MS, DEFAULT_THRESH_WIND_GUST_MS))
-        cur_rain_mmph = float(g(CONF_THRESH_RAIN_RATE_MMPH, DEFAULT_THRESH_RAIN_RATE_MMPH))
-        cur_freeze_c = float(g(CONF_THRESH_FREEZE_C, DEFAULT_THRESH_FREEZE_C))
-        return vol.Schema(
+        # Current thresholds in display units, converted and rounded up front.
+        def_gust = round(float(g(CONF_THRESH_WIND_GUST_MS, DEFAULT_THRESH_WIND_GUST_MS)) * u.gust_to_display, 1)
+        def_rain = round(float(g(CONF_THRESH_RAIN_RATE_MMPH, DEFAULT_THRESH_RAIN_RATE_MMPH)) * u.rain_to_display, 2)
+        def_freeze = round(u.temp_to_display(float(g(CONF_THRESH_FREEZE_C, DEFAULT_THRESH_FREEZE_C))), 1)
+        schema: dict[Any, Any] = {vol.Optional(k, default=g(k, d)): sel for k, d, sel in _CORE_FIELDS_GENERAL}
+        schema.update(
             {
-                vol.Optional(CONF_PREFIX, default=g(CONF_PREFIX, DEFAULT_PREFIX)): str,
-                vol.Optional(CONF_HEMISPHERE, default=g(CONF_HEMISPHERE, DEFAULT_HEMISPHERE)): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=HEMISPHERE_OPTIONS, mode="list", translation_key="hemisphere")
-                ),
-                vol.Optional(
-                    CONF_CLIMATE_REGION, default=g(CONF_CLIMATE_REGION, DEFAULT_CLIMATE_REGION)
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=CLIMATE_REGION_OPTIONS, mode="dropdown", translation_key="climate_region"
-                    )
-                ),
-                vol.Optional(
-                    CONF_ELEVATION_M, default=g(CONF_ELEVATION_M, DEFAULT_ELEVATION_M)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=VALID_ELEVATION_MIN_M,
-                        max=VALID_ELEVATION_MAX_M,
-                        step=1,
-                        mode="box",
-                        unit_of_measurement="m",
-                    )
-                ),
-                vol.Optional(CONF_UNITS_MODE, default=g(CONF_UNITS_MODE, DEFAULT_UNITS_MODE)): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=UNITS_MODE_OPTIONS, mode="dropdown", translation_key="units_mode"
-                    )
-                ),
-                vol.Optional(CONF_TEMP_UNIT, default=g(CONF_TEMP_UNIT, DEFAULT_TEMP_UNIT)): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "auto", "label": "Auto"},
-                            {"value": "C", "label": "Celsius (°C)"},
-                            {"value": "F", "label": "Fahrenheit (°F)"},
-                        ],
-                        mode="list",
-                    )
-                ),
-                vol.Optional(CONF_WIND_UNIT, default=g(CONF_WIND_UNIT, DEFAULT_WIND_UNIT)): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[{"value": o, "label": o} for o in WIND_UNIT_OPTIONS], mode="list"
-                    )
-                ),
-                vol.Optional(
-                    CONF_PRESSURE_UNIT, default=g(CONF_PRESSURE_UNIT, DEFAULT_PRESSURE_UNIT)
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[{"value": o, "label": o} for o in PRESSURE_UNIT_OPTIONS], mode="list"
-                    )
-                ),
-                vol.Optional(CONF_RAIN_UNIT, default=g(CONF_RAIN_UNIT, DEFAULT_RAIN_UNIT)): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[{"value": o, "label": o} for o in RAIN_UNIT_OPTIONS], mode="list"
-                    )
-                ),
-                vol.Optional(
-                    CONF_DISTANCE_UNIT, default=g(CONF_DISTANCE_UNIT, DEFAULT_DISTANCE_UNIT)
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[{"value": o, "label": o} for o in DISTANCE_UNIT_OPTIONS], mode="list"
-                    )
-                ),
-                vol.Optional(
-                    CONF_ALTITUDE_UNIT, default=g(CONF_ALTITUDE_UNIT, DEFAULT_ALTITUDE_UNIT)
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[{"value": o, "label": o} for o in ALTITUDE_UNIT_OPTIONS], mode="list"
-                    )
-                ),
-                vol.Optional(
-                    CONF_FORECAST_ENABLED, default=g(CONF_FORECAST_ENABLED, DEFAULT_FORECAST_ENABLED)
-                ): selector.BooleanSelector(),
-                vol.Optional(
-                    CONF_FORECAST_INTERVAL_MIN, default=g(CONF_FORECAST_INTERVAL_MIN, DEFAULT_FORECAST_INTERVAL_MIN)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=10, max=180, step=5, mode="box", unit_of_measurement="min")
-                ),
-                vol.Optional(
-                    CONF_FORECAST_LAT, default=g(CONF_FORECAST_LAT, round(default_lat, 4))
-                ): selector.NumberSelector(selector.NumberSelectorConfig(min=-90, max=90, step=0.001, mode="box")),
-                vol.Optional(
-                    CONF_FORECAST_LON, default=g(CONF_FORECAST_LON, round(default_lon, 4))
-                ): selector.NumberSelector(selector.NumberSelectorConfig(min=-180, max=180, step=0.001, mode="box")),
+                vol.Optional(CONF_FORECAST_LAT, default=g(CONF_FORECAST_LAT, round(default_lat, 4))): _LAT_SELECTOR,
+                vol.Optional(CONF_FORECAST_LON, default=g(CONF_FORECAST_LON, round(default_lon, 4))): _LON_SELECTOR,
                 vol.Optional(
                     CONF_FORECAST_PROVIDER, default=g(CONF_FORECAST_PROVIDER, DEFAULT_FORECAST_PROVIDER)
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            FORECAST_PROVIDER_OPEN_METEO,
-                            FORECAST_PROVIDER_MET_NO,
-                            FORECAST_PROVIDER_NWS,
-                            FORECAST_PROVIDER_OWM,
-                            FORECAST_PROVIDER_PIRATE,
-                            FORECAST_PROVIDER_METEO_FRANCE,
-                            FORECAST_PROVIDER_HA_ENTITY,
-                        ],
-                        mode=selector.SelectSelectorMode.LIST,
-                        translation_key="forecast_provider",
-                    )
-                ),
+                ): _FORECAST_PROVIDER_SELECTOR,
                 # Optional weather entity used only by the HA-entity forecast provider.
                 # Must NOT carry a default of "" — an empty string fails the weather
                 # EntitySelector ("Entity is neither a valid entity ID nor a valid UUID")
@@ -2293,62 +2297,16 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(
                     CONF_FORECAST_ENTITY,
                     description={"suggested_value": g(CONF_FORECAST_ENTITY, "") or None},
-                ): selector.EntitySelector(selector.EntitySelectorConfig(domain="weather")),
-                vol.Optional(
-                    CONF_THRESH_WIND_GUST_MS, default=round(_convert_gust_to_display(cur_gust_ms, gust_u), 1)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=120, step=0.1, mode="box", unit_of_measurement=gust_u)
-                ),
-                vol.Optional(
-                    CONF_THRESH_RAIN_RATE_MMPH, default=round(_convert_rain_to_display(cur_rain_mmph, rain_meas), 2)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=0, max=200, step=0.5, mode="box", unit_of_measurement=rain_u)
-                ),
-                vol.Optional(
-                    CONF_THRESH_FREEZE_C, default=round(_convert_temp_to_display(cur_freeze_c, imperial), 1)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=round(_convert_temp_to_display(-30.0, imperial), 1),
-                        max=round(_convert_temp_to_display(10.0, imperial), 1),
-                        step=0.5,
-                        mode="box",
-                        unit_of_measurement=temp_u,
-                    )
-                ),
-                vol.Optional(
-                    CONF_STALENESS_S, default=g(CONF_STALENESS_S, DEFAULT_STALENESS_S)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=60, max=86400, step=60, mode="box", unit_of_measurement="s")
-                ),
-                vol.Optional(
-                    CONF_RAIN_FILTER_ALPHA, default=g(CONF_RAIN_FILTER_ALPHA, DEFAULT_RAIN_FILTER_ALPHA)
-                ): selector.NumberSelector(selector.NumberSelectorConfig(min=0.05, max=1.0, step=0.05, mode="slider")),
-                vol.Optional(
-                    CONF_PRESSURE_TREND_WINDOW_H,
-                    default=g(CONF_PRESSURE_TREND_WINDOW_H, DEFAULT_PRESSURE_TREND_WINDOW_H),
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=1, max=12, step=1, mode="box", unit_of_measurement="h")
-                ),
-                vol.Optional(CONF_CAL_TEMP_C, default=g(CONF_CAL_TEMP_C, DEFAULT_CAL_TEMP_C)): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=-10, max=10, step=0.1, mode="box", unit_of_measurement="°C")
-                ),
-                vol.Optional(
-                    CONF_CAL_HUMIDITY, default=g(CONF_CAL_HUMIDITY, DEFAULT_CAL_HUMIDITY)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=-20, max=20, step=0.5, mode="box", unit_of_measurement="%")
-                ),
-                vol.Optional(
-                    CONF_CAL_PRESSURE_HPA, default=g(CONF_CAL_PRESSURE_HPA, DEFAULT_CAL_PRESSURE_HPA)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=-10, max=10, step=0.1, mode="box", unit_of_measurement="hPa")
-                ),
-                vol.Optional(
-                    CONF_CAL_WIND_MS, default=g(CONF_CAL_WIND_MS, DEFAULT_CAL_WIND_MS)
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(min=-5, max=5, step=0.1, mode="box", unit_of_measurement="m/s")
+                ): _WEATHER_ENTITY_SELECTOR,
+                vol.Optional(CONF_THRESH_WIND_GUST_MS, default=def_gust): _threshold_selector(0, 120, 0.1, u.gust_u),
+                vol.Optional(CONF_THRESH_RAIN_RATE_MMPH, default=def_rain): _threshold_selector(0, 200, 0.5, u.rain_u),
+                vol.Optional(CONF_THRESH_FREEZE_C, default=def_freeze): _threshold_selector(
+                    u.freeze_min, u.freeze_max, 0.5, u.temp_u
                 ),
             }
         )
+        schema.update({vol.Optional(k, default=g(k, d)): sel for k, d, sel in _CORE_FIELDS_TUNING})
+        return vol.Schema(schema)
 
     # ------------------------------------------------------------------
     # Step 2: Features - all feature toggles
@@ -2374,81 +2332,7 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="features_opt",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_ENABLE_DISPLAY_SENSORS,
-                        default=g(CONF_ENABLE_DISPLAY_SENSORS, DEFAULT_ENABLE_DISPLAY_SENSORS),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_FIRE_RISK,
-                        default=g(CONF_ENABLE_FIRE_RISK, DEFAULT_ENABLE_FIRE_RISK),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_FOG, default=g(CONF_ENABLE_FOG, DEFAULT_ENABLE_FOG)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_THUNDERSTORM,
-                        default=g(CONF_ENABLE_THUNDERSTORM, DEFAULT_ENABLE_THUNDERSTORM),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_SEA_TEMP, default=g(CONF_ENABLE_SEA_TEMP, DEFAULT_ENABLE_SEA_TEMP)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_AIR_QUALITY, default=g(CONF_ENABLE_AIR_QUALITY, DEFAULT_ENABLE_AIR_QUALITY)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_POLLEN, default=g(CONF_ENABLE_POLLEN, DEFAULT_ENABLE_POLLEN)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_MOON, default=g(CONF_ENABLE_MOON, DEFAULT_ENABLE_MOON)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_SOLAR_FORECAST,
-                        default=g(CONF_ENABLE_SOLAR_FORECAST, DEFAULT_ENABLE_SOLAR_FORECAST),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_COMFORT_INDICES,
-                        default=g(CONF_ENABLE_COMFORT_INDICES, DEFAULT_ENABLE_COMFORT_INDICES),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_VIGILANCE_METEO,
-                        default=g(CONF_ENABLE_VIGILANCE_METEO, DEFAULT_ENABLE_VIGILANCE_METEO),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_VIGICRUES,
-                        default=g(CONF_ENABLE_VIGICRUES, DEFAULT_ENABLE_VIGICRUES),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_DIAGNOSTICS,
-                        default=g(CONF_ENABLE_DIAGNOSTICS, DEFAULT_ENABLE_DIAGNOSTICS),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_FWI_COMPONENTS,
-                        default=g(CONF_ENABLE_FWI_COMPONENTS, DEFAULT_ENABLE_FWI_COMPONENTS),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_ADVANCED_SENSORS,
-                        default=g(CONF_ENABLE_ADVANCED_SENSORS, DEFAULT_ENABLE_ADVANCED_SENSORS),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_NOWCAST,
-                        default=g(CONF_ENABLE_NOWCAST, DEFAULT_ENABLE_NOWCAST),
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_DEGREE_DAYS, default=g(CONF_ENABLE_DEGREE_DAYS, DEFAULT_ENABLE_DEGREE_DAYS)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_LIGHTNING, default=g(CONF_ENABLE_LIGHTNING, DEFAULT_ENABLE_LIGHTNING)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_INDOOR, default=g(CONF_ENABLE_INDOOR, DEFAULT_ENABLE_INDOOR)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_SOIL, default=g(CONF_ENABLE_SOIL, DEFAULT_ENABLE_SOIL)
-                    ): selector.BooleanSelector(),
-                }
-            ),
+            data_schema=vol.Schema({vol.Optional(k, default=g(k, d)): _BOOL_SELECTOR for k, d in _FEATURE_TOGGLES}),
             last_step=False,
         )
 
@@ -2463,9 +2347,9 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
 
     def _room_form_schema(self, src: dict | None) -> vol.Schema:
         src = src or {}
-        sensor_sel = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
+        sensor_sel = _ENTITY_SELECTOR
         schema: dict[Any, Any] = {
-            vol.Required("name", default=src.get("name", "")): selector.TextSelector(),
+            vol.Required("name", default=src.get("name", "")): _TEXT_SELECTOR,
         }
         for field in ("temp", "humidity", "co2"):
             cur = src.get(field)
@@ -2568,37 +2452,7 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="upload_services_opt",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_ENABLE_WUNDERGROUND, default=g(CONF_ENABLE_WUNDERGROUND, DEFAULT_ENABLE_WUNDERGROUND)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_WEATHERCLOUD, default=g(CONF_ENABLE_WEATHERCLOUD, DEFAULT_ENABLE_WEATHERCLOUD)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_PWSWEATHER, default=g(CONF_ENABLE_PWSWEATHER, DEFAULT_ENABLE_PWSWEATHER)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_WOW, default=g(CONF_ENABLE_WOW, DEFAULT_ENABLE_WOW)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_AWEKAS, default=g(CONF_ENABLE_AWEKAS, DEFAULT_ENABLE_AWEKAS)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_CWOP, default=g(CONF_ENABLE_CWOP, DEFAULT_ENABLE_CWOP)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_OWM_STATIONS, default=g(CONF_ENABLE_OWM_STATIONS, DEFAULT_ENABLE_OWM_STATIONS)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_WINDY, default=g(CONF_ENABLE_WINDY, DEFAULT_ENABLE_WINDY)
-                    ): selector.BooleanSelector(),
-                    vol.Optional(
-                        CONF_ENABLE_MQTT, default=g(CONF_ENABLE_MQTT, DEFAULT_ENABLE_MQTT)
-                    ): selector.BooleanSelector(),
-                }
-            ),
+            data_schema=vol.Schema({vol.Optional(k, default=g(k, d)): _BOOL_SELECTOR for k, d in _UPLOAD_TOGGLES}),
             last_step=False,
         )
 
@@ -2647,15 +2501,11 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="weathercloud_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WC_STATION_ID, default=g(CONF_WC_STATION_ID, "")): selector.TextSelector(),
-                    vol.Optional(CONF_WC_API_KEY, default=g(CONF_WC_API_KEY, "")): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
+                    vol.Optional(CONF_WC_STATION_ID, default=g(CONF_WC_STATION_ID, "")): _TEXT_SELECTOR,
+                    vol.Optional(CONF_WC_API_KEY, default=g(CONF_WC_API_KEY, "")): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_WC_INTERVAL_MIN, default=g(CONF_WC_INTERVAL_MIN, DEFAULT_WC_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2682,15 +2532,11 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="pwsweather_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_PWS_STATION_ID, default=g(CONF_PWS_STATION_ID, "")): selector.TextSelector(),
-                    vol.Optional(CONF_PWS_API_KEY, default=g(CONF_PWS_API_KEY, "")): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
+                    vol.Optional(CONF_PWS_STATION_ID, default=g(CONF_PWS_STATION_ID, "")): _TEXT_SELECTOR,
+                    vol.Optional(CONF_PWS_API_KEY, default=g(CONF_PWS_API_KEY, "")): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_PWS_INTERVAL_MIN, default=g(CONF_PWS_INTERVAL_MIN, DEFAULT_PWS_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2715,15 +2561,11 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="wow_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WOW_SITE_ID, default=g(CONF_WOW_SITE_ID, "")): selector.TextSelector(),
-                    vol.Optional(CONF_WOW_AUTH_KEY, default=g(CONF_WOW_AUTH_KEY, "")): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
+                    vol.Optional(CONF_WOW_SITE_ID, default=g(CONF_WOW_SITE_ID, "")): _TEXT_SELECTOR,
+                    vol.Optional(CONF_WOW_AUTH_KEY, default=g(CONF_WOW_AUTH_KEY, "")): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_WOW_INTERVAL_MIN, default=g(CONF_WOW_INTERVAL_MIN, DEFAULT_WOW_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2746,15 +2588,11 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="awekas_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_AWEKAS_USERNAME, default=g(CONF_AWEKAS_USERNAME, "")): selector.TextSelector(),
-                    vol.Optional(CONF_AWEKAS_PASSWORD, default=g(CONF_AWEKAS_PASSWORD, "")): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
+                    vol.Optional(CONF_AWEKAS_USERNAME, default=g(CONF_AWEKAS_USERNAME, "")): _TEXT_SELECTOR,
+                    vol.Optional(CONF_AWEKAS_PASSWORD, default=g(CONF_AWEKAS_PASSWORD, "")): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_AWEKAS_INTERVAL_MIN, default=g(CONF_AWEKAS_INTERVAL_MIN, DEFAULT_AWEKAS_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2777,16 +2615,14 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Optional(
                         CONF_OWM_STATIONS_API_KEY, default=g(CONF_OWM_STATIONS_API_KEY, "")
-                    ): selector.TextSelector(selector.TextSelectorConfig(type="password")),
+                    ): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_OWM_STATIONS_STATION_ID, default=g(CONF_OWM_STATIONS_STATION_ID, "")
-                    ): selector.TextSelector(),
+                    ): _TEXT_SELECTOR,
                     vol.Optional(
                         CONF_OWM_STATIONS_INTERVAL_MIN,
                         default=g(CONF_OWM_STATIONS_INTERVAL_MIN, DEFAULT_OWM_STATIONS_INTERVAL_MIN),
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2805,15 +2641,11 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="windy_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WINDY_API_KEY, default=g(CONF_WINDY_API_KEY, "")): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
-                    vol.Optional(CONF_WINDY_STATION_ID, default=g(CONF_WINDY_STATION_ID, "")): selector.TextSelector(),
+                    vol.Optional(CONF_WINDY_API_KEY, default=g(CONF_WINDY_API_KEY, "")): _PASSWORD_SELECTOR,
+                    vol.Optional(CONF_WINDY_STATION_ID, default=g(CONF_WINDY_STATION_ID, "")): _TEXT_SELECTOR,
                     vol.Optional(
                         CONF_WINDY_INTERVAL_MIN, default=g(CONF_WINDY_INTERVAL_MIN, DEFAULT_WINDY_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2830,19 +2662,13 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="cwop_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_CWOP_CALLSIGN, default=g(CONF_CWOP_CALLSIGN, "")): selector.TextSelector(),
-                    vol.Optional(CONF_CWOP_PASSCODE, default=g(CONF_CWOP_PASSCODE, "-1")): selector.TextSelector(),
-                    vol.Optional(
-                        CONF_CWOP_SERVER, default=g(CONF_CWOP_SERVER, DEFAULT_CWOP_SERVER)
-                    ): selector.TextSelector(),
-                    vol.Optional(CONF_CWOP_PORT, default=g(CONF_CWOP_PORT, DEFAULT_CWOP_PORT)): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=65535, step=1, mode="box")
-                    ),
+                    vol.Optional(CONF_CWOP_CALLSIGN, default=g(CONF_CWOP_CALLSIGN, "")): _TEXT_SELECTOR,
+                    vol.Optional(CONF_CWOP_PASSCODE, default=g(CONF_CWOP_PASSCODE, "-1")): _TEXT_SELECTOR,
+                    vol.Optional(CONF_CWOP_SERVER, default=g(CONF_CWOP_SERVER, DEFAULT_CWOP_SERVER)): _TEXT_SELECTOR,
+                    vol.Optional(CONF_CWOP_PORT, default=g(CONF_CWOP_PORT, DEFAULT_CWOP_PORT)): _CWOP_PORT_SELECTOR,
                     vol.Optional(
                         CONF_CWOP_INTERVAL_MIN, default=g(CONF_CWOP_INTERVAL_MIN, DEFAULT_CWOP_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=5, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _CWOP_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2859,15 +2685,13 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Optional(
                         CONF_MQTT_DISCOVERY_PREFIX, default=g(CONF_MQTT_DISCOVERY_PREFIX, DEFAULT_MQTT_DISCOVERY_PREFIX)
-                    ): selector.TextSelector(),
+                    ): _TEXT_SELECTOR,
                     vol.Optional(
                         CONF_MQTT_STATE_PREFIX, default=g(CONF_MQTT_STATE_PREFIX, DEFAULT_MQTT_STATE_PREFIX)
-                    ): selector.TextSelector(),
+                    ): _TEXT_SELECTOR,
                     vol.Optional(
                         CONF_MQTT_INTERVAL_MIN, default=g(CONF_MQTT_INTERVAL_MIN, DEFAULT_MQTT_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _UPLOAD_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2898,9 +2722,7 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="forecast_api_key_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_FORECAST_API_KEY, default=current_key): selector.TextSelector(
-                        selector.TextSelectorConfig(type=selector.TextSelectorType.PASSWORD)
-                    ),
+                    vol.Required(CONF_FORECAST_API_KEY, default=current_key): _PASSWORD_SELECTOR,
                 }
             ),
             description_placeholders={"provider_name": provider_name, "api_url": api_url},
@@ -2945,14 +2767,8 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="sea_temp_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(
-                        CONF_SEA_TEMP_LAT, default=g(CONF_SEA_TEMP_LAT, round(default_lat, 4))
-                    ): selector.NumberSelector(selector.NumberSelectorConfig(min=-90, max=90, step=0.001, mode="box")),
-                    vol.Optional(
-                        CONF_SEA_TEMP_LON, default=g(CONF_SEA_TEMP_LON, round(default_lon, 4))
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=-180, max=180, step=0.001, mode="box")
-                    ),
+                    vol.Optional(CONF_SEA_TEMP_LAT, default=g(CONF_SEA_TEMP_LAT, round(default_lat, 4))): _LAT_SELECTOR,
+                    vol.Optional(CONF_SEA_TEMP_LON, default=g(CONF_SEA_TEMP_LON, round(default_lon, 4))): _LON_SELECTOR,
                 }
             ),
             last_step=False,
@@ -2967,7 +2783,7 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             if not api_key:
                 api_key = g(CONF_WU_API_KEY, "")  # keep existing key if not re-entered
             if station_id and api_key:
-                valid, err = await _validate_wu_credentials(station_id, api_key)
+                valid, err = await _validate_wu_credentials(self.hass, station_id, api_key)
                 if not valid:
                     errors[CONF_WU_API_KEY] = err or "invalid_api_key"
                 else:
@@ -2984,17 +2800,11 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
             step_id="wunderground_opt",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_WU_STATION_ID, default=g(CONF_WU_STATION_ID, "")): selector.TextSelector(
-                        selector.TextSelectorConfig(type="text")
-                    ),
-                    vol.Optional(CONF_WU_API_KEY, default=""): selector.TextSelector(
-                        selector.TextSelectorConfig(type="password")
-                    ),
+                    vol.Optional(CONF_WU_STATION_ID, default=g(CONF_WU_STATION_ID, "")): _TEXT_SELECTOR,
+                    vol.Optional(CONF_WU_API_KEY, default=""): _PASSWORD_SELECTOR,
                     vol.Optional(
                         CONF_WU_INTERVAL_MIN, default=g(CONF_WU_INTERVAL_MIN, DEFAULT_WU_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=1, max=30, step=1, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _WU_INTERVAL_SELECTOR,
                 }
             ),
             errors=errors,
@@ -3013,9 +2823,7 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Optional(
                         CONF_AQI_INTERVAL_MIN, default=g(CONF_AQI_INTERVAL_MIN, DEFAULT_AQI_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=15, max=360, step=15, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _AQI_INTERVAL_SELECTOR,
                 }
             ),
             last_step=False,
@@ -3049,30 +2857,16 @@ class WSStationOptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Optional(
                         CONF_SOLAR_PEAK_KW, default=g(CONF_SOLAR_PEAK_KW, DEFAULT_SOLAR_PEAK_KW)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(
-                            min=0.1,
-                            max=100.0,
-                            step=0.1,
-                            mode="box",
-                            unit_of_measurement="kWp",
-                        )
-                    ),
+                    ): _SOLAR_PEAK_SELECTOR,
                     vol.Optional(
                         CONF_SOLAR_PANEL_AZIMUTH, default=g(CONF_SOLAR_PANEL_AZIMUTH, DEFAULT_SOLAR_PANEL_AZIMUTH)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0, max=359, step=1, mode="box", unit_of_measurement="°")
-                    ),
+                    ): _SOLAR_AZIMUTH_SELECTOR,
                     vol.Optional(
                         CONF_SOLAR_PANEL_TILT, default=g(CONF_SOLAR_PANEL_TILT, DEFAULT_SOLAR_PANEL_TILT)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=0, max=90, step=1, mode="box", unit_of_measurement="°")
-                    ),
+                    ): _SOLAR_TILT_SELECTOR,
                     vol.Optional(
                         CONF_SOLAR_INTERVAL_MIN, default=g(CONF_SOLAR_INTERVAL_MIN, DEFAULT_SOLAR_INTERVAL_MIN)
-                    ): selector.NumberSelector(
-                        selector.NumberSelectorConfig(min=30, max=360, step=30, mode="box", unit_of_measurement="min")
-                    ),
+                    ): _SOLAR_INTERVAL_SELECTOR,
                 }
             ),
             description_placeholders={"info": "Azimuth: 0=N, 90=E, 180=S, 270=W. Tilt: degrees from horizontal."},
@@ -1,10 +1,12 @@
 """Constants for Weather Station Core."""
 
-from typing import Any
+import math
+import sys
+from typing import Any, Final
 
 DOMAIN = "ws_core"
 
-PLATFORMS = ["sensor", "binary_sensor", "weather", "select", "switch", "number", "event"]
+PLATFORMS: Final = ("sensor", "binary_sensor", "weather", "select", "switch", "number", "event")
 
 # ---------------------------------------------------------------------------
 # Configuration keys
@@ -155,11 +157,18 @@ VALID_HUMIDITY_MAX = 100.0
 VALID_WIND_GUST_MAX_MS = 113.0
 VALID_RAIN_RATE_MAX_MMPH = 500.0
 
+# (min, max) pairs for checking whole buffers, e.g. rolling history restored
+# from storage.
+VALID_TEMP_RANGE_C: tuple[float, float] = (VALID_TEMP_MIN_C, VALID_TEMP_MAX_C)
+VALID_WIND_GUST_RANGE_MS: tuple[float, float] = (0.0, VALID_WIND_GUST_MAX_MS)
+
 # ---------------------------------------------------------------------------
 # Canonical internal units
 # ---------------------------------------------------------------------------
-UNIT_TEMP_C = "\u00b0C"
-UNIT_WIND_MS = "m/s"
+# Identifier-like literals (every KEY_*/SRC_*/CONF_* value, "hPa", "mm") are
+# interned by the compiler already; these two are not, so intern explicitly.
+UNIT_TEMP_C = sys.intern("\u00b0C")
+UNIT_WIND_MS = sys.intern("m/s")
 UNIT_PRESSURE_HPA = "hPa"
 UNIT_RAIN_MM = "mm"
 
@@ -310,61 +319,110 @@ OPTIONAL_SOURCES = [
     SRC_SOIL_MOISTURE,
     SRC_SOIL_TEMP,
 ]
+# Membership companion: the list above keeps form order for iteration.
+OPTIONAL_SOURCES_SET = frozenset(OPTIONAL_SOURCES)
 
 # Only these sources trigger staleness warnings. Excluded: rain_total (static
 # when dry), lux/uv (zero at night), dew_point, battery (slow-reporting).
-STALENESS_CHECK_SOURCES = {SRC_TEMP, SRC_PRESS, SRC_WIND, SRC_WIND_DIR}  # SRC_HUM removed: humidity is stable
+# Ordered: the health check walks this tuple directly rather than filtering
+# every configured source against it.
+STALENESS_CHECK_SOURCES: tuple[str, ...] = (
+    SRC_TEMP,
+    SRC_PRESS,
+    SRC_WIND,
+    SRC_WIND_DIR,
+)  # SRC_HUM removed: humidity is stable
 
 # ---------------------------------------------------------------------------
 # Named physical / algorithm constants
 # ---------------------------------------------------------------------------
-SLP_GAS_CONSTANT_RATIO: float = 29.263
+SLP_GAS_CONSTANT_RATIO: Final[float] = 29.263
+
+MAGNUS_A: Final[float] = 17.625
+MAGNUS_B: Final[float] = 243.04
 
-MAGNUS_A: float = 17.625
-MAGNUS_B: float = 243.04
+MAGNUS_A_ICE: Final[float] = 22.587
+MAGNUS_B_ICE: Final[float] = 273.86
 
-MAGNUS_A_ICE: float = 22.587
-MAGNUS_B_ICE: float = 273.86
+# (a, b) pairs for the Magnus dew/frost point kernels in algorithms.
+MAGNUS_WATER: Final[tuple[float, float]] = (MAGNUS_A, MAGNUS_B)
+MAGNUS_ICE: Final[tuple[float, float]] = (MAGNUS_A_ICE, MAGNUS_B_ICE)
 
-BEAUFORT_BOUNDARIES = [0.3, 1.6, 3.4, 5.5, 8.0, 10.8, 13.9, 17.2, 20.8, 24.5, 28.5, 32.7]
+# Lower bound (m/s) of Beaufort forces 1..12; sorted, for bisect in algorithms.
+BEAUFORT_BOUNDARIES: tuple[float, ...] = (0.3, 1.6, 3.4, 5.5, 8.0, 10.8, 13.9, 17.2, 20.8, 24.5, 28.5, 32.7)
 
 PRESSURE_HISTORY_SAMPLES = 12
 PRESSURE_HISTORY_INTERVAL_MIN = 15
 
-PRESSURE_TREND_RISING_RAPID: float = 1.6
-PRESSURE_TREND_RISING: float = 0.8
-PRESSURE_TREND_FALLING: float = -0.8
-PRESSURE_TREND_FALLING_RAPID: float = -1.6
+PRESSURE_TREND_RISING_RAPID: Final[float] = 1.6
+PRESSURE_TREND_RISING: Final[float] = 0.8
+PRESSURE_TREND_FALLING: Final[float] = -0.8
+PRESSURE_TREND_FALLING_RAPID: Final[float] = -1.6
+
+# Ascending class boundaries for bisect_right over the 3h tendency: the
+# rising thresholds are inclusive (>=) and the falling ones exclusive (>), so
+# the falling bounds are nudged one ulp up to land -0.8/-1.6 in the lower class.
+PRESSURE_TREND_BOUNDARIES: tuple[float, ...] = (
+    math.nextafter(PRESSURE_TREND_FALLING_RAPID, math.inf),
+    math.nextafter(PRESSURE_TREND_FALLING, math.inf),
+    PRESSURE_TREND_RISING,
+    PRESSURE_TREND_RISING_RAPID,
+)
+
+RAIN_RATE_PHYSICAL_CAP_MMPH: Final[float] = 500.0
+WIND_SMOOTH_ALPHA: Final[float] = 0.3
+
+# Source-state events arriving within this window are coalesced into one
+# recompute (the first event still computes immediately).
+SOURCE_CHANGE_COOLDOWN_S: Final[float] = 0.3
 
-RAIN_RATE_PHYSICAL_CAP_MMPH: float = 500.0
-WIND_SMOOTH_ALPHA: float = 0.3
+# The 60 s tick is skipped when no source state has changed since the last
+# pass and that pass is younger than this; otherwise it and the coordinator
+# refresh both recompute identical inputs every minute. Coordinator refreshes
+# (timer or explicit request) always recompute.
+IDLE_RECOMPUTE_MIN_S: Final[float] = 30.0
+
+ZAMBRETTI_UPPER_PRESSURE: Final[float] = 1050.0
+ZAMBRETTI_LOWER_PRESSURE: Final[float] = 950.0
+
+FORECAST_MIN_RETRY_S: Final[int] = 300
+FORECAST_MAX_RETRY_S: Final[int] = 3600
+
+
+def _backoff_schedule(lo: int, hi: int) -> tuple[int, ...]:
+    """Doubling delays from ``lo``, capped at (and ending with) ``hi``."""
+    out = []
+    while lo < hi:
+        out.append(lo)
+        lo *= 2
+    out.append(hi)
+    return tuple(out)
 
-ZAMBRETTI_UPPER_PRESSURE: float = 1050.0
-ZAMBRETTI_LOWER_PRESSURE: float = 950.0
 
-FORECAST_MIN_RETRY_S: int = 300
-FORECAST_MAX_RETRY_S: int = 3600
+# Retry delay after the Nth consecutive forecast failure is index N-1,
+# clamped to the last entry: (300, 600, 1200, 2400, 3600).
+FORECAST_RETRY_SCHEDULE_S: Final[tuple[int, ...]] = _backoff_schedule(FORECAST_MIN_RETRY_S, FORECAST_MAX_RETRY_S)
 
 # Forecast agreement thresholds (percentage points)
-FORECAST_AGREEMENT_ALIGNED_PP: int = 20  # delta < 20 pp  -> aligned
-FORECAST_AGREEMENT_CONFLICT_PP: int = 40  # delta >= 40 pp -> conflict
+FORECAST_AGREEMENT_ALIGNED_PP: Final[int] = 20  # delta < 20 pp  -> aligned
+FORECAST_AGREEMENT_CONFLICT_PP: Final[int] = 40  # delta >= 40 pp -> conflict
 
 # Sensor drift detection - slope thresholds (per hour) and R² floor
-DRIFT_SLOPE_TEMP_C_H: float = 0.1  # °C/h monotonic drift flag
-DRIFT_SLOPE_HUMIDITY_PCT_H: float = 0.5  # %/h
-DRIFT_SLOPE_PRESSURE_HPA_H: float = 1.5  # hPa/h
-DRIFT_R_SQ_THRESH: float = 0.85  # minimum R² to flag as drift
+DRIFT_SLOPE_TEMP_C_H: Final[float] = 0.1  # °C/h monotonic drift flag
+DRIFT_SLOPE_HUMIDITY_PCT_H: Final[float] = 0.5  # %/h
+DRIFT_SLOPE_PRESSURE_HPA_H: Final[float] = 1.5  # hPa/h
+DRIFT_R_SQ_THRESH: Final[float] = 0.85  # minimum R² to flag as drift
 
 # Stuck rain-bucket detection (samples at ~1 min intervals)
-DRIFT_STUCK_BUCKET_SAMPLES: int = 240  # 4-hour rolling window
-DRIFT_STUCK_BUCKET_MIN_RATE: float = 0.1  # mm/h minimum to count as non-zero
-DRIFT_STUCK_RATE_RANGE_MAX: float = 0.1  # mm/h max spread to flag as stuck
+DRIFT_STUCK_BUCKET_SAMPLES: Final[int] = 240  # 4-hour rolling window
+DRIFT_STUCK_BUCKET_MIN_RATE: Final[float] = 0.1  # mm/h minimum to count as non-zero
+DRIFT_STUCK_RATE_RANGE_MAX: Final[float] = 0.1  # mm/h max spread to flag as stuck
 
 CONFIG_VERSION = 4
 
 # Alert hysteresis: ticks above/below threshold before state changes
-ALERT_DEBOUNCE_ON_TICKS: int = 2  # consecutive ticks above threshold → fire
-ALERT_DEBOUNCE_OFF_TICKS: int = 3  # consecutive ticks below threshold → clear
+ALERT_DEBOUNCE_ON_TICKS: Final[int] = 2  # consecutive ticks above threshold → fire
+ALERT_DEBOUNCE_OFF_TICKS: Final[int] = 3  # consecutive ticks below threshold → clear
 
 # ---------------------------------------------------------------------------
 # v0.7.0 - Air Quality (Open-Meteo AQI, free/no key)
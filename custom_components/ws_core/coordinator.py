@@ -24,27 +24,30 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json as _json
+import functools
 import logging
 import math
-import pathlib as _pathlib
+import sys
+import time
 from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import pairwise
 from typing import Any
 
 import aiohttp
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from . import localize
 from .algorithms import (
-    CONDITION_COLORS,
-    CONDITION_DESCRIPTIONS,
-    CONDITION_ICONS,
     NOWCAST_BUCKET_THRESHOLD_MM,
     ZAMBRETTI_RAIN_PCT,
     KalmanFilter,
@@ -73,6 +76,7 @@ from .algorithms import (
     calculate_moon_illumination,
     calculate_net_radiation,
     calculate_rain_probability,
+    calculate_sea_level_pressure,
     calculate_specific_humidity,
     calculate_thsw_index,
     calculate_thw_index,
@@ -88,6 +92,7 @@ from .algorithms import (
     clearness_to_cloud_cover,
     combine_rain_probability,
     compute_fwi,
+    condition_meta,
     cross_sensor_consistency_flags,
     derive_nowcast,
     determine_current_condition,
@@ -98,7 +103,6 @@ from .algorithms import (
     ffdi_danger_level,
     fog_probability,
     format_rain_display,
-    get_condition_severity,
     humidity_level,
     indoor_comfort_score,
     least_squares_pressure_trend,
@@ -124,6 +128,10 @@ from .const import (
     CONF_AWEKAS_INTERVAL_MIN,
     CONF_AWEKAS_PASSWORD,
     CONF_AWEKAS_USERNAME,
+    CONF_CAL_HUMIDITY,
+    CONF_CAL_PRESSURE_HPA,
+    CONF_CAL_TEMP_C,
+    CONF_CAL_WIND_MS,
     CONF_CDD_BASE_C,
     CONF_CHILL_HOUR_BASE_C,
     CONF_CHILL_SEASON_RESET_DAY,
@@ -290,6 +298,7 @@ from .const import (
     DEFAULT_WINDY_INTERVAL_MIN,
     DEFAULT_WOW_INTERVAL_MIN,
     DEFAULT_WU_INTERVAL_MIN,
+    DOMAIN,
     DRIFT_R_SQ_THRESH,
     DRIFT_SLOPE_HUMIDITY_PCT_H,
     DRIFT_SLOPE_PRESSURE_HPA_H,
@@ -299,9 +308,9 @@ from .const import (
     DRIFT_STUCK_RATE_RANGE_MAX,
     FORECAST_AGREEMENT_ALIGNED_PP,
     FORECAST_AGREEMENT_CONFLICT_PP,
-    FORECAST_MAX_RETRY_S,
-    FORECAST_MIN_RETRY_S,
     FORECAST_PROVIDER_HA_ENTITY,
+    FORECAST_RETRY_SCHEDULE_S,
+    IDLE_RECOMPUTE_MIN_S,
     # v1.5.0
     KEY_ABSOLUTE_HUMIDITY,
     KEY_AIR_DENSITY,
@@ -488,10 +497,14 @@ from .const import (
     KEY_ZAMBRETTI_FORECAST,
     KEY_ZAMBRETTI_NUMBER,
     LEARNING_SAVE_INTERVAL_S,
+    LEARNING_SOLAR_BETA,
+    LEARNING_SOLAR_MAX,
+    LEARNING_SOLAR_MIN,
     PRESSURE_HISTORY_INTERVAL_MIN,
     PRESSURE_HISTORY_SAMPLES,
     RAIN_RATE_PHYSICAL_CAP_MMPH,
     REQUIRED_SOURCES,
+    SOURCE_CHANGE_COOLDOWN_S,
     SPIKE_MIN_SAMPLES,
     SPIKE_SIGMA_THRESHOLD,
     SRC_BATTERY,
@@ -509,6 +522,7 @@ from .const import (
     SRC_RAIN_TOTAL,
     SRC_SOIL_MOISTURE,
     SRC_SOIL_TEMP,
+    SRC_SOLAR_RADIATION,
     SRC_TEMP,
     SRC_UV,
     SRC_WIND,
@@ -520,9 +534,21 @@ from .const import (
     VALID_PRESSURE_MIN_HPA,
     VALID_TEMP_MAX_C,
     VALID_TEMP_MIN_C,
-    WIND_SMOOTH_ALPHA,
+    VALID_TEMP_RANGE_C,
+    VALID_WIND_GUST_RANGE_MS,
     normalize_indoor_rooms,
 )
+from .learning_state import (
+    async_save_learning,
+    brier_score,
+    climatology_stats,
+    climatology_stats_by_window,
+    compute_blend_weights,
+    record_forecast_outcome,
+    update_climatology,
+    update_daily_streaks,
+    update_solar_lux_factor,
+)
 from .models import WsData
 from .providers import get_provider
 
@@ -535,22 +561,189 @@ except ImportError:
 
 _LOGGER = logging.getLogger(__name__)
 
-# Read the integration version without blocking the HA event loop.
-# pathlib.read_text() is a synchronous I/O call; performing it at module-level
-# triggers HA's "Detected blocking call" warning because the module is first
-# imported inside async_setup_entry (i.e. within the event loop).  We therefore
-# read the file once in a thread-safe, non-blocking way: read_bytes() on the
-# manifest is tiny and fast, but we still use executor so the call is explicit.
-# The value is cached in a module-level variable after the first read.
+# Integration version, resolved in async_start from the manifest HA's loader
+# has already parsed (no file read, no executor job). Cached module-wide.
 _INTEGRATION_VERSION: str = "unknown"
 
 
-def _load_integration_version() -> str:
-    """Return the version string from manifest.json (blocking, run via executor)."""
-    try:
-        return _json.loads((_pathlib.Path(__file__).parent / "manifest.json").read_bytes()).get("version", "unknown")
-    except Exception:  # noqa: BLE001
-        return "unknown"
+# Source-unit conversion tables, keyed by the normalised unit string (see
+# _norm_unit).  Units not listed are assumed to already be in the target unit.
+_TEMP_TO_C: dict[str, tuple[float, float]] = {
+    "f": (5.0 / 9.0, -32.0 * 5.0 / 9.0),
+    "\u00b0f": (5.0 / 9.0, -32.0 * 5.0 / 9.0),
+    "k": (1.0, -273.15),
+    "kelvin": (1.0, -273.15),
+}
+_SPEED_TO_MS: dict[str, float] = {
+    "km/h": 1.0 / 3.6,
+    "kmh": 1.0 / 3.6,
+    "kph": 1.0 / 3.6,
+    "mph": 0.44704,
+    "kn": 0.514444,
+    "knot": 0.514444,
+    "knots": 0.514444,
+}
+_PRESSURE_TO_HPA: dict[str, float] = {
+    "pa": 0.01,
+    "inhg": 33.8638866667,
+    "mmhg": 1.33322,
+    "torr": 1.33322,
+}
+_LENGTH_TO_MM: dict[str, float] = {"in": 25.4, "inch": 25.4, "inches": 25.4}
+
+
+# Imperial units expected by the upload protocols (WU, PWSWeather, WOW, CWOP);
+# callers round to the precision each protocol wants.
+def _c_to_f(c: float) -> float:
+    return c * 9 / 5 + 32
+
+
+def _ms_to_mph(ms: float) -> float:
+    return ms * 2.23694
+
+
+def _mm_to_in(mm: float) -> float:
+    return mm / 25.4
+
+
+def _hpa_to_inhg(hpa: float) -> float:
+    return hpa / 33.8639
+
+
+def _aprs_latlon(lat: float, lon: float) -> str:
+    """APRS ``DDMM.mmN/DDDMM.mmE`` position for decimal degrees."""
+    lat_deg = int(abs(lat))
+    lat_min = (abs(lat) - lat_deg) * 60
+    lon_deg = int(abs(lon))
+    lon_min = (abs(lon) - lon_deg) * 60
+    return (
+        f"{lat_deg:02d}{lat_min:05.2f}{'N' if lat >= 0 else 'S'}/{lon_deg:03d}{lon_min:05.2f}{'E' if lon >= 0 else 'W'}"
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _norm_unit(unit: str) -> str:
+    """Lower-case a unit_of_measurement and strip spaces (cached per string)."""
+    return unit.lower().replace(" ", "")
+
+
+@functools.lru_cache(maxsize=32)
+def _temp_coeffs(unit: str) -> tuple[float, float]:
+    """(a, b) such that a*v + b converts ``unit`` to Celsius (cached per string)."""
+    u = _norm_unit(unit)
+    coeffs = _TEMP_TO_C.get(u)
+    if coeffs is None:
+        # Loose match for variants such as "° F" or "°Fahrenheit".
+        coeffs = _TEMP_TO_C["f"] if "f" in u and "\u00b0" in u else (1.0, 0.0)
+    return coeffs
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_condition(
+    hour: int,
+    temp_c: float,
+    humidity: float,
+    wind_speed_ms: float,
+    wind_gust_ms: float,
+    rain_rate_mmph: float,
+    dew_point_c: float,
+    illuminance_lx: float,
+    uv_index: float,
+    zambretti: str,
+    pressure_trend: float,
+    sun_elevation: float,
+    sun_azimuth: float,
+    is_day: bool,
+) -> tuple[str, str, str, str, str]:
+    """(condition, icon, color, description, severity), cached per input tuple.
+
+    ``hour`` is only part of the key: the classifier reads the wall clock for
+    its misty-morning window, so a cached result must not outlive the hour.
+    """
+    condition = determine_current_condition(
+        temp_c=temp_c,
+        humidity=humidity,
+        wind_speed_ms=wind_speed_ms,
+        wind_gust_ms=wind_gust_ms,
+        rain_rate_mmph=rain_rate_mmph,
+        dew_point_c=dew_point_c,
+        illuminance_lx=illuminance_lx,
+        uv_index=uv_index,
+        zambretti=zambretti,
+        pressure_trend=pressure_trend,
+        sun_elevation=sun_elevation,
+        sun_azimuth=sun_azimuth,
+        is_day=is_day,
+    )
+    return (condition, *condition_meta(condition))
+
+
+@functools.lru_cache(maxsize=256)
+def _rain_probabilities(
+    mslp: float,
+    pressure_trend: float,
+    humidity: float,
+    wind_quadrant: str,
+    climate_region: str,
+    api_prob: int | None,
+    hour: int,
+    learned_local_w: float | None,
+    learned_api_w: float | None,
+) -> tuple[int, int]:
+    """(local, combined) rain probability, cached per input tuple."""
+    local_prob = calculate_rain_probability(
+        mslp=mslp,
+        pressure_trend=pressure_trend,
+        humidity=humidity,
+        wind_quadrant=wind_quadrant,
+        climate_region=climate_region,
+    )
+    combined = combine_rain_probability(
+        local_prob,
+        api_prob,
+        hour,
+        learned_local_w=learned_local_w,
+        learned_api_w=learned_api_w,
+    )
+    return local_prob, combined
+
+
+@functools.lru_cache(maxsize=16)
+def _isoformat(ts: datetime | None) -> str | None:
+    """ISO string for a timestamp that is republished unchanged every tick."""
+    return ts.isoformat() if ts else None
+
+
+# Width of the pane used to coalesce high-rate samples in the 24h windows.
+_PANE = timedelta(minutes=1)
+
+
+def _same_pane(last_ts: datetime, now: datetime) -> bool:
+    """True if ``now`` falls in the same 1-minute pane as ``last_ts``."""
+    return now.minute == last_ts.minute and now - last_ts < _PANE
+
+
+def _keep_latest(_old: float, new: float) -> float:
+    return new
+
+
+# Per-sensor binary flags derived from the _validate_readings messages:
+# (data key, subject word, verdict word) - both words must appear in a flag.
+_QUALITY_FLAG_MARKERS: tuple[tuple[str, str, str], ...] = (
+    ("_temp_out_of_range", "temperature", "outside"),
+    ("_humidity_out_of_range", "humidity", "outside"),
+    ("_pressure_out_of_range", "pressure", "outside"),
+    ("_wind_gust_below_wind", "gust", "below"),
+    ("_dew_exceeds_temp", "dew", "exceeds"),
+)
+
+# Card color per station health state.
+_HEALTH_COLOR: dict[str, str] = {
+    "online": "rgba(74,222,128,0.8)",
+    "degraded": "rgba(251,191,36,0.9)",
+    "stale": "rgba(249,115,22,0.9)",
+    "offline": "rgba(239,68,68,0.9)",
+}
 
 
 # ---------------------------------------------------------------------------
@@ -558,6 +751,25 @@ def _load_integration_version() -> str:
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True, slots=True)
+class _UploadObs:
+    """Observation fields shared by the WU-style and APRS uploaders.
+
+    Missing wind and rain readings are reported as 0; the pressure is the
+    sea-level value when available, else the station pressure.
+    """
+
+    temp_c: float | None
+    dew_c: float | None
+    humidity: float | None
+    press_hpa: float | None
+    wind_dir: float
+    wind_ms: float
+    gust_ms: float
+    rain_1h_mm: float
+    rain_24h_mm: float
+
+
 @dataclass
 class WSStationRuntime:
     """Mutable runtime state that persists across compute cycles."""
@@ -571,6 +783,10 @@ class WSStationRuntime:
     # Pressure tracking
     pressure_history: deque = field(default_factory=lambda: deque(maxlen=PRESSURE_HISTORY_SAMPLES))
     pressure_history_ts: Any | None = None
+    # Trend fit cached until the next sample lands (trend_fit_ts tracks which)
+    last_trend_3h: float = 0.0
+    last_trend_change_hpa: float = 0.0
+    trend_fit_ts: Any | None = None
 
     # Wind direction smoothing
     smoothed_wind_dir: float | None = None
@@ -582,18 +798,42 @@ class WSStationRuntime:
     temp_history_24h: deque = field(default_factory=deque)
     gust_history_24h: deque = field(default_factory=deque)
     rain_total_history_24h: deque = field(default_factory=deque)
+    # Monotonic (ts, value) deques over the same windows; [0] is the 24h extreme
+    temp_max_24h: deque = field(default_factory=deque)
+    temp_min_24h: deque = field(default_factory=deque)
+    gust_max_24h: deque = field(default_factory=deque)
+    # Running sum of temp_history_24h values, for the 24h mean
+    temp_sum_24h: float = 0.0
+    # Running sum of positive steps in rain_total_history_24h (24h accumulation)
+    rain_rise_24h: float = 0.0
 
     # Forecast cache
     last_forecast_fetch: Any | None = None
     last_sea_temp_fetch: Any | None = None
     forecast_inflight: bool = False
     forecast_consecutive_failures: int = 0
+    # Daily forecast list the cached tiles were built from
+    forecast_tiles_daily: list | None = None
+    forecast_tiles: list | None = None
 
     # MSLP cached for Zambretti
     last_mslp: float | None = None
+    # Last zambretti_forecast() inputs and its (text, number) result
+    zambretti_key: tuple | None = None
+    zambretti_result: tuple[str, int] | None = None
+
+    # Moon values for one local day: (date ordinal, {data key: value})
+    moon_cache: tuple[int, dict[str, Any]] | None = None
 
     # Compute timing (for diagnostics)
     last_compute_ms: float = 0.0
+    # Monotonic start time and input state objects of the last _compute pass
+    compute_mono: float = 0.0
+    compute_sig: tuple | None = None
+
+    # Uploader snapshot and the published data dict it was read from
+    upload_obs_src: dict | None = None
+    upload_obs: _UploadObs | None = None
 
     # v0.7.0 Air Quality / Pollen fetch tracking
     last_aqi_fetch: Any | None = None
@@ -602,6 +842,13 @@ class WSStationRuntime:
     # v0.9.0 Solar forecast fetch tracking
     last_solar_fetch: Any | None = None
 
+    # Per staleness-checked source: (state object, time it turns stale)
+    stale_deadlines: dict[str, tuple[Any, datetime]] = field(default_factory=dict)
+
+    # Last sun.sun state object seen and its parsed (elevation, azimuth, is_day)
+    sun_state: Any | None = None
+    sun_position: tuple[float, float, bool] | None = None
+
 
 # ---------------------------------------------------------------------------
 # Coordinator
@@ -622,7 +869,13 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.entry_options = entry_options or {}
         self.runtime = WSStationRuntime()
 
-        self.sources: dict[str, str] = dict((entry_options or {}).get(CONF_SOURCES) or entry_data.get(CONF_SOURCES, {}))
+        # Keys come back from the JSON-backed entry store as fresh str objects;
+        # interning them lets every per-tick sources.get(SRC_*) (the SRC_*
+        # literals are already interned) match on identity instead of a compare.
+        self.sources: dict[str, str] = {
+            sys.intern(k): v
+            for k, v in ((entry_options or {}).get(CONF_SOURCES) or entry_data.get(CONF_SOURCES, {})).items()
+        }
 
         def _get(key: str, default: Any) -> Any:
             return self.entry_options.get(key, entry_data.get(key, default))
@@ -960,11 +1213,98 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=60),
         )
         self._unsubs: list = []
+        # Coalesce bursts of source-state events (several sensors of one
+        # station usually report within milliseconds) into one compute pass.
+        # The first event still computes immediately; the 60 s tick keeps
+        # the data live regardless.
+        self._source_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SOURCE_CHANGE_COOLDOWN_S,
+            immediate=True,
+            function=self._run_compute,
+        )
 
     # ------------------------------------------------------------------
     # Properties
     # ------------------------------------------------------------------
 
+    @functools.cached_property
+    def _calibration(self) -> tuple[float, float, float, float]:
+        """(temp C, humidity %, pressure hPa, wind m/s) offsets, read once.
+
+        Every options change (including the calibration number entities and
+        the apply_calibration service) reloads the entry, so the values are
+        fixed for the lifetime of this coordinator.
+        """
+        get = self.entry_options.get
+        return (
+            float(get(CONF_CAL_TEMP_C, 0.0)),
+            float(get(CONF_CAL_HUMIDITY, 0.0)),
+            float(get(CONF_CAL_PRESSURE_HPA, 0.0)),
+            float(get(CONF_CAL_WIND_MS, 0.0)),
+        )
+
+    @functools.cached_property
+    def _alert_thresholds(self) -> tuple[float, float, float]:
+        """(gust m/s, rain rate mm/h, freeze C) alert thresholds, read once."""
+        get = self.entry_options.get
+        return (
+            float(get(CONF_THRESH_WIND_GUST_MS, DEFAULT_THRESH_WIND_GUST_MS)),
+            float(get(CONF_THRESH_RAIN_RATE_MMPH, DEFAULT_THRESH_RAIN_RATE_MMPH)),
+            float(get(CONF_THRESH_FREEZE_C, DEFAULT_THRESH_FREEZE_C)),
+        )
+
+    @functools.cached_property
+    def _required_source_items(self) -> tuple[tuple[str, str | None], ...]:
+        """(source key, entity id) for each required source, resolved once.
+
+        The source mapping only changes through an options flow, which
+        reloads the entry and builds a new coordinator.
+        """
+        return tuple((k, self.sources.get(k)) for k in REQUIRED_SOURCES)
+
+    @functools.cached_property
+    def _aprs_position(self) -> str | None:
+        """APRS position of the station, or None without coordinates.
+
+        forecast_lat/lon come from the entry options; changing them reloads
+        the entry, so the string is built once per coordinator.
+        """
+        if self.forecast_lat is None or self.forecast_lon is None:
+            return None
+        return _aprs_latlon(float(self.forecast_lat), float(self.forecast_lon))
+
+    @functools.cached_property
+    def _signature_entity_ids(self) -> tuple[str, ...]:
+        """Entity ids whose state feeds _compute: mapped sources, indoor-room sensors and the sun.
+
+        Room sensors have no state listener, so the timer tick is the only
+        thing that picks up their changes.
+        """
+        rooms = (room.get(slot) for room in self._indoor_rooms for slot in ("temp", "humidity", "co2"))
+        return (*(eid for eid in self.sources.values() if eid), *(eid for eid in rooms if eid), "sun.sun")
+
+    def _source_signature(self) -> tuple[Any, ...]:
+        """Current state objects of the compute inputs.
+
+        HA replaces a State object on every change, so two signatures holding
+        the same objects mean no input changed in between. Auto-detected
+        Blitzortung entities are found lazily by _compute_lightning, so they are
+        read per call rather than cached with the fixed ids.
+        """
+        get_state = self.hass.states.get
+        return tuple(get_state(eid) for eid in (*self._signature_entity_ids, *self._blitzortung_sources.values()))
+
+    def _last_compute_is_current(self) -> bool:
+        """True if the 60 s tick would repeat the last pass."""
+        rt = self.runtime
+        return (
+            self.data is not None
+            and time.monotonic() - rt.compute_mono < IDLE_RECOMPUTE_MIN_S
+            and rt.compute_sig == self._source_signature()
+        )
+
     @property
     def forecast_provider(self) -> str:
         """Forecast provider ID (default: open_meteo)."""
@@ -1028,10 +1368,10 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ------------------------------------------------------------------
 
     async def async_start(self) -> None:
-        # Resolve the integration version without blocking the event loop.
+        # Resolve the integration version from the loader's cached manifest.
         global _INTEGRATION_VERSION
         if _INTEGRATION_VERSION == "unknown":
-            _INTEGRATION_VERSION = await self.hass.async_add_executor_job(_load_integration_version)
+            _INTEGRATION_VERSION = str((await async_get_integration(self.hass, DOMAIN)).version or "unknown")
 
         # Load persistent learning state from HA storage
         from homeassistant.helpers.storage import Store
@@ -1332,16 +1672,11 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             with contextlib.suppress(Exception):
                 u()
         self._unsubs.clear()
-        # Persist learning state one last time on clean shutdown
-        if self._learning_store is not None:
-            from .learning_state import async_save_learning
-
-            await async_save_learning(self._learning_store, self._learning_state)
-        # v1.7.1: persist rolling-window history + accumulators (issue #16).
-        # Clean restarts/upgrades go through here, so the windows survive.
-        if self._history_store is not None:
-            with contextlib.suppress(Exception):
-                await self._history_store.async_save(self._dump_history_state())
+        self._source_debouncer.async_shutdown()
+        # Persist learning state and (v1.7.1, issue #16) rolling-window history
+        # one last time. Clean restarts/upgrades go through here, so the
+        # windows survive.
+        await self._async_save_stores()
         # v2.0: remove MQTT Discovery entries on clean shutdown
         if self.mqtt_enabled and self._mqtt_discovery_published:
             from .mqtt_publisher import async_unpublish_discovery
@@ -1355,13 +1690,40 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     @callback
     def _handle_source_change(self, event) -> None:
+        # Attribute-only updates (same value and unit) cannot change any
+        # derived output; the 60 s tick still refreshes time-based windows.
+        old = event.data.get("old_state")
+        new = event.data.get("new_state")
+        if (
+            old is not None
+            and new is not None
+            and old.state == new.state
+            and old.attributes.get("unit_of_measurement") == new.attributes.get("unit_of_measurement")
+        ):
+            return
+        # The battery level feeds no derived value, so a battery-only update
+        # is patched into the last result instead of recomputing everything.
+        battery_eid = self.sources.get(SRC_BATTERY)
+        if battery_eid and event.data.get("entity_id") == battery_eid and new is not None and self.data:
+            data = WsData(self.data)
+            self._apply_battery(data, self._state_num(new))
+            self.async_set_updated_data(data)
+            return
+        self._source_debouncer.async_schedule_call()
+
+    @callback
+    def _run_compute(self) -> None:
         self.async_set_updated_data(self._compute())
 
     @callback
     def _handle_tick(self, _now) -> None:
+        if self._last_compute_is_current():
+            return
         self.async_set_updated_data(self._compute())
 
     async def _async_update_data(self) -> dict[str, Any]:
+        # No idle skip here: fetchers and the reset_rain service request a
+        # refresh after writing caches or state that no source State reflects.
         return self._compute()
 
     # ------------------------------------------------------------------
@@ -1369,42 +1731,109 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _append_and_prune_24h(history: deque, now: Any, value: float) -> None:
+    def _append_and_prune_24h(
+        history: deque, now: Any, value: float, merge: Callable[[float, float], float] | None = None
+    ) -> float:
+        """Append ``value`` and drop samples older than 24h; returns the sum of those dropped.
+
+        With ``merge``, samples are bucketed into 1-minute panes: a value that
+        falls in the same minute as the newest sample replaces it with
+        ``(now, merge(old, value))`` (the replaced value counts as dropped).
+        This caps the window at 1440 entries however fast the source reports.
+        """
+        evicted = 0.0
+        if merge is not None and history:
+            last_ts, last_v = history[-1]
+            if _same_pane(last_ts, now):
+                history.pop()
+                evicted = last_v
+                value = merge(last_v, value)
         history.append((now, value))
         cutoff = now - timedelta(hours=24)
         while history and history[0][0] < cutoff:
-            history.popleft()
+            evicted += history.popleft()[1]
+        return evicted
+
+    @staticmethod
+    def _track_extreme_24h(window: deque, now: Any, value: float, keep_max: bool) -> None:
+        """Monotonic-deque update so window[0] is the max (or min) of the last 24h.
+
+        An older sample that is no larger (no smaller) than the new one can never
+        be the extreme again, so it is dropped on push; each sample is pushed and
+        popped at most once instead of rescanning the whole window every tick.
+        Samples in the same 1-minute pane as the newest entry are folded into it
+        as ``(now, extreme)``, so the deque holds at most one entry per pane.
+        """
+        if window and _same_pane(window[-1][0], now):
+            _, last_v = window.pop()
+            value = max(last_v, value) if keep_max else min(last_v, value)
+        if keep_max:
+            while window and window[-1][1] <= value:
+                window.pop()
+        else:
+            while window and window[-1][1] >= value:
+                window.pop()
+        window.append((now, value))
+        cutoff = now - timedelta(hours=24)
+        while window[0][0] < cutoff:
+            window.popleft()
 
     @staticmethod
     def _rolling_values(history: deque) -> list[float]:
         return [v for _, v in history]
 
+    @staticmethod
+    def _push_rain_total(history: deque, now: Any, total: float, rise: float) -> float:
+        """Append a rain-counter reading to the 24h window; returns the updated rise sum.
+
+        ``rise`` is the running sum of positive steps between neighbouring
+        samples (what _rain_accum_24h_from_totals would return). Only the
+        pairs touched by the pane merge and the evictions are adjusted, so
+        the 24h accumulation costs O(1) per tick instead of a full walk.
+        """
+        if history:
+            last_ts, last_v = history[-1]
+            # Folding the newest reading into this one keeps the rise sum exact
+            # only if it lies between its neighbours (a -> b -> c then rises
+            # exactly as a -> c). A counter reset followed by new tips in the
+            # same minute (100 -> 0 -> 0.2) therefore keeps its low point.
+            prev_v = history[-2][1] if len(history) > 1 else math.inf
+            if _same_pane(last_ts, now) and min(prev_v, total) <= last_v <= max(prev_v, total):
+                history.pop()
+                if history:
+                    rise -= max(0.0, last_v - history[-1][1])
+            if history:
+                rise += max(0.0, total - history[-1][1])
+        history.append((now, total))
+        cutoff = now - timedelta(hours=24)
+        while history[0][0] < cutoff:
+            _, old = history.popleft()
+            rise -= max(0.0, history[0][1] - old)
+        # Restart from an exact zero whenever no pair is left, so rounding
+        # error in the running sum cannot build up across dry spells.
+        return rise if len(history) > 1 else 0.0
+
     @staticmethod
     def _rain_accum_24h_from_totals(history: deque) -> float:
-        vals = [v for _, v in history]
-        total = 0.0
-        for prev, cur in zip(vals, vals[1:], strict=False):
-            dv = cur - prev
-            if dv < -0.1:
-                dv = 0.0
-            if dv > 0:
-                total += dv
-        return total
+        # Only rises count: a drop (counter reset or jitter) contributes nothing.
+        return sum((cur - prev for (_, prev), (_, cur) in pairwise(history) if cur > prev), 0.0)
 
     @staticmethod
     def _rain_accum_window_from_totals(history: deque, now: Any, window_h: float) -> float:
-        """Rain accumulation over a sliding window (e.g. 1h)."""
-        from datetime import timedelta
+        """Rain accumulation over a sliding window (e.g. 1h).
 
+        Walks the history newest-first and stops at the first sample older than
+        the window, so only the in-window tail is visited.
+        """
         cutoff = now - timedelta(hours=window_h)
-        vals = [(ts, v) for ts, v in history if ts >= cutoff]
         total = 0.0
-        for (_, prev), (_, cur) in zip(vals, vals[1:], strict=False):
-            dv = cur - prev
-            if dv < -0.1:
-                dv = 0.0
-            if dv > 0:
-                total += dv
+        later = None
+        for ts, v in reversed(history):
+            if ts < cutoff:
+                break
+            if later is not None and later > v:
+                total += later - v
+            later = v
         return total
 
     # ------------------------------------------------------------------
@@ -1422,7 +1851,11 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _num(hass: HomeAssistant, eid: str | None) -> float | None:
         if not eid:
             return None
-        st = hass.states.get(eid)
+        return WSStationCoordinator._state_num(hass.states.get(eid))
+
+    @staticmethod
+    def _state_num(st: Any) -> float | None:
+        """Finite float value of a State object, or None."""
         if st is None:
             return None
         try:
@@ -1433,43 +1866,40 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return None
         return v
 
+    @staticmethod
+    def _apply_battery(data: dict, bat_raw: float | None) -> None:
+        if bat_raw is None:
+            data.pop(KEY_BATTERY_PCT, None)
+            data.pop(KEY_BATTERY_DISPLAY, None)
+            return
+        data[KEY_BATTERY_PCT] = round(bat_raw)
+        data[KEY_BATTERY_DISPLAY] = f"{int(bat_raw)}%"
+
+    @staticmethod
+    def _apply_sea_temp(data: dict, cache: dict[str, Any]) -> None:
+        data[KEY_SEA_SURFACE_TEMP] = cache.get("current_c")
+        data["_sea_temp_comfort"] = cache.get("comfort")
+        data["_sea_temp_hourly"] = cache.get("hourly")
+        data["_sea_temp_grid_lat"] = cache.get("grid_lat")
+        data["_sea_temp_grid_lon"] = cache.get("grid_lon")
+        data["_sea_temp_disclaimer"] = cache.get("disclaimer")
+
     @staticmethod
     def _to_celsius(v: float, unit: str) -> float:
-        u = unit.lower().replace(" ", "")
-        if u in ("f", "\u00b0f") or ("f" in u and "\u00b0" in u):
-            return (v - 32.0) * 5.0 / 9.0
-        if u in ("k", "kelvin"):
-            return v - 273.15
-        return v
+        a, b = _temp_coeffs(unit)
+        return a * v + b
 
     @staticmethod
     def _to_ms(v: float, unit: str) -> float:
-        u = unit.lower().replace(" ", "")
-        if u in ("km/h", "kmh", "kph"):
-            return v / 3.6
-        if u == "mph":
-            return v * 0.44704
-        if u in ("kn", "knot", "knots"):
-            return v * 0.514444
-        return v
+        return v * _SPEED_TO_MS.get(_norm_unit(unit), 1.0)
 
     @staticmethod
     def _to_hpa(v: float, unit: str) -> float:
-        u = unit.lower().replace(" ", "")
-        if u == "pa":
-            return v / 100.0
-        if u == "inhg":
-            return v * 33.8638866667
-        if u in ("mmhg", "torr"):
-            return v * 1.33322
-        return v
+        return v * _PRESSURE_TO_HPA.get(_norm_unit(unit), 1.0)
 
     @staticmethod
     def _to_mm(v: float, unit: str) -> float:
-        u = unit.lower().replace(" ", "")
-        if u in ("in", "inch", "inches"):
-            return v * 25.4
-        return v
+        return v * _LENGTH_TO_MM.get(_norm_unit(unit), 1.0)
 
     # ------------------------------------------------------------------
     # Sensor quality / physics validation
@@ -1503,36 +1933,43 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _compute_raw_readings(self, data: dict, now: Any) -> tuple[float | None, ...]:
         """Read and unit-convert all source sensors."""
-        hass = self.hass
+        # Snapshot every mapped source state once; num() and uom() for the same
+        # key then share a single state-machine lookup.
+        get_state = self.hass.states.get
+        states = {key: get_state(eid) for key, eid in self.sources.items() if eid}
+        state_num = self._state_num
 
         def num(key: str) -> float | None:
-            return self._num(hass, self.sources.get(key))
+            return state_num(states.get(key))
 
         def uom(key: str) -> str:
-            return self._uom(hass, self.sources.get(key))
+            st = states.get(key)
+            return str(st.attributes.get("unit_of_measurement") or "") if st else ""
+
+        cal_temp_c, cal_humidity, cal_pressure_hpa, cal_wind_ms = self._calibration
 
         t_raw = num(SRC_TEMP)
         tc = round(self._to_celsius(t_raw, uom(SRC_TEMP)), 2) if t_raw is not None else None
         if tc is not None:
-            tc = round(tc + float(self.entry_options.get("cal_temp_c", 0.0)), 2)
+            tc = round(tc + cal_temp_c, 2)
             data[KEY_NORM_TEMP_C] = tc
 
         h_raw = num(SRC_HUM)
         rh = round(h_raw, 2) if h_raw is not None else None
         if rh is not None:
-            rh = round(max(0.0, min(100.0, rh + float(self.entry_options.get("cal_humidity", 0.0)))), 2)
+            rh = round(max(0.0, min(100.0, rh + cal_humidity)), 2)
             data[KEY_NORM_HUMIDITY] = rh
 
         p_raw = num(SRC_PRESS)
         pressure_hpa = round(self._to_hpa(p_raw, uom(SRC_PRESS)), 2) if p_raw is not None else None
         if pressure_hpa is not None:
-            pressure_hpa = round(pressure_hpa + float(self.entry_options.get("cal_pressure_hpa", 0.0)), 2)
+            pressure_hpa = round(pressure_hpa + cal_pressure_hpa, 2)
             data[KEY_NORM_PRESSURE_HPA] = pressure_hpa
 
         ws_raw = num(SRC_WIND)
         wind_ms = round(self._to_ms(ws_raw, uom(SRC_WIND)), 2) if ws_raw is not None else None
         if wind_ms is not None:
-            wind_ms = round(max(0.0, wind_ms + float(self.entry_options.get("cal_wind_ms", 0.0))), 2)
+            wind_ms = round(max(0.0, wind_ms + cal_wind_ms), 2)
             data[KEY_NORM_WIND_SPEED_MS] = wind_ms
 
         wg_raw = num(SRC_GUST)
@@ -1560,15 +1997,12 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if uv is not None:
             data[KEY_UV] = uv
 
-        bat_raw = num(SRC_BATTERY)
-        if bat_raw is not None:
-            data[KEY_BATTERY_PCT] = round(bat_raw)
-            data[KEY_BATTERY_DISPLAY] = f"{int(bat_raw)}%"
+        self._apply_battery(data, num(SRC_BATTERY))
 
         # Optional: external dew point sensor
         dp_ext = num(SRC_DEW_POINT)
         if dp_ext is not None:
-            dp_c = round(self._to_celsius(dp_ext, self._uom(hass, self.sources.get(SRC_DEW_POINT))), 2)
+            dp_c = round(self._to_celsius(dp_ext, uom(SRC_DEW_POINT)), 2)
             data[KEY_DEW_POINT_C] = dp_c
 
         # Optional: soil moisture sensor (normalize 0-1 volumetric to 0-100%)
@@ -1580,7 +2014,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Optional: soil temperature sensor (unit-detected conversion to °C)
         soil_t_raw = num(SRC_SOIL_TEMP)
         if soil_t_raw is not None:
-            soil_tc = round(self._to_celsius(float(soil_t_raw), self._uom(hass, self.sources.get(SRC_SOIL_TEMP))), 2)
+            soil_tc = round(self._to_celsius(float(soil_t_raw), uom(SRC_SOIL_TEMP)), 2)
             data[KEY_SOIL_TEMP_C] = soil_tc
 
         return tc, rh, pressure_hpa, wind_ms, gust_ms, wind_dir, rain_total_mm, lux, uv
@@ -1622,12 +2056,13 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # 24h rolling stats
         if tc is not None:
-            self._append_and_prune_24h(rt.temp_history_24h, now, float(tc))
+            rt.temp_sum_24h += float(tc) - self._append_and_prune_24h(rt.temp_history_24h, now, float(tc), _keep_latest)
+            self._track_extreme_24h(rt.temp_max_24h, now, float(tc), True)
+            self._track_extreme_24h(rt.temp_min_24h, now, float(tc), False)
         if rt.temp_history_24h:
-            temps = self._rolling_values(rt.temp_history_24h)
-            data[KEY_TEMP_HIGH_24H] = round(max(temps), 1)
-            data[KEY_TEMP_LOW_24H] = round(min(temps), 1)
-            data[KEY_TEMP_AVG_24H] = round(sum(temps) / len(temps), 1)
+            data[KEY_TEMP_HIGH_24H] = round(rt.temp_max_24h[0][1], 1)
+            data[KEY_TEMP_LOW_24H] = round(rt.temp_min_24h[0][1], 1)
+            data[KEY_TEMP_AVG_24H] = round(rt.temp_sum_24h / len(rt.temp_history_24h), 1)
 
         # Display strings
         if tc is not None:
@@ -1699,10 +2134,15 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return dew_c
 
     def _compute_derived_pressure(
-        self, data: dict, now: Any, tc: float | None, pressure_hpa: float | None, rh: float | None
+        self,
+        data: dict,
+        now: Any,
+        tc: float | None,
+        pressure_hpa: float | None,
+        rh: float | None,
+        wind_quad: str | None = None,
     ) -> tuple[float, float]:
         """MSLP, pressure history, trend, Zambretti. Returns (trend_3h, mslp_or_0)."""
-        from .algorithms import calculate_sea_level_pressure
 
         rt = self.runtime
 
@@ -1713,6 +2153,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             rt.last_mslp = mslp
 
         # Pressure history (sampled every PRESSURE_HISTORY_INTERVAL_MIN minutes)
+        trend_3h = 0.0
         if pressure_hpa is not None:
             if rt.pressure_history_ts is None:
                 rt.pressure_history.append(float(pressure_hpa))
@@ -1724,16 +2165,20 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     rt.pressure_history_ts = now
 
             if len(rt.pressure_history) >= 2:
-                trend_3h = least_squares_pressure_trend(list(rt.pressure_history))
-                data[KEY_PRESSURE_TREND_HPAH] = trend_3h
-                data[KEY_PRESSURE_CHANGE_WINDOW_HPA] = round(rt.pressure_history[-1] - rt.pressure_history[0], 2)
+                # The history only grows every PRESSURE_HISTORY_INTERVAL_MIN, so
+                # refit when a new sample (or a restored history) is present.
+                if rt.trend_fit_ts != rt.pressure_history_ts:
+                    rt.last_trend_3h = least_squares_pressure_trend(rt.pressure_history)
+                    rt.last_trend_change_hpa = round(rt.pressure_history[-1] - rt.pressure_history[0], 2)
+                    rt.trend_fit_ts = rt.pressure_history_ts
+                trend_3h = rt.last_trend_3h
+                data[KEY_PRESSURE_CHANGE_WINDOW_HPA] = rt.last_trend_change_hpa
             else:
-                data[KEY_PRESSURE_TREND_HPAH] = 0.0
                 data[KEY_PRESSURE_CHANGE_WINDOW_HPA] = 0.0
+            data[KEY_PRESSURE_TREND_HPAH] = trend_3h
 
-        trend_3h: float = data.get(KEY_PRESSURE_TREND_HPAH, 0.0)
-        data[KEY_PRESSURE_TREND_DISPLAY] = pressure_trend_display(float(trend_3h))
-        data["_pressure_trend_arrow"] = pressure_trend_arrow(float(trend_3h))
+        data[KEY_PRESSURE_TREND_DISPLAY] = pressure_trend_display(trend_3h)
+        data["_pressure_trend_arrow"] = pressure_trend_arrow(trend_3h)
         # Color ramp: rising=green, steady=white/grey, falling=amber/red
         _pt_color: str
         if trend_3h >= 0.8:
@@ -1747,22 +2192,38 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data["_pressure_trend_color"] = _pt_color
 
         # Zambretti forecast (real N&Z lookup table)
-        wind_quad = data.get(KEY_WIND_QUADRANT, "N")
+        wind_quad = wind_quad or "N"
         if mslp is not None and rh is not None:
-            forecast_text, z_number = zambretti_forecast(
-                mslp=mslp,
-                pressure_trend_3h=float(trend_3h),
-                wind_quadrant=str(wind_quad),
-                humidity=float(rh),
-                month=dt_util.now().month,
-                hemisphere=self.hemisphere,
-                climate=self.climate_region,
-                # v0.3.0: pass wind_speed_ms so the function can suppress
-                # wind direction influence at very low wind speeds, and
-                # pass rain_24h_mm so it can apply the dry-fair sanity guard.
-                wind_speed_ms=data.get(KEY_NORM_WIND_SPEED_MS),
-                rain_24h_mm=data.get(KEY_RAIN_ACCUM_24H),
+            # Inputs are already rounded upstream and change slowly, so the
+            # lookup is only redone when one of them actually moves.
+            z_key = (
+                mslp,
+                float(trend_3h),
+                str(wind_quad),
+                float(rh),
+                dt_util.as_local(now).month,
+                self.hemisphere,
+                self.climate_region,
+                data.get(KEY_NORM_WIND_SPEED_MS),
+                data.get(KEY_RAIN_ACCUM_24H),
             )
+            if z_key != rt.zambretti_key or rt.zambretti_result is None:
+                rt.zambretti_result = zambretti_forecast(
+                    mslp=mslp,
+                    pressure_trend_3h=z_key[1],
+                    wind_quadrant=z_key[2],
+                    humidity=z_key[3],
+                    month=z_key[4],
+                    hemisphere=self.hemisphere,
+                    climate=self.climate_region,
+                    # v0.3.0: pass wind_speed_ms so the function can suppress
+                    # wind direction influence at very low wind speeds, and
+                    # pass rain_24h_mm so it can apply the dry-fair sanity guard.
+                    wind_speed_ms=z_key[7],
+                    rain_24h_mm=z_key[8],
+                )
+                rt.zambretti_key = z_key
+            forecast_text, z_number = rt.zambretti_result
             data[KEY_ZAMBRETTI_FORECAST] = forecast_text
             data[KEY_ZAMBRETTI_NUMBER] = z_number
         else:
@@ -1773,22 +2234,19 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _compute_derived_wind(
         self, data: dict, now: Any, wind_ms: float | None, gust_ms: float | None, wind_dir: float | None
-    ) -> None:
-        """Beaufort, quadrant, smoothed direction, 24h gust max."""
+    ) -> str | None:
+        """Beaufort, quadrant, smoothed direction, 24h gust max. Returns the quadrant."""
         rt = self.runtime
 
+        quadrant: str | None = None
         if wind_dir is not None:
             if rt.smoothed_wind_dir is None:
                 rt.smoothed_wind_dir = float(wind_dir)
             else:
-                rt.smoothed_wind_dir = smooth_wind_direction(
-                    float(wind_dir), rt.smoothed_wind_dir, alpha=WIND_SMOOTH_ALPHA
-                )
+                rt.smoothed_wind_dir = smooth_wind_direction(float(wind_dir), rt.smoothed_wind_dir)
             data[KEY_WIND_DIR_SMOOTH_DEG] = rt.smoothed_wind_dir
-
-        smooth_dir = data.get(KEY_WIND_DIR_SMOOTH_DEG, wind_dir)
-        if smooth_dir is not None:
-            data[KEY_WIND_QUADRANT] = direction_to_quadrant(float(smooth_dir))
+            quadrant = direction_to_quadrant(rt.smoothed_wind_dir)
+            data[KEY_WIND_QUADRANT] = quadrant
 
         if wind_ms is not None:
             bft = wind_speed_to_beaufort(float(wind_ms))
@@ -1796,11 +2254,10 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             data[KEY_WIND_BEAUFORT_DESC] = beaufort_description(bft)
 
         if gust_ms is not None:
-            self._append_and_prune_24h(rt.gust_history_24h, now, float(gust_ms))
-        if rt.gust_history_24h:
-            gust_vals = self._rolling_values(rt.gust_history_24h)
-            if gust_vals:
-                data[KEY_WIND_GUST_MAX_24H] = round(max(gust_vals), 1)
+            self._append_and_prune_24h(rt.gust_history_24h, now, float(gust_ms), max)
+            self._track_extreme_24h(rt.gust_max_24h, now, float(gust_ms), True)
+        if rt.gust_max_24h:
+            data[KEY_WIND_GUST_MAX_24H] = round(rt.gust_max_24h[0][1], 1)
 
         # v2.0 wind gust factor
         if wind_ms is not None and gust_ms is not None:
@@ -1810,7 +2267,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # v2.0 dominant wind direction + variability (24h circular stats)
         if wind_dir is not None:
-            self._append_and_prune_24h(self._wind_dir_history_24h, now, float(wind_dir))
+            self._append_and_prune_24h(self._wind_dir_history_24h, now, float(wind_dir), _keep_latest)
         if self._wind_dir_history_24h:
             dir_vals = [v for _, v in self._wind_dir_history_24h]
             dom = calculate_dominant_wind_direction(dir_vals)
@@ -1820,39 +2277,43 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if var is not None:
                 data[KEY_WIND_DIR_VARIABILITY] = var
 
+        return quadrant
+
     def _compute_derived_precipitation(self, data: dict, now: Any, rain_total_mm: float | None) -> float:
         """Rain rate (Kalman-filtered), rain display. Returns rain_rate (filtered)."""
         rt = self.runtime
 
+        rain_rate = 0.0
         if rain_total_mm is not None:
-            self._append_and_prune_24h(rt.rain_total_history_24h, now, float(rain_total_mm))
+            rt.rain_rise_24h = self._push_rain_total(
+                rt.rain_total_history_24h, now, float(rain_total_mm), rt.rain_rise_24h
+            )
 
             if rt.last_rain_total_mm is None or rt.last_rain_ts is None:
                 rt.last_rain_total_mm = float(rain_total_mm)
                 rt.last_rain_ts = now
-                data[KEY_RAIN_RATE_FILT] = 0.0
             else:
                 dv = float(rain_total_mm) - float(rt.last_rain_total_mm)
                 dt_h = max(1e-6, (now - rt.last_rain_ts).total_seconds() / 3600.0)
                 if dv < -0.1:
                     dv = 0.0
                 raw = max(0.0, min(dv / dt_h, RAIN_RATE_PHYSICAL_CAP_MMPH))
-                filtered = rt.kalman.update(raw)
+                rain_rate = rt.kalman.update(raw)
                 rt.last_rain_total_mm = float(rain_total_mm)
                 rt.last_rain_ts = now
-                data[KEY_RAIN_RATE_FILT] = filtered
+            data[KEY_RAIN_RATE_FILT] = rain_rate
 
-        rain_rate: float = data.get(KEY_RAIN_RATE_FILT, 0.0)
         data[KEY_RAIN_DISPLAY] = format_rain_display(float(rain_rate))
 
         # Rain accumulations (1h / 24h)
         if rt.rain_total_history_24h:
             data[KEY_RAIN_ACCUM_1H] = round(self._rain_accum_window_from_totals(rt.rain_total_history_24h, now, 1.0), 1)
-            data[KEY_RAIN_ACCUM_24H] = round(self._rain_accum_24h_from_totals(rt.rain_total_history_24h), 1)
+            data[KEY_RAIN_ACCUM_24H] = round(max(0.0, rt.rain_rise_24h), 1)
 
         # Rain today - resets at local midnight (use local time, not UTC)
         rain_total_mm: float | None = data.get(KEY_NORM_RAIN_TOTAL_MM)
-        date_str = dt_util.now().strftime("%Y-%m-%d")
+        now_local = dt_util.as_local(now)
+        date_str = now_local.date().isoformat()
         if date_str != self._rain_today_date:
             # Day rolled over - snapshot the day that just ended (with its final
             # rain total) so streak counters can evaluate the completed day
@@ -1877,7 +2338,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             rt.last_rain_event_ts = now
 
         # v2.0 — Weekly / monthly / yearly rain accumulators
-        now_local = dt_util.now()
         iso_week = now_local.strftime("%G-W%V")  # ISO 8601 week (Mon start)
         month_key = now_local.strftime("%Y-%m")
         year_key = now_local.strftime("%Y")
@@ -1925,12 +2385,31 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data[KEY_RAIN_THIS_YEAR_MM] = round(self._rain_this_year_mm, 1)
 
         # v2.0 — Max rain rate in rolling 24h window
-        self._append_and_prune_24h(self._rain_rate_history_24h, now, float(rain_rate))
+        self._append_and_prune_24h(self._rain_rate_history_24h, now, float(rain_rate), max)
         if self._rain_rate_history_24h:
             data[KEY_RAIN_RATE_MAX_24H] = round(max(v for _, v in self._rain_rate_history_24h), 1)
 
         return rain_rate
 
+    def _sun_position(self) -> tuple[float, float, bool] | None:
+        """(elevation, azimuth, is_day) from sun.sun, or None without it.
+
+        HA replaces a state object whenever the entity changes, so the parsed
+        tuple is reused for as long as the same object is current.
+        """
+        st = self.hass.states.get("sun.sun")
+        if st is None:
+            return None
+        rt = self.runtime
+        if st is not rt.sun_state:
+            rt.sun_position = (
+                float(st.attributes.get("elevation", 0)),
+                float(st.attributes.get("azimuth", 180)),
+                st.state == "above_horizon",
+            )
+            rt.sun_state = st
+        return rt.sun_position
+
     def _compute_condition(
         self,
         data: dict,
@@ -1944,53 +2423,45 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         uv: float | None,
     ) -> str:
         """Determine current weather condition (36-condition classifier)."""
-        sun_state = self.hass.states.get("sun.sun")
-        sun_elev = 0.0
-        sun_azimuth = 180.0
-        is_day = True
-        if sun_state:
-            sun_elev = float(sun_state.attributes.get("elevation", 0))
-            sun_azimuth = float(sun_state.attributes.get("azimuth", 180))
-            is_day = sun_state.state == "above_horizon"
+        sun_elev, sun_azimuth, is_day = self._sun_position() or (0.0, 180.0, True)
 
         if tc is None or rh is None:
             return "sunny" if is_day else "clear-night"
 
-        condition = determine_current_condition(
-            temp_c=float(tc),
-            humidity=float(rh),
-            wind_speed_ms=float(wind_ms or 0),
-            wind_gust_ms=float(gust_ms or 0),
-            rain_rate_mmph=float(rain_rate),
-            dew_point_c=float(dew_c or 0),
-            illuminance_lx=float(lux or 50000),
-            uv_index=float(uv or 0),
-            zambretti=str(data.get(KEY_ZAMBRETTI_FORECAST, "")),
-            pressure_trend=float(data.get(KEY_PRESSURE_TREND_HPAH, 0)),
-            sun_elevation=sun_elev,
-            sun_azimuth=sun_azimuth,
-            is_day=is_day,
+        # Readings are already floats from _compute_raw_readings; only the
+        # missing ones need a default. A genuine 0 reading (calm wind, dark
+        # lux sensor) is kept as 0 rather than replaced by the default.
+        # Station readings arrive at a fixed resolution, so most ticks repeat
+        # an input tuple already seen and skip the classifier entirely.
+        condition, icon, color, description, severity = _classify_condition(
+            datetime.now().hour,
+            tc,
+            rh,
+            wind_ms if wind_ms is not None else 0.0,
+            gust_ms if gust_ms is not None else 0.0,
+            rain_rate,
+            dew_c if dew_c is not None else 0.0,
+            lux if lux is not None else 50000.0,
+            uv if uv is not None else 0.0,
+            data.get(KEY_ZAMBRETTI_FORECAST, ""),
+            data.get(KEY_PRESSURE_TREND_HPAH, 0.0),
+            sun_elev,
+            sun_azimuth,
+            is_day,
         )
         data[KEY_CURRENT_CONDITION] = condition
-        data["_condition_icon"] = CONDITION_ICONS.get(condition, "mdi:weather-partly-cloudy")
-        data["_condition_color"] = CONDITION_COLORS.get(condition, "#FCD34D")
-        data["_condition_description"] = CONDITION_DESCRIPTIONS.get(condition, condition)
-        data["_condition_severity"] = get_condition_severity(condition)
+        data["_condition_icon"] = icon
+        data["_condition_color"] = color
+        data["_condition_description"] = description
+        data["_condition_severity"] = severity
         return condition
 
-    def _compute_rain_probability(self, data: dict, mslp: float, trend_3h: float, rh: float | None) -> None:
+    def _compute_rain_probability(
+        self, data: dict, mslp: float, trend_3h: float, rh: float | None, local_hour: int
+    ) -> None:
         """Local + API-blended rain probability."""
         wind_quad = data.get(KEY_WIND_QUADRANT, "N")
         if mslp and rh is not None:
-            local_prob = calculate_rain_probability(
-                mslp=float(mslp),
-                pressure_trend=float(trend_3h),
-                humidity=float(rh),
-                wind_quadrant=str(wind_quad),
-                climate_region=self.climate_region,
-            )
-            data[KEY_RAIN_PROBABILITY] = local_prob
-
             api_prob = None
             fc = getattr(self, "_forecast_cache", None)
             if fc and fc.get("daily"):
@@ -2001,13 +2472,18 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             outcomes = self._learning_state.forecast_outcomes
             learned_local = self._learning_state.blend_local if len(outcomes) >= 10 else None
             learned_api = self._learning_state.blend_openmeteo if len(outcomes) >= 10 else None
-            combined = combine_rain_probability(
-                local_prob,
+            local_prob, combined = _rain_probabilities(
+                float(mslp),
+                float(trend_3h),
+                float(rh),
+                str(wind_quad),
+                self.climate_region,
                 api_prob,
-                dt_util.now().hour,
-                learned_local_w=learned_local,
-                learned_api_w=learned_api,
+                local_hour,
+                learned_local,
+                learned_api,
             )
+            data[KEY_RAIN_PROBABILITY] = local_prob
             data[KEY_RAIN_PROBABILITY_COMBINED] = combined
 
     def _compute_forecast_agreement(self, data: dict) -> None:
@@ -2071,8 +2547,8 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not self.degree_days_enabled or tc is None:
             return
 
-        date_str = dt_util.now().strftime("%Y-%m-%d")
-        now_local = dt_util.now()
+        now_local = dt_util.as_local(now)
+        date_str = now_local.date().isoformat()
 
         # --- HDD today (rolling mean of per-sample contributions) ---
         hdd_contrib = calculate_hdd_contribution(float(tc), self._hdd_base_c)
@@ -2176,7 +2652,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data[KEY_ET0_HOURLY_MM] = et0_hourly_estimate(et0_daily, now.hour)
 
         # v2.0 Max theoretical (clear-sky) solar radiation
-        doy = now.timetuple().tm_yday
         max_solar = calculate_max_solar_radiation(lat_f, doy, self.elevation_m)
         data[KEY_MAX_SOLAR_RADIATION] = max_solar
 
@@ -2187,8 +2662,8 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # v2.0 Solar energy accumulation (Wh/m²) — requires solar radiation sensor
         solar_rad = self._get_solar_radiation()
         if solar_rad is not None:
-            now_local = dt_util.now()
-            solar_date = now_local.strftime("%Y-%m-%d")
+            now_local = dt_util.as_local(now)
+            solar_date = now_local.date().isoformat()
             if solar_date != self._solar_energy_date:
                 self._solar_energy_today_whm2 = 0.0
                 self._solar_energy_date = solar_date
@@ -2350,14 +2825,20 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             async with session.get(url, timeout=15) as resp:
                 if resp.status != 200:
                     return
-                payload = await resp.json()
+                payload = await resp.json(loads=json_loads)
             current = payload.get("current", {})
-            self._neighbor_qc_cache = {
-                "temp_c": current.get("temperature_2m"),
-                "humidity": current.get("relative_humidity_2m"),
-                "pressure_hpa": current.get("surface_pressure"),
-                "fetched_at": dt_util.utcnow().isoformat(),
+            # Coerce once here; _compute_neighbor_qc compares against these
+            # on every tick until the next hourly fetch.
+            cache: dict[str, Any] = {
+                key: float(v) if (v := current.get(src_key)) is not None else None
+                for key, src_key in (
+                    ("temp_c", "temperature_2m"),
+                    ("humidity", "relative_humidity_2m"),
+                    ("pressure_hpa", "surface_pressure"),
+                )
             }
+            cache["fetched_at"] = dt_util.utcnow().isoformat()
+            self._neighbor_qc_cache = cache
         except Exception:  # noqa: BLE001
             pass  # QC is advisory; never block main flow
 
@@ -2373,15 +2854,15 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             nwp_rh = cache.get("humidity")
             nwp_press = cache.get("pressure_hpa")
             if local_tc is not None and nwp_tc is not None:
-                delta_t = abs(float(local_tc) - float(nwp_tc))
+                delta_t = abs(local_tc - nwp_tc)
                 if delta_t > 8.0:
                     flags.append(f"temperature: local {local_tc:.1f}°C vs NWP {nwp_tc:.1f}°C (Δ={delta_t:.1f}°C > 8°C)")
             if local_rh is not None and nwp_rh is not None:
-                delta_rh = abs(float(local_rh) - float(nwp_rh))
+                delta_rh = abs(local_rh - nwp_rh)
                 if delta_rh > 25.0:
                     flags.append(f"humidity: local {local_rh:.0f}% vs NWP {nwp_rh:.0f}% (Δ={delta_rh:.0f}% > 25%)")
             if local_press is not None and nwp_press is not None:
-                delta_p = abs(float(local_press) - float(nwp_press))
+                delta_p = abs(local_press - nwp_press)
                 if delta_p > 15.0:
                     flags.append(
                         f"pressure: local {local_press:.1f} hPa vs NWP {nwp_press:.1f} hPa (Δ={delta_p:.1f} > 15 hPa)"
@@ -2448,12 +2929,9 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data["_pressure_stuck"] = SRC_PRESS in stuck_flags
 
         # Per-sensor out-of-range from quality flags (parse the existing list)
-        quality_flags = data.get(KEY_SENSOR_QUALITY_FLAGS) or []
-        data["_temp_out_of_range"] = any("temperature" in f.lower() and "outside" in f.lower() for f in quality_flags)
-        data["_humidity_out_of_range"] = any("humidity" in f.lower() and "outside" in f.lower() for f in quality_flags)
-        data["_pressure_out_of_range"] = any("pressure" in f.lower() and "outside" in f.lower() for f in quality_flags)
-        data["_wind_gust_below_wind"] = any("gust" in f.lower() and "below" in f.lower() for f in quality_flags)
-        data["_dew_exceeds_temp"] = any("dew" in f.lower() and "exceeds" in f.lower() for f in quality_flags)
+        lowered = [f.lower() for f in data.get(KEY_SENSOR_QUALITY_FLAGS) or ()]
+        for flag_key, subject, verdict in _QUALITY_FLAG_MARKERS:
+            data[flag_key] = any(subject in f and verdict in f for f in lowered)
 
         # Score: start at 100, deduct for issues
         score = 100
@@ -2557,18 +3035,25 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _compute_health(self, data: dict, now: Any, missing: list, missing_entities: list) -> None:
         """Staleness, package status, data quality, configurable alerts."""
         stale = []
-        for k, eid in self.sources.items():
+        sources = self.sources
+        get_state = self.hass.states.get
+        deadlines = self.runtime.stale_deadlines
+        # Only check frequently-updating core sensors for staleness.
+        # Exclude rain_total (static when dry), UV (zero at night), battery
+        # (slow-reporting), etc.
+        for k in STALENESS_CHECK_SOURCES:
+            eid = sources.get(k)
             if not eid:
                 continue
-            # Only check frequently-updating core sensors for staleness.
-            # Exclude rain_total (static when dry), UV (zero at night), battery
-            # (slow-reporting), etc.
-            if k not in STALENESS_CHECK_SOURCES:
-                continue
-            st = self.hass.states.get(eid)
+            st = get_state(eid)
             if st is None:
                 continue
-            if (now - st.last_updated).total_seconds() > self.staleness_s:
+            # A state object is replaced on every update, so its stale-after
+            # time only needs working out once per object.
+            cached = deadlines.get(k)
+            if cached is None or cached[0] is not st:
+                cached = deadlines[k] = (st, st.last_updated + timedelta(seconds=self.staleness_s))
+            if now > cached[1]:
                 stale.append(k)
 
         n_unavailable = len(missing_entities)
@@ -2583,15 +3068,8 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if n_healthy >= 1
             else "stale"
         )
-        health_color = {
-            "online": "rgba(74,222,128,0.8)",
-            "degraded": "rgba(251,191,36,0.9)",
-            "stale": "rgba(249,115,22,0.9)",
-            "offline": "rgba(239,68,68,0.9)",
-        }.get(station_health, "rgba(239,68,68,0.9)")
-
         data[KEY_HEALTH_DISPLAY] = station_health
-        data["_health_color"] = health_color
+        data["_health_color"] = _HEALTH_COLOR[station_health]
 
         ok = not missing and not missing_entities
         parts: list[str] = []
@@ -2613,10 +3091,9 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data[KEY_DATA_QUALITY] = dq
 
         # Configurable alerts with hysteresis to prevent chatty automations
-        gust_thr = float(self.entry_options.get(CONF_THRESH_WIND_GUST_MS, DEFAULT_THRESH_WIND_GUST_MS))
-        rain_thr = float(self.entry_options.get(CONF_THRESH_RAIN_RATE_MMPH, DEFAULT_THRESH_RAIN_RATE_MMPH))
-        freeze_thr = float(self.entry_options.get(CONF_THRESH_FREEZE_C, DEFAULT_THRESH_FREEZE_C))
+        gust_thr, rain_thr, freeze_thr = self._alert_thresholds
 
+        # Normalized readings are already floats (rounded in _compute_raw_readings)
         gust_ms = data.get(KEY_NORM_WIND_GUST_MS)
         rain_rate = data.get(KEY_RAIN_RATE_FILT) or 0.0
         tc = data.get(KEY_NORM_TEMP_C)
@@ -2625,27 +3102,27 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Raw trigger flags \u2014 one per alert type (before hysteresis)
         raw_triggers: dict[str, dict] = {}
-        if gust_ms is not None and float(gust_ms) >= gust_thr:
+        if gust_ms is not None and gust_ms >= gust_thr:
             raw_triggers["wind"] = {
                 "type": "wind",
                 "severity": "warning",
-                "message": localize.alert(lang, "wind", v=f"{float(gust_ms):.1f}"),
+                "message": localize.alert(lang, "wind", v=f"{gust_ms:.1f}"),
                 "icon": "mdi:weather-windy",
                 "color": "rgba(239,68,68,0.9)",
             }
-        if float(rain_rate) >= rain_thr:
+        if rain_rate >= rain_thr:
             raw_triggers["rain"] = {
                 "type": "rain",
                 "severity": "warning",
-                "message": localize.alert(lang, "rain", v=f"{float(rain_rate):.1f}"),
+                "message": localize.alert(lang, "rain", v=f"{rain_rate:.1f}"),
                 "icon": "mdi:weather-pouring",
                 "color": "rgba(59,130,246,0.9)",
             }
-        if tc is not None and float(tc) <= freeze_thr:
+        if tc is not None and tc <= freeze_thr:
             raw_triggers["freeze"] = {
                 "type": "freeze",
                 "severity": "advisory",
-                "message": localize.alert(lang, "freeze", v=f"{float(tc):.1f}"),
+                "message": localize.alert(lang, "freeze", v=f"{tc:.1f}"),
                 "icon": "mdi:snowflake-alert",
                 "color": "rgba(147,197,253,0.9)",
             }
@@ -2690,8 +3167,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # HA Repairs integration: create/clear issues for missing sources
         if HAS_REPAIRS:
-            from .const import DOMAIN
-
             if self.suppress_notifications:
                 # User has disabled notifications - clear any existing issues immediately
                 ir.async_delete_issue(self.hass, DOMAIN, "missing_source_entities")
@@ -2793,10 +3268,8 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         v0.3.0: precipitation_type removed (was redundant with rain_rate +
         temperature; trivially derivable in dashboard if needed).
         """
-        sun_state = self.hass.states.get("sun.sun")
-        is_day = True
-        if sun_state:
-            is_day = sun_state.state == "above_horizon"
+        sun = self._sun_position()
+        is_day = sun[2] if sun else True
         is_night = not is_day
 
         # ── Fog probability ────────────────────────────────────────────────
@@ -2880,8 +3353,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         was removed in v0.3.0 because the baselines were never properly seeded
         (they reset to install date rather than Jan 1 / season start).
         """
-        from .learning_state import update_daily_streaks
-
         t_high = data.get(KEY_TEMP_HIGH_24H)
         t_low = data.get(KEY_TEMP_LOW_24H)
 
@@ -2913,8 +3384,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             self._learning_state.streak_last_counted_date = prev_date
             # Also update climatology (30-day rolling buffer for anomalies)
-            from .learning_state import update_climatology
-
             update_climatology(self._learning_state, prev_date, float(t_high), float(t_low), rain_completed)
 
         # Publish streak counters
@@ -2931,8 +3400,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _compute_climatology(self, data: dict) -> None:
         """Publish rolling 30-day stats and today-vs-normal anomalies."""
-        from .learning_state import climatology_stats, climatology_stats_by_window
-
         stats = climatology_stats(self._learning_state)
         if stats is None:
             data[KEY_CLIMATOLOGY_30D] = "building"
@@ -3166,14 +3633,11 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         with the rest of the METAR family. Only forecast skill and solar lux
         factor remain in the learning loop.
         """
-        from .learning_state import brier_score as _bs
-        from .learning_state import compute_blend_weights as _bw
-
         outcomes = self._learning_state.forecast_outcomes
         if len(outcomes) >= 10:
-            bs_local = _bs(outcomes, "local_prob")
-            bs_api = _bs(outcomes, "openmeteo_prob")
-            wl, wa = _bw(outcomes)
+            bs_local = brier_score(outcomes, "local_prob")
+            bs_api = brier_score(outcomes, "openmeteo_prob")
+            wl, wa = compute_blend_weights(outcomes)
             # Skill relative to naive climatology (~0.25 Brier for 50% events)
             skill_score = round(max(0.0, 1.0 - (((bs_local or 0.25) + (bs_api or 0.25)) / 2) / 0.25), 3)
             data[KEY_FORECAST_SKILL] = skill_score
@@ -3197,8 +3661,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _update_forecast_skill_window(self, data: dict, now: Any) -> None:
         """Track rolling 6-hour forecast outcomes for Brier skill scoring (A3)."""
-        from .learning_state import record_forecast_outcome
-
         # Start a new window if none active
         if self._skill_window_start is None:
             self._skill_window_start = now
@@ -3238,15 +3700,30 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._learning_last_save is None
             or (now - self._learning_last_save).total_seconds() >= LEARNING_SAVE_INTERVAL_S
         ):
-            from .learning_state import async_save_learning
-
-            await async_save_learning(self._learning_store, self._learning_state)
+            # History/accumulators are saved on the same cadence as a backstop,
+            # so a hard crash (no clean async_stop) loses at most one interval.
+            await self._async_save_stores()
             self._learning_last_save = now
-            # Backstop save of history/accumulators on the same cadence, so a
-            # hard crash (no clean async_stop) loses at most one interval.
-            if self._history_store is not None:
-                with contextlib.suppress(Exception):
-                    await self._history_store.async_save(self._dump_history_state())
+
+    async def _async_save_stores(self) -> None:
+        """Save the learning and history Stores concurrently.
+
+        They are separate files, so their executor writes can overlap instead
+        of running back to back.
+        """
+        saves = []
+        if self._learning_store is not None:
+            saves.append(async_save_learning(self._learning_store, self._learning_state))
+        if self._history_store is not None:
+            try:
+                history = self._dump_history_state()
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("ws_core: could not serialize history state: %s", err)
+            else:
+                saves.append(self._history_store.async_save(history))
+        # async_save_learning logs its own failures; a failed history save is
+        # dropped and retried on the next interval, as before.
+        await asyncio.gather(*saves, return_exceptions=True)
 
     # ------------------------------------------------------------------
     # v1.7.1 - rolling-window history + accumulator persistence (issue #16)
@@ -3267,6 +3744,10 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         pts = rt.pressure_history_ts
         return {
             "temp_history_24h": _dq(rt.temp_history_24h),
+            # The temperature panes keep only their latest reading, so the
+            # per-pane high/low deques are stored rather than rebuilt from them.
+            "temp_max_24h": _dq(rt.temp_max_24h),
+            "temp_min_24h": _dq(rt.temp_min_24h),
             "gust_history_24h": _dq(rt.gust_history_24h),
             "rain_total_history_24h": _dq(rt.rain_total_history_24h),
             "pressure_history": [float(v) for v in rt.pressure_history],
@@ -3327,7 +3808,8 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         now = dt_util.utcnow()
         cutoff = now - timedelta(hours=24)
 
-        def _load_dq(key: str) -> deque:
+        def _load_dq(key: str, valid: tuple[float, float] | None = None) -> deque:
+            lo, hi = valid or (-math.inf, math.inf)
             out: deque = deque()
             for item in data.get(key) or []:
                 try:
@@ -3335,13 +3817,31 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     v = float(item[1])
                 except (ValueError, TypeError, IndexError):
                     continue
-                if ts >= cutoff:
+                # A corrupt stored sample would otherwise pin the 24h max/min
+                # for a full day after restart.
+                if ts >= cutoff and lo <= v <= hi:
                     out.append((ts, v))
             return out
 
-        rt.temp_history_24h = _load_dq("temp_history_24h")
-        rt.gust_history_24h = _load_dq("gust_history_24h")
+        rt.temp_history_24h = _load_dq("temp_history_24h", VALID_TEMP_RANGE_C)
+        rt.gust_history_24h = _load_dq("gust_history_24h", VALID_WIND_GUST_RANGE_MS)
+        rt.temp_sum_24h = math.fsum(v for _, v in rt.temp_history_24h)
+        rt.temp_max_24h = _load_dq("temp_max_24h", VALID_TEMP_RANGE_C)
+        rt.temp_min_24h = _load_dq("temp_min_24h", VALID_TEMP_RANGE_C)
+        if rt.temp_history_24h and not (rt.temp_max_24h and rt.temp_min_24h):
+            # Stores written before the extremes were persisted: rebuild from
+            # the pane history, which only has each minute's latest reading.
+            rt.temp_max_24h, rt.temp_min_24h = deque(), deque()
+            for ts, v in rt.temp_history_24h:
+                self._track_extreme_24h(rt.temp_max_24h, ts, v, True)
+                self._track_extreme_24h(rt.temp_min_24h, ts, v, False)
+        # Gust panes already hold each minute's max, so this rebuild matches
+        # the live deque exactly.
+        rt.gust_max_24h = deque()
+        for ts, v in rt.gust_history_24h:
+            self._track_extreme_24h(rt.gust_max_24h, ts, v, True)
         rt.rain_total_history_24h = _load_dq("rain_total_history_24h")
+        rt.rain_rise_24h = self._rain_accum_24h_from_totals(rt.rain_total_history_24h)
 
         ph: deque = deque(maxlen=PRESSURE_HISTORY_SAMPLES)
         for v in data.get("pressure_history") or []:
@@ -3356,7 +3856,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except (ValueError, TypeError):
             rt.pressure_history_ts = None
 
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = dt_util.now().date().isoformat()
 
         # Streak day-boundary snapshot (used by _compute_streaks); safe to restore always.
         self._rain_prev_day_mm = float(data.get("rain_prev_day_mm") or 0.0)
@@ -3437,23 +3937,32 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # ------------------------------------------------------------------
 
     def _compute(self) -> dict[str, Any]:
-        import time
-
         t0 = time.monotonic()
+        rt = self.runtime
+        rt.compute_mono = t0
+        rt.compute_sig = self._source_signature()
+        # Deliberately a fresh dict per pass (not a reused buffer): the previous
+        # result stays published as self.data, which the uploaders read across
+        # awaits and entities read between passes.
         data: WsData = WsData()
         now = dt_util.utcnow()
+        local_now = dt_util.as_local(now)
 
-        missing = [k for k in REQUIRED_SOURCES if not self.sources.get(k)]
-        missing_entities = [
-            k for k in REQUIRED_SOURCES if self.sources.get(k) and self.hass.states.get(self.sources[k]) is None
-        ]
+        missing: list[str] = []
+        missing_entities: list[str] = []
+        get_state = self.hass.states.get
+        for k, eid in self._required_source_items:
+            if not eid:
+                missing.append(k)
+            elif get_state(eid) is None:
+                missing_entities.append(k)
 
         tc, rh, pressure_hpa, wind_ms, gust_ms, wind_dir, rain_total_mm, lux, uv = self._compute_raw_readings(data, now)
-        self._compute_derived_wind(data, now, wind_ms, gust_ms, wind_dir)
+        wind_quad = self._compute_derived_wind(data, now, wind_ms, gust_ms, wind_dir)
         rain_rate = self._compute_derived_precipitation(data, now, rain_total_mm)
         dew_c = self._compute_derived_temperature(data, now, tc, rh, wind_ms)
-        trend_3h, mslp = self._compute_derived_pressure(data, now, tc, pressure_hpa, rh)
-        self._compute_rain_probability(data, mslp, trend_3h, rh)
+        trend_3h, mslp = self._compute_derived_pressure(data, now, tc, pressure_hpa, rh, wind_quad)
+        self._compute_rain_probability(data, mslp, trend_3h, rh, local_now.hour)
         self._compute_forecast_agreement(data)
 
         flags = self._validate_readings(tc, rh, pressure_hpa, wind_ms, gust_ms, dew_c)
@@ -3469,8 +3978,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             wind_kmh = float(wind_ms or 0) * 3.6
 
             # FWI daily update - once per calendar day
-            local_now = dt_util.now()
-            fwi_date_str = local_now.strftime("%Y-%m-%d")
+            fwi_date_str = local_now.date().isoformat()
             fwi_month = local_now.month
 
             if fwi_date_str != self._learning_state.fwi_last_date:
@@ -3566,17 +4074,14 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Solar lux factor learning (A4): update on clear days near solar noon
         if lux is not None and self._learning_state.solar_lux_factor:
-            sun_state = self.hass.states.get("sun.sun")
-            if sun_state:
+            sun = self._sun_position()
+            if sun:
                 try:
-                    sun_elev = float(sun_state.attributes.get("elevation", 0))
-                    hour = dt_util.now().hour
+                    sun_elev = sun[0]
+                    hour = local_now.hour
                     # Only update within 2h of solar noon (approx. 10-14 local)
                     if 10 <= hour <= 14 and sun_elev >= 20:
                         # Check cloud cover proxy: lux should be >70% of theoretical max
-                        from .const import LEARNING_SOLAR_BETA, LEARNING_SOLAR_MAX, LEARNING_SOLAR_MIN
-                        from .learning_state import update_solar_lux_factor
-
                         new_factor = update_solar_lux_factor(
                             self._learning_state.solar_lux_factor,
                             float(lux),
@@ -3622,7 +4127,13 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         fc = getattr(self, "_forecast_cache", None)
         if fc and fc.get("daily"):
-            data[KEY_FORECAST_TILES] = self._build_forecast_tiles(fc["daily"])
+            daily = fc["daily"]
+            # The daily list is replaced wholesale on each fetch, so the tiles
+            # built from it stay valid for as long as it is the same object.
+            if rt.forecast_tiles_daily is not daily:
+                rt.forecast_tiles = self._build_forecast_tiles(daily)
+                rt.forecast_tiles_daily = daily
+            data[KEY_FORECAST_TILES] = rt.forecast_tiles
 
         # Frost risk
         self._compute_frost_risk(data, tc)
@@ -3631,41 +4142,34 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Sea surface temperature
         if self.sea_temp_enabled and self._sea_temp_cache:
-            data[KEY_SEA_SURFACE_TEMP] = self._sea_temp_cache.get("current_c")
-            data["_sea_temp_comfort"] = self._sea_temp_cache.get("comfort")
-            data["_sea_temp_hourly"] = self._sea_temp_cache.get("hourly")
-            data["_sea_temp_grid_lat"] = self._sea_temp_cache.get("grid_lat")
-            data["_sea_temp_grid_lon"] = self._sea_temp_cache.get("grid_lon")
-            data["_sea_temp_disclaimer"] = self._sea_temp_cache.get("disclaimer")
+            self._apply_sea_temp(data, self._sea_temp_cache)
 
         if self.wu_enabled:
             data[KEY_WU_STATUS] = self._wu_status
-            data["_wu_last_upload"] = self._wu_last_upload.isoformat() if self._wu_last_upload else None
+            data["_wu_last_upload"] = _isoformat(self._wu_last_upload)
 
         # v2.0 upload status sensors
         if self.weathercloud_enabled:
             data[KEY_WC_STATUS] = self._wc_status
-            data["_wc_last_upload"] = self._wc_last_upload.isoformat() if self._wc_last_upload else None
+            data["_wc_last_upload"] = _isoformat(self._wc_last_upload)
         if self.pwsweather_enabled:
             data[KEY_PWS_STATUS] = self._pws_status
-            data["_pws_last_upload"] = self._pws_last_upload.isoformat() if self._pws_last_upload else None
+            data["_pws_last_upload"] = _isoformat(self._pws_last_upload)
         if self.wow_enabled:
             data[KEY_WOW_STATUS] = self._wow_status
-            data["_wow_last_upload"] = self._wow_last_upload.isoformat() if self._wow_last_upload else None
+            data["_wow_last_upload"] = _isoformat(self._wow_last_upload)
         if self.awekas_enabled:
             data[KEY_AWEKAS_STATUS] = self._awekas_status
-            data["_awekas_last_upload"] = self._awekas_last_upload.isoformat() if self._awekas_last_upload else None
+            data["_awekas_last_upload"] = _isoformat(self._awekas_last_upload)
         if self.cwop_enabled:
             data[KEY_CWOP_STATUS_V2] = self._cwop_status
-            data["_cwop_last_upload"] = self._cwop_last_upload.isoformat() if self._cwop_last_upload else None
+            data["_cwop_last_upload"] = _isoformat(self._cwop_last_upload)
         if self.owm_stations_enabled:
             data[KEY_OWM_STATIONS_STATUS] = self._owm_stations_status
-            data["_owm_stations_last_upload"] = (
-                self._owm_stations_last_upload.isoformat() if self._owm_stations_last_upload else None
-            )
+            data["_owm_stations_last_upload"] = _isoformat(self._owm_stations_last_upload)
         if self.windy_enabled:
             data[KEY_WINDY_STATUS] = self._windy_status
-            data["_windy_last_upload"] = self._windy_last_upload.isoformat() if self._windy_last_upload else None
+            data["_windy_last_upload"] = _isoformat(self._windy_last_upload)
 
         # Air Quality (Open-Meteo Air Quality API)
         if self.aqi_enabled and self._aqi_cache:
@@ -3749,7 +4253,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     nowcast_confidence = "high" if abs(local_rate_per_15min - nwp_bucket_0) < 0.2 else "medium"
 
                 # Re-derive nowcast from the blended bucket list
-                nc_blended = derive_nowcast(raw_times, blended_precip, dt_util.now())
+                nc_blended = derive_nowcast(raw_times, blended_precip, local_now)
                 nc_blended["rain_expected_1h"] = bool(
                     nc_blended.get("next_60min_mm", 0.0) >= NOWCAST_BUCKET_THRESHOLD_MM
                 )
@@ -3776,17 +4280,24 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Moon (pure calculation, no external API)
         if self.moon_enabled:
-            local_now = dt_util.now()
-            age = moon_phase_days(local_now.year, local_now.month, local_now.day)
-            phase_key = moon_phase_from_age(age)
-            illum_frac = calculate_moon_illumination(local_now.year, local_now.month, local_now.day)
-            illum_pct = round(illum_frac * 100)
-            data[KEY_MOON_PHASE] = phase_key
-            data[KEY_MOON_ILLUMINATION_PCT] = illum_pct
-            data[KEY_MOON_DISPLAY] = phase_key
-            data[KEY_MOON_AGE_DAYS] = age
-            data[KEY_MOON_NEXT_FULL] = moon_next_phase_days(local_now.year, local_now.month, local_now.day, 14.77)
-            data[KEY_MOON_NEXT_NEW] = moon_next_phase_days(local_now.year, local_now.month, local_now.day, 0.0)
+            # Every moon value is keyed on the local date; compute once per day
+            today = local_now.toordinal()
+            if rt.moon_cache is None or rt.moon_cache[0] != today:
+                y, m, d = local_now.year, local_now.month, local_now.day
+                age = moon_phase_days(y, m, d)
+                phase_key = moon_phase_from_age(age)
+                rt.moon_cache = (
+                    today,
+                    {
+                        KEY_MOON_PHASE: phase_key,
+                        KEY_MOON_ILLUMINATION_PCT: round(calculate_moon_illumination(y, m, d) * 100),
+                        KEY_MOON_DISPLAY: phase_key,
+                        KEY_MOON_AGE_DAYS: age,
+                        KEY_MOON_NEXT_FULL: moon_next_phase_days(y, m, d, 14.77),
+                        KEY_MOON_NEXT_NEW: moon_next_phase_days(y, m, d, 0.0),
+                    },
+                )
+            data.update(rt.moon_cache[1])
 
         # Solar forecast
         if self.solar_forecast_enabled and self._solar_cache:
@@ -3806,7 +4317,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if tc is not None and rh is not None and ws is not None and sol_rad is not None:
                 high = data.get(KEY_TEMP_HIGH_24H) or tc
                 low = data.get(KEY_TEMP_LOW_24H) or tc
-                doy = dt_util.now().timetuple().tm_yday
+                doy = local_now.timetuple().tm_yday
                 et0_pm = et0_penman_monteith(
                     temp_mean_c=float(tc),
                     temp_max_c=float(high),
@@ -3825,7 +4336,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._compute_chill_hours(data, now)
             self._compute_clearness_and_cloud(data)
 
-        self.runtime.last_compute_ms = round((time.monotonic() - t0) * 1000, 1)
+        rt.last_compute_ms = round((time.monotonic() - t0) * 1000, 1)
 
         # v2.0: fire HA Event entities for weather transitions
         self._fire_ws_events(data)
@@ -3834,8 +4345,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _fire_ws_events(self, data: dict) -> None:
         """Notify event entities of transitions detected in this compute cycle."""
-        from .const import DOMAIN
-
         try:
             entry_id = self.config_entry.entry_id
         except Exception:  # noqa: BLE001
@@ -3883,11 +4392,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Exponential backoff: normal interval unless consecutive failures
             failures = self.runtime.forecast_consecutive_failures
             if failures > 0:
-                backoff_s = min(
-                    FORECAST_MAX_RETRY_S,
-                    FORECAST_MIN_RETRY_S * (2 ** min(failures - 1, 6)),
-                )
-                min_interval_s = backoff_s
+                min_interval_s = FORECAST_RETRY_SCHEDULE_S[min(failures, len(FORECAST_RETRY_SCHEDULE_S)) - 1]
             else:
                 min_interval_s = max(300, self.forecast_interval_min * 60)
 
@@ -4022,7 +4527,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if resp.status != 200:
                     _LOGGER.warning("Open-Meteo Marine returned HTTP %s", resp.status)
                     return
-                js = await resp.json()
+                js = await resp.json(loads=json_loads)
 
             # Try current block first, fall back to first hourly value
             current = js.get("current") or {}
@@ -4074,7 +4579,14 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 ),
             }
             rt.last_sea_temp_fetch = dt_util.utcnow()
-            self.async_set_updated_data(self._compute())
+            # No derived value reads the sea temperature, so patch the new
+            # reading into the last result rather than recomputing everything.
+            if self.data:
+                data = WsData(self.data)
+                self._apply_sea_temp(data, self._sea_temp_cache)
+                self.async_set_updated_data(data)
+            else:
+                self.async_set_updated_data(self._compute())
 
         except (aiohttp.ClientError, TimeoutError, ValueError, KeyError) as exc:
             _LOGGER.warning("Open-Meteo Marine fetch failed: %s", exc)
@@ -4113,7 +4625,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 if resp.status != 200:
                     _LOGGER.warning("Open-Meteo nowcast returned HTTP %s", resp.status)
                     return
-                js = await resp.json()
+                js = await resp.json(loads=json_loads)
 
             minutely = js.get("minutely_15") or {}
             times = minutely.get("time") or []
@@ -4122,9 +4634,10 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.debug("ws_core: nowcast returned no minutely_15 data")
                 return
 
-            nc = derive_nowcast(times, precip, dt_util.now())
+            fetched_at = dt_util.now()
+            nc = derive_nowcast(times, precip, fetched_at)
             nc["rain_expected_1h"] = bool(nc.get("next_60min_mm", 0.0) >= NOWCAST_BUCKET_THRESHOLD_MM)
-            nc["fetched_at"] = dt_util.now().isoformat()
+            nc["fetched_at"] = fetched_at.isoformat()
             # Store raw NWP buckets so _compute() can apply local-gauge blending
             nc["_raw_times"] = list(times)
             nc["_raw_precip"] = [float(p) if p is not None else 0.0 for p in precip]
@@ -4148,6 +4661,51 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # Weather Underground upload  (v0.6.0)
     # ------------------------------------------------------------------
 
+    def _upload_obs(self) -> _UploadObs:
+        """Upload fields of self.data, read once per published data dict."""
+        data = self.data
+        rt = self.runtime
+        if rt.upload_obs is None or rt.upload_obs_src is not data:
+            get = data.get
+            rt.upload_obs = _UploadObs(
+                temp_c=get(KEY_NORM_TEMP_C),
+                dew_c=get(KEY_DEW_POINT_C),
+                humidity=get(KEY_NORM_HUMIDITY),
+                press_hpa=get(KEY_SEA_LEVEL_PRESSURE_HPA) or get(KEY_NORM_PRESSURE_HPA),
+                wind_dir=get(KEY_NORM_WIND_DIR_DEG) or 0.0,
+                wind_ms=get(KEY_NORM_WIND_SPEED_MS) or 0.0,
+                gust_ms=get(KEY_NORM_WIND_GUST_MS) or 0.0,
+                rain_1h_mm=get(KEY_RAIN_ACCUM_1H) or 0.0,
+                rain_24h_mm=get(KEY_RAIN_ACCUM_24H) or 0.0,
+            )
+            rt.upload_obs_src = data
+        return rt.upload_obs
+
+    def _wu_protocol_params(self, station_id: str, password: str, now_utc: datetime) -> dict[str, Any]:
+        """Query parameters for the WU updateweatherstation protocol (WU, PWSWeather)."""
+        obs = self._upload_obs()
+        params: dict[str, Any] = {
+            "ID": station_id,
+            "PASSWORD": password,
+            "dateutc": now_utc.strftime("%Y-%m-%d %H:%M:%S"),
+            "winddir": int(obs.wind_dir),
+            "windspeedmph": round(_ms_to_mph(obs.wind_ms), 1),
+            "windgustmph": round(_ms_to_mph(obs.gust_ms), 1),
+            "rainin": round(_mm_to_in(obs.rain_1h_mm), 3),
+            "dailyrainin": round(_mm_to_in(obs.rain_24h_mm), 3),
+            "action": "updateraw",
+            "softwaretype": f"ws_core_{_INTEGRATION_VERSION}",
+        }
+        if obs.temp_c is not None:
+            params["tempf"] = round(_c_to_f(obs.temp_c), 1)
+        if obs.dew_c is not None:
+            params["dewptf"] = round(_c_to_f(obs.dew_c), 1)
+        if obs.humidity is not None:
+            params["humidity"] = int(obs.humidity)
+        if obs.press_hpa is not None:
+            params["baromin"] = round(_hpa_to_inhg(obs.press_hpa), 2)
+        return params
+
     async def _async_upload_wunderground(self) -> None:
         """Upload observation to Weather Underground Personal Weather Station API."""
         data = self.data
@@ -4155,50 +4713,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         now_utc = dt_util.utcnow()
-        date_utc = now_utc.strftime("%Y-%m-%d %H:%M:%S")
-
-        temp_c = data.get(KEY_NORM_TEMP_C)
-        dew_c = data.get(KEY_DEW_POINT_C)
-        humidity = data.get(KEY_NORM_HUMIDITY)
-        press = data.get(KEY_SEA_LEVEL_PRESSURE_HPA) or data.get(KEY_NORM_PRESSURE_HPA)
-        wind_dir = data.get(KEY_NORM_WIND_DIR_DEG) or 0
-        wind_ms = data.get(KEY_NORM_WIND_SPEED_MS) or 0
-        gust_ms = data.get(KEY_NORM_WIND_GUST_MS) or 0
-        rain_1h = data.get(KEY_RAIN_ACCUM_1H) or 0
-        rain_24h = data.get(KEY_RAIN_ACCUM_24H) or 0
-
-        def _c_to_f(c: float) -> float:
-            return round(c * 9 / 5 + 32, 1)
-
-        def _ms_to_mph(ms: float) -> float:
-            return round(float(ms) * 2.23694, 1)
-
-        def _mm_to_in(mm: float) -> float:
-            return round(float(mm) / 25.4, 3)
-
-        def _hpa_to_inhg(hpa: float) -> float:
-            return round(float(hpa) / 33.8639, 2)
-
-        params = {
-            "ID": self.wu_station_id,
-            "PASSWORD": self.wu_api_key,
-            "dateutc": date_utc,
-            "winddir": int(wind_dir),
-            "windspeedmph": _ms_to_mph(wind_ms),
-            "windgustmph": _ms_to_mph(gust_ms),
-            "rainin": _mm_to_in(rain_1h),
-            "dailyrainin": _mm_to_in(rain_24h),
-            "action": "updateraw",
-            "softwaretype": f"ws_core_{_INTEGRATION_VERSION}",
-        }
-        if temp_c is not None:
-            params["tempf"] = _c_to_f(float(temp_c))
-        if dew_c is not None:
-            params["dewptf"] = _c_to_f(float(dew_c))
-        if humidity is not None:
-            params["humidity"] = int(float(humidity))
-        if press is not None:
-            params["baromin"] = _hpa_to_inhg(float(press))
+        params = self._wu_protocol_params(self.wu_station_id, self.wu_api_key, now_utc)
 
         url = "https://weatherstation.wunderground.com/weatherstation/updateweatherstation.php"
         try:
@@ -4235,57 +4750,27 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         APRS weather packet format:
           {CALLSIGN}>APRS,TCPXX*,qAX,{CALLSIGN}:@{TIME}z{LAT}/{LON}_{WIND}
         """
-        import asyncio
-
         data = self.data
         if not data or not self.cwop_callsign:
             return
 
-        now_utc = dt_util.utcnow()
-        lat = self.forecast_lat
-        lon = self.forecast_lon
-        if lat is None or lon is None:
+        position = self._aprs_position
+        if position is None:
             return
 
-        temp_c = data.get(KEY_NORM_TEMP_C)
-        humidity = data.get(KEY_NORM_HUMIDITY)
-        press = data.get(KEY_SEA_LEVEL_PRESSURE_HPA) or data.get(KEY_NORM_PRESSURE_HPA)
-        wind_dir = data.get(KEY_NORM_WIND_DIR_DEG) or 0
-        wind_ms = data.get(KEY_NORM_WIND_SPEED_MS) or 0
-        gust_ms = data.get(KEY_NORM_WIND_GUST_MS) or 0
-        rain_1h = data.get(KEY_RAIN_ACCUM_1H) or 0
-        rain_24h = data.get(KEY_RAIN_ACCUM_24H) or 0
-
-        # APRS uses hundredths of degrees, N/S E/W format
-        lat_f = float(lat)
-        lon_f = float(lon)
-        lat_deg = int(abs(lat_f))
-        lat_min = (abs(lat_f) - lat_deg) * 60
-        lon_deg = int(abs(lon_f))
-        lon_min = (abs(lon_f) - lon_deg) * 60
-        lat_str = f"{lat_deg:02d}{lat_min:05.2f}{'N' if lat_f >= 0 else 'S'}"
-        lon_str = f"{lon_deg:03d}{lon_min:05.2f}{'E' if lon_f >= 0 else 'W'}"
-
+        now_utc = dt_util.utcnow()
+        obs = self._upload_obs()
         time_str = now_utc.strftime("%d%H%M")
 
-        def _ms_to_mph(ms: float) -> int:
-            return round(float(ms) * 2.23694)
-
-        def _mm_to_hundredths_in(mm: float) -> int:
-            return round(float(mm) / 25.4 * 100)
-
-        def _c_to_f(c: float) -> int:
-            return round(float(c) * 9 / 5 + 32)
-
-        # APRS weather body
-        wind_dir_s = f"{int(wind_dir):03d}"
-        wind_spd_s = f"{_ms_to_mph(wind_ms):03d}"
-        gust_s = f"g{_ms_to_mph(gust_ms):03d}"
-        temp_s = f"t{_c_to_f(float(temp_c)):03d}" if temp_c is not None else "t..."
-        rain1h_s = f"r{_mm_to_hundredths_in(float(rain_1h)):03d}"
-        rain24h_s = f"p{_mm_to_hundredths_in(float(rain_24h)):03d}"
-        hum_s = f"h{int(float(humidity)):02d}" if humidity is not None else ""
-        baro_s = f"b{round(float(press) * 10):05d}" if press is not None else ""
+        # APRS weather body: whole mph / °F, rain in hundredths of an inch
+        wind_dir_s = f"{int(obs.wind_dir):03d}"
+        wind_spd_s = f"{round(_ms_to_mph(obs.wind_ms)):03d}"
+        gust_s = f"g{round(_ms_to_mph(obs.gust_ms)):03d}"
+        temp_s = f"t{round(_c_to_f(obs.temp_c)):03d}" if obs.temp_c is not None else "t..."
+        rain1h_s = f"r{round(_mm_to_in(obs.rain_1h_mm) * 100):03d}"
+        rain24h_s = f"p{round(_mm_to_in(obs.rain_24h_mm) * 100):03d}"
+        hum_s = f"h{int(obs.humidity):02d}" if obs.humidity is not None else ""
+        baro_s = f"b{round(obs.press_hpa * 10):05d}" if obs.press_hpa is not None else ""
 
         weather_body = (
             f"_{wind_dir_s}/{wind_spd_s}{gust_s}{temp_s}"
@@ -4293,10 +4778,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             f" ws_core/{_INTEGRATION_VERSION}"
         )
 
-        packet = (
-            f"{self.cwop_callsign}>APRS,TCPXX*,qAX,{self.cwop_callsign}:"
-            f"@{time_str}z{lat_str}/{lon_str}{weather_body}\r\n"
-        )
+        packet = f"{self.cwop_callsign}>APRS,TCPXX*,qAX,{self.cwop_callsign}:@{time_str}z{position}{weather_body}\r\n"
         login = f"user {self.cwop_callsign} pass {self.cwop_passcode} vers ws_core {_INTEGRATION_VERSION}\r\n"
 
         try:
@@ -4376,40 +4858,27 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         now_utc = dt_util.utcnow()
-        temp_c = data.get(KEY_NORM_TEMP_C)
-        dew_c = data.get(KEY_DEW_POINT_C)
-        humidity = data.get(KEY_NORM_HUMIDITY)
-        press = data.get(KEY_SEA_LEVEL_PRESSURE_HPA) or data.get(KEY_NORM_PRESSURE_HPA)
-        wind_dir = data.get(KEY_NORM_WIND_DIR_DEG) or 0
-        wind_ms = data.get(KEY_NORM_WIND_SPEED_MS) or 0
-        gust_ms = data.get(KEY_NORM_WIND_GUST_MS) or 0
-        rain_1h = data.get(KEY_RAIN_ACCUM_1H) or 0
+        obs = self._upload_obs()
         uv = data.get(KEY_UV)
 
-        def _ms_to_kmh(ms: float) -> float:
-            return round(float(ms) * 3.6, 1)
-
-        def _hpa_to_hpa(v: float) -> float:
-            return round(float(v), 1)
-
-        # Weathercloud API v1 (HTTP GET)
+        # Weathercloud API v1 (HTTP GET); values in tenths, wind in km/h
         params: dict = {
             "wid": self.wc_station_id,
             "key": self.wc_api_key,
             "per": int(self.wc_interval_min),
         }
-        if temp_c is not None:
-            params["temp"] = round(float(temp_c) * 10)  # Weathercloud uses tenths of °C
-        if dew_c is not None:
-            params["dew"] = round(float(dew_c) * 10)
-        if humidity is not None:
-            params["hum"] = int(float(humidity))
-        if press is not None:
-            params["bar"] = round(float(press) * 10)
-        params["wspdavg"] = round(_ms_to_kmh(wind_ms) * 10)
-        params["wgust"] = round(_ms_to_kmh(gust_ms) * 10)
-        params["wdir"] = int(wind_dir)
-        params["rain"] = round(float(rain_1h) * 10)
+        if obs.temp_c is not None:
+            params["temp"] = round(obs.temp_c * 10)  # Weathercloud uses tenths of °C
+        if obs.dew_c is not None:
+            params["dew"] = round(obs.dew_c * 10)
+        if obs.humidity is not None:
+            params["hum"] = int(obs.humidity)
+        if obs.press_hpa is not None:
+            params["bar"] = round(obs.press_hpa * 10)
+        params["wspdavg"] = round(round(obs.wind_ms * 3.6, 1) * 10)
+        params["wgust"] = round(round(obs.gust_ms * 3.6, 1) * 10)
+        params["wdir"] = int(obs.wind_dir)
+        params["rain"] = round(obs.rain_1h_mm * 10)
         if uv is not None:
             params["uvi"] = round(float(uv) * 10)
 
@@ -4442,49 +4911,7 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         now_utc = dt_util.utcnow()
-        date_utc = now_utc.strftime("%Y-%m-%d %H:%M:%S")
-        temp_c = data.get(KEY_NORM_TEMP_C)
-        dew_c = data.get(KEY_DEW_POINT_C)
-        humidity = data.get(KEY_NORM_HUMIDITY)
-        press = data.get(KEY_SEA_LEVEL_PRESSURE_HPA) or data.get(KEY_NORM_PRESSURE_HPA)
-        wind_dir = data.get(KEY_NORM_WIND_DIR_DEG) or 0
-        wind_ms = data.get(KEY_NORM_WIND_SPEED_MS) or 0
-        gust_ms = data.get(KEY_NORM_WIND_GUST_MS) or 0
-        rain_1h = data.get(KEY_RAIN_ACCUM_1H) or 0
-        rain_24h = data.get(KEY_RAIN_ACCUM_24H) or 0
-
-        def _c_to_f(c: float) -> float:
-            return round(float(c) * 9 / 5 + 32, 1)
-
-        def _ms_to_mph(ms: float) -> float:
-            return round(float(ms) * 2.23694, 1)
-
-        def _mm_to_in(mm: float) -> float:
-            return round(float(mm) / 25.4, 3)
-
-        def _hpa_to_inhg(hpa: float) -> float:
-            return round(float(hpa) / 33.8639, 2)
-
-        params: dict = {
-            "ID": self.pws_station_id,
-            "PASSWORD": self.pws_api_key,
-            "dateutc": date_utc,
-            "winddir": int(wind_dir),
-            "windspeedmph": _ms_to_mph(wind_ms),
-            "windgustmph": _ms_to_mph(gust_ms),
-            "rainin": _mm_to_in(rain_1h),
-            "dailyrainin": _mm_to_in(rain_24h),
-            "action": "updateraw",
-            "softwaretype": f"ws_core_{_INTEGRATION_VERSION}",
-        }
-        if temp_c is not None:
-            params["tempf"] = _c_to_f(float(temp_c))
-        if dew_c is not None:
-            params["dewptf"] = _c_to_f(float(dew_c))
-        if humidity is not None:
-            params["humidity"] = int(float(humidity))
-        if press is not None:
-            params["baromin"] = _hpa_to_inhg(float(press))
+        params = self._wu_protocol_params(self.pws_station_id, self.pws_api_key, now_utc)
 
         url = "https://www.pwsweather.com/weatherstation/updateweatherstation.php"
         try:
@@ -4532,20 +4959,20 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "softwaretype": f"ws_core_{_INTEGRATION_VERSION}",
         }
         if temp_c is not None:
-            params["tempf"] = round(float(temp_c) * 9 / 5 + 32, 1)
+            params["tempf"] = round(_c_to_f(temp_c), 1)
         if dew_c is not None:
-            params["dewptf"] = round(float(dew_c) * 9 / 5 + 32, 1)
+            params["dewptf"] = round(_c_to_f(dew_c), 1)
         if humidity is not None:
-            params["humidity"] = int(float(humidity))
+            params["humidity"] = int(humidity)
         if press is not None:
-            params["baromin"] = round(float(press) / 33.8639, 2)
+            params["baromin"] = round(_hpa_to_inhg(press), 2)
         if wind_dir is not None:
-            params["winddir"] = int(float(wind_dir))
+            params["winddir"] = int(wind_dir)
         if wind_ms is not None:
-            params["windspeedmph"] = round(float(wind_ms) * 2.23694, 1)
+            params["windspeedmph"] = round(_ms_to_mph(wind_ms), 1)
         if gust_ms is not None:
-            params["windgustmph"] = round(float(gust_ms) * 2.23694, 1)
-        params["rainin"] = round(float(rain_1h) / 25.4, 3)
+            params["windgustmph"] = round(_ms_to_mph(gust_ms), 1)
+        params["rainin"] = round(_mm_to_in(rain_1h), 3)
 
         url = "https://wow.metoffice.gov.uk/automaticreading"
         try:
@@ -4758,8 +5185,8 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _compute_wind_run(self, data: dict, now: Any) -> None:
         """Accumulate daily wind run (km).  Resets at local midnight."""
-        local_now = dt_util.now()
-        date_str = local_now.strftime("%Y-%m-%d")
+        local_now = dt_util.as_local(now)
+        date_str = local_now.date().isoformat()
 
         if date_str != self._wind_run_date:
             self._wind_run_km = 0.0
@@ -4791,8 +5218,8 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Fractional hours are accumulated using actual elapsed seconds.
         Season counter resets on ``_chill_season_reset_month``/``_chill_season_reset_day``.
         """
-        local_now = dt_util.now()
-        date_str = local_now.strftime("%Y-%m-%d")
+        local_now = dt_util.as_local(now)
+        date_str = local_now.date().isoformat()
         season_reset_key = f"{local_now.year}-{self._chill_season_reset_month:02d}-{self._chill_season_reset_day:02d}"
 
         # Daily reset
@@ -4823,10 +5250,10 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if solar_rad is None:
             return
 
-        sun_state = self.hass.states.get("sun.sun")
-        if sun_state is None:
+        sun = self._sun_position()
+        if sun is None:
             return
-        sun_elev = float(sun_state.attributes.get("elevation", 0))
+        sun_elev = sun[0]
 
         kt = calculate_clearness_index(float(solar_rad), sun_elev)
         if kt is not None:
@@ -4839,8 +5266,6 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _get_solar_radiation(self) -> float | None:
         """Read optional solar radiation sensor (W/m²) from sources."""
-        from .const import SRC_SOLAR_RADIATION
-
         eid = self.sources.get(SRC_SOLAR_RADIATION)
         if not eid:
             return None
@@ -4880,12 +5305,12 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "&timezone=auto"
         )
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                    if resp.status != 200:
-                        _LOGGER.warning("ws_core AQI/pollen fetch failed: HTTP %s", resp.status)
-                        return
-                    raw = await resp.json()
+            session = async_get_clientsession(self.hass)
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                if resp.status != 200:
+                    _LOGGER.warning("ws_core AQI/pollen fetch failed: HTTP %s", resp.status)
+                    return
+                raw = await resp.json(loads=json_loads)
             cur = raw.get("current", {})
 
             # AQI side
@@ -4987,15 +5412,15 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         url = f"https://api.forecast.solar/estimate/{lat}/{lon}/{declination}/{azimuth}/{kwp}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                    if resp.status == 429:
-                        _LOGGER.warning("ws_core solar forecast: forecast.solar rate limit hit")
-                        return
-                    if resp.status != 200:
-                        _LOGGER.warning("ws_core solar forecast fetch failed: HTTP %s", resp.status)
-                        return
-                    raw = await resp.json()
+            session = async_get_clientsession(self.hass)
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                if resp.status == 429:
+                    _LOGGER.warning("ws_core solar forecast: forecast.solar rate limit hit")
+                    return
+                if resp.status != 200:
+                    _LOGGER.warning("ws_core solar forecast fetch failed: HTTP %s", resp.status)
+                    return
+                raw = await resp.json()
 
             result = raw.get("result", {})
             # watt_hours_day: {"YYYY-MM-DD": wh, ...}
@@ -5051,30 +5476,34 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         lat = self.forecast_lat
         lon = self.forecast_lon
 
-        # Step 1: reverse-geocode to French department code via BAN API
-        ban_url = f"https://api-adresse.data.gouv.fr/reverse/?lon={lon}&lat={lat}"
-        try:
-            async with aiohttp.ClientSession() as session:
+        # Step 1: reverse-geocode to French department code via BAN API.  The
+        # station does not move, so the department from the last successful
+        # fetch is reused and the geocode only runs until it first succeeds.
+        dept = (self._vigilance_cache or {}).get("dept")
+        if not dept:
+            ban_url = f"https://api-adresse.data.gouv.fr/reverse/?lon={lon}&lat={lat}"
+            try:
+                session = async_get_clientsession(self.hass)
                 async with session.get(ban_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                     if resp.status != 200:
                         _LOGGER.debug("ws_core vigilance: BAN geocode failed HTTP %s", resp.status)
                         return
                     geo = await resp.json()
-        except (aiohttp.ClientError, TimeoutError) as exc:
-            _LOGGER.debug("ws_core vigilance: BAN geocode error: %s", exc)
-            return
+            except (aiohttp.ClientError, TimeoutError) as exc:
+                _LOGGER.debug("ws_core vigilance: BAN geocode error: %s", exc)
+                return
 
-        features = geo.get("features", [])
-        if not features:
-            _LOGGER.debug("ws_core vigilance: no BAN result for lat=%s lon=%s (not in France?)", lat, lon)
-            return
+            features = geo.get("features", [])
+            if not features:
+                _LOGGER.debug("ws_core vigilance: no BAN result for lat=%s lon=%s (not in France?)", lat, lon)
+                return
 
-        # context = "75, Paris, Ile-de-France" - dept is the first token
-        context = features[0].get("properties", {}).get("context", "")
-        dept = context.split(",")[0].strip() if context else None
-        if not dept:
-            _LOGGER.debug("ws_core vigilance: could not extract dept from context=%r", context)
-            return
+            # context = "75, Paris, Ile-de-France" - dept is the first token
+            context = features[0].get("properties", {}).get("context", "")
+            dept = context.split(",")[0].strip() if context else None
+            if not dept:
+                _LOGGER.debug("ws_core vigilance: could not extract dept from context=%r", context)
+                return
 
         # Step 2: query Météo Vigilance dataset for today's alerts (echeance=J)
         ods_url = (
@@ -5084,12 +5513,12 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "&limit=20&select=phenomenon_id,phenomenon,color_id,color"
         )
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(ods_url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                    if resp.status != 200:
-                        _LOGGER.warning("ws_core vigilance: ODS fetch failed HTTP %s", resp.status)
-                        return
-                    raw = await resp.json()
+            session = async_get_clientsession(self.hass)
+            async with session.get(ods_url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                if resp.status != 200:
+                    _LOGGER.warning("ws_core vigilance: ODS fetch failed HTTP %s", resp.status)
+                    return
+                raw = await resp.json()
         except (aiohttp.ClientError, TimeoutError, ValueError) as exc:
             _LOGGER.warning("ws_core vigilance: ODS fetch error: %s", exc)
             return
@@ -5146,111 +5575,111 @@ class WSStationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         need_refresh = False
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # Auto-detect mode: no stations configured → find nearest
-                if not stations:
-                    if not self._vigicrues_auto_code:
-                        lat, lon = self.forecast_lat, self.forecast_lon
-                        url = (
-                            "https://hubeau.eaufrance.fr/api/v2/hydrometrie/referentiel/stations"
-                            f"?format=json&longitude={lon}&latitude={lat}&distance=50"
-                            "&en_service=true&size=1"
-                            "&fields=code_station,libelle_station,libelle_cours_eau"
-                        )
-                        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                            if resp.status != 200:
-                                _LOGGER.warning("ws_core Vigicrues: auto-detect HTTP %s", resp.status)
-                                return
-                            sdata = await resp.json()
-                        found = sdata.get("data", [])
-                        if not found:
-                            _LOGGER.debug("ws_core Vigicrues: no station within 50 km (outside France?)")
+            session = async_get_clientsession(self.hass)
+            # Auto-detect mode: no stations configured → find nearest
+            if not stations:
+                if not self._vigicrues_auto_code:
+                    lat, lon = self.forecast_lat, self.forecast_lon
+                    url = (
+                        "https://hubeau.eaufrance.fr/api/v2/hydrometrie/referentiel/stations"
+                        f"?format=json&longitude={lon}&latitude={lat}&distance=50"
+                        "&en_service=true&size=1"
+                        "&fields=code_station,libelle_station,libelle_cours_eau"
+                    )
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                        if resp.status != 200:
+                            _LOGGER.warning("ws_core Vigicrues: auto-detect HTTP %s", resp.status)
                             return
-                        st = found[0]
-                        self._vigicrues_auto_code = st.get("code_station", "")
-                        self._vigicrues_auto_name = st.get("libelle_station") or self._vigicrues_auto_code
-                        self._vigicrues_auto_river = st.get("libelle_cours_eau") or ""
-                        _LOGGER.debug(
-                            "ws_core Vigicrues auto-detected: %s (%s) on %s",
-                            self._vigicrues_auto_code,
-                            self._vigicrues_auto_name,
-                            self._vigicrues_auto_river,
-                        )
-                    stations = [
-                        {
-                            "code": self._vigicrues_auto_code or "",
-                            "name": self._vigicrues_auto_name or "",
-                            "river": self._vigicrues_auto_river or "",
-                        }
-                    ]
-
-                for st_info in stations:
-                    code = st_info.get("code", "").strip()
-                    if not code:
-                        continue
-                    obs_url = (
-                        "https://hubeau.eaufrance.fr/api/v2/hydrometrie/observations_tr"
-                        f"?format=json&code_entite={code}"
-                        "&grandeur_hydro=H&size=1"
-                        "&fields=code_station,date_obs,resultat_obs"
+                        sdata = await resp.json()
+                    found = sdata.get("data", [])
+                    if not found:
+                        _LOGGER.debug("ws_core Vigicrues: no station within 50 km (outside France?)")
+                        return
+                    st = found[0]
+                    self._vigicrues_auto_code = st.get("code_station", "")
+                    self._vigicrues_auto_name = st.get("libelle_station") or self._vigicrues_auto_code
+                    self._vigicrues_auto_river = st.get("libelle_cours_eau") or ""
+                    _LOGGER.debug(
+                        "ws_core Vigicrues auto-detected: %s (%s) on %s",
+                        self._vigicrues_auto_code,
+                        self._vigicrues_auto_name,
+                        self._vigicrues_auto_river,
                     )
-                    async with session.get(obs_url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                        if resp.status not in (200, 206):
-                            _LOGGER.warning("ws_core Vigicrues: observations HTTP %s for %s", resp.status, code)
-                            continue
-                        odata = await resp.json()
-
-                    observations = odata.get("data", [])
-                    if not observations:
-                        _LOGGER.debug("ws_core Vigicrues: no observations for station %s", code)
+                stations = [
+                    {
+                        "code": self._vigicrues_auto_code or "",
+                        "name": self._vigicrues_auto_name or "",
+                        "river": self._vigicrues_auto_river or "",
+                    }
+                ]
+
+            for st_info in stations:
+                code = st_info.get("code", "").strip()
+                if not code:
+                    continue
+                obs_url = (
+                    "https://hubeau.eaufrance.fr/api/v2/hydrometrie/observations_tr"
+                    f"?format=json&code_entite={code}"
+                    "&grandeur_hydro=H&size=1"
+                    "&fields=code_station,date_obs,resultat_obs"
+                )
+                async with session.get(obs_url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                    if resp.status not in (200, 206):
+                        _LOGGER.warning("ws_core Vigicrues: observations HTTP %s for %s", resp.status, code)
                         continue
+                    odata = await resp.json()
 
-                    obs = observations[0]
-                    raw_mm = obs.get("resultat_obs")
-                    level_m = round(float(raw_mm) / 1000.0, 3) if raw_mm is not None else None
-
-                    self._vigicrues_caches[code] = {
-                        "level_m": level_m,
-                        "station_code": code,
-                        "station_name": st_info.get("name", code),
-                        "river_name": st_info.get("river", ""),
-                        "obs_time": obs.get("date_obs"),
-                        "fetched_at": dt_util.utcnow().isoformat(),
-                    }
-                    _LOGGER.debug(
-                        "ws_core Vigicrues: %s (%s) level=%.3f m at %s",
-                        st_info.get("name", code),
-                        code,
-                        level_m or 0,
-                        obs.get("date_obs"),
-                    )
+                observations = odata.get("data", [])
+                if not observations:
+                    _LOGGER.debug("ws_core Vigicrues: no observations for station %s", code)
+                    continue
 
-                    # Try to fetch flow data (Q) — not all stations provide it
-                    flow_url = (
-                        "https://hubeau.eaufrance.fr/api/v2/hydrometrie/observations_tr"
-                        f"?format=json&code_entite={code}"
-                        "&grandeur_hydro=Q&size=1"
-                        "&fields=code_station,date_obs,resultat_obs"
-                    )
-                    try:
-                        async with session.get(flow_url, timeout=aiohttp.ClientTimeout(total=15)) as fresp:
-                            if fresp.status in (200, 206):
-                                fdata = await fresp.json()
-                                fobs = fdata.get("data", [])
-                                if fobs:
-                                    raw_q = fobs[0].get("resultat_obs")
-                                    flow_m3s = round(float(raw_q), 3) if raw_q is not None else None
-                                    self._vigicrues_caches[code]["flow_m3s"] = flow_m3s
-                                    self._vigicrues_caches[code]["flow_obs_time"] = fobs[0].get("date_obs")
-                                    _LOGGER.debug(
-                                        "ws_core Vigicrues: %s flow=%.3f m³/s",
-                                        code,
-                                        flow_m3s or 0,
-                                    )
-                    except (aiohttp.ClientError, TimeoutError, ValueError):
-                        pass  # Flow data is optional; level data still reported
-
-                    need_refresh = True
+                obs = observations[0]
+                raw_mm = obs.get("resultat_obs")
+                level_m = round(float(raw_mm) / 1000.0, 3) if raw_mm is not None else None
+
+                self._vigicrues_caches[code] = {
+                    "level_m": level_m,
+                    "station_code": code,
+                    "station_name": st_info.get("name", code),
+                    "river_name": st_info.get("river", ""),
+                    "obs_time": obs.get("date_obs"),
+                    "fetched_at": dt_util.utcnow().isoformat(),
+                }
+                _LOGGER.debug(
+                    "ws_core Vigicrues: %s (%s) level=%.3f m at %s",
+                    st_info.get("name", code),
+                    code,
+                    level_m or 0,
+                    obs.get("date_obs"),
+                )
+
+                # Try to fetch flow data (Q) — not all stations provide it
+                flow_url = (
+                    "https://hubeau.eaufrance.fr/api/v2/hydrometrie/observations_tr"
+                    f"?format=json&code_entite={code}"
+                    "&grandeur_hydro=Q&size=1"
+                    "&fields=code_station,date_obs,resultat_obs"
+                )
+                try:
+                    async with session.get(flow_url, timeout=aiohttp.ClientTimeout(total=15)) as fresp:
+                        if fresp.status in (200, 206):
+                            fdata = await fresp.json()
+                            fobs = fdata.get("data", [])
+                            if fobs:
+                                raw_q = fobs[0].get("resultat_obs")
+                                flow_m3s = round(float(raw_q), 3) if raw_q is not None else None
+                                self._vigicrues_caches[code]["flow_m3s"] = flow_m3s
+                                self._vigicrues_caches[code]["flow_obs_time"] = fobs[0].get("date_obs")
+                                _LOGGER.debug(
+                                    "ws_core Vigicrues: %s flow=%.3f m³/s",
+                                    code,
+                                    flow_m3s or 0,
+                                )
+                except (aiohttp.ClientError, TimeoutError, ValueError):
+                    pass  # Flow data is optional; level data still reported
+
+                need_refresh = True
 
         except (aiohttp.ClientError, TimeoutError, ValueError) as exc:
             _LOGGER.warning("ws_core Vigicrues fetch error: %r", exc)
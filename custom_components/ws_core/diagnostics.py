@@ -50,6 +50,8 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
             "last_compute_ms": rt.last_compute_ms,
             "pressure_history_samples": len(rt.pressure_history),
             "temp_history_24h_samples": len(rt.temp_history_24h),
+            "gust_history_24h_samples": len(rt.gust_history_24h),
+            "rain_total_history_24h_samples": len(rt.rain_total_history_24h),
             "forecast_consecutive_failures": rt.forecast_consecutive_failures,
             "forecast_inflight": rt.forecast_inflight,
         }
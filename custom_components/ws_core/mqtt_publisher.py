@@ -15,6 +15,7 @@ Enable via: switch.ws_enable_mqtt  (disabled by default).
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import logging
 from typing import Any
@@ -147,6 +148,16 @@ MQTT_SENSORS: list[tuple[str, str, str, str | None, str | None, str]] = [
 ]
 
 
+@functools.lru_cache(maxsize=4)
+def _state_topics(state_prefix: str, entity_prefix: str) -> tuple[tuple[str, str], ...]:
+    """(coordinator_data_key, state topic) for every published sensor.
+
+    Both prefixes are fixed for the lifetime of a config entry, so the
+    topics are formatted once rather than on every publish interval.
+    """
+    return tuple((data_key, f"{state_prefix}/{entity_prefix}/{slug}/state") for data_key, slug, *_ in MQTT_SENSORS)
+
+
 async def async_publish_discovery(
     hass: HomeAssistant,
     discovery_prefix: str,
@@ -214,19 +225,18 @@ async def async_publish_states(
     if not mqtt_component.is_connected(hass):
         return
 
-    for data_key, slug, _name, _unit, _dc, _icon in MQTT_SENSORS:
+    for data_key, state_topic in _state_topics(state_prefix, entity_prefix):
         value = coordinator_data.get(data_key)
         if value is None:
             continue
 
-        state_topic = f"{state_prefix}/{entity_prefix}/{slug}/state"
         # Publish numeric values rounded to 2dp; everything else as string
         payload = f"{value:.2f}" if isinstance(value, float) else str(value)
 
         try:
             await mqtt_component.async_publish(hass, state_topic, payload, retain=False)
         except Exception as exc:  # noqa: BLE001
-            _LOGGER.debug("ws_core MQTT state publish failed for %s: %s", slug, exc)
+            _LOGGER.debug("ws_core MQTT state publish failed for %s: %s", state_topic, exc)
 
 
 async def async_unpublish_discovery(
@@ -281,6 +281,14 @@ _WIND_FACTORS: dict[str, float] = {"m/s": 1.0, "km/h": 3.6, "mph": 2.23694, "kn"
 _PRESSURE_FACTORS: dict[str, float] = {"hPa": 1.0, "inHg": 0.02953, "mmHg": 0.75006}
 _DISTANCE_FACTORS: dict[str, float] = {"km": 1.0, "mi": 0.621371}
 _ALTITUDE_FACTORS: dict[str, float] = {"m": 1.0, "ft": 3.28084}
+_UNIT_GROUP_FACTORS: dict[str, dict[str, float]] = {
+    "wind": _WIND_FACTORS,
+    "pressure": _PRESSURE_FACTORS,
+    "rain": {"mm": 1.0, "in": 1 / 25.4},
+    "rain_rate": {"mm/h": 1.0, "in/h": 1 / 25.4},
+    "distance": _DISTANCE_FACTORS,
+    "altitude": _ALTITUDE_FACTORS,
+}
 
 # SensorDeviceClass.WIND_DIRECTION and SensorStateClass.MEASUREMENT_ANGLE were
 # added in HA 2025.1. We support down to HA 2024.6.0 (see hacs.json), so resolve
@@ -2584,6 +2592,187 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     async_add_entities(entities)
 
 
+# Object-id slugs for keys whose name doesn't reduce cleanly through the suffix
+# stripping in WSSensor._slug_for_key. Built once at import rather than per entity.
+_SLUG_OVERRIDES: dict[str, str] = {
+    KEY_DATA_QUALITY: "data_quality_banner",
+    KEY_FORECAST: "forecast_daily",
+    KEY_NORM_TEMP_C: "temperature",
+    KEY_DEW_POINT_C: "dew_point",
+    KEY_FROST_POINT_C: "frost_point",
+    KEY_WET_BULB_C: "wet_bulb",
+    KEY_NORM_HUMIDITY: "humidity",
+    KEY_NORM_PRESSURE_HPA: "station_pressure",
+    KEY_SEA_LEVEL_PRESSURE_HPA: "sea_level_pressure",
+    KEY_NORM_WIND_SPEED_MS: "wind_speed",
+    KEY_NORM_WIND_GUST_MS: "wind_gust",
+    KEY_NORM_WIND_DIR_DEG: "wind_direction",
+    KEY_NORM_RAIN_TOTAL_MM: "rain_total",
+    KEY_RAIN_RATE_FILT: "rain_rate",
+    KEY_BATTERY_PCT: "battery",
+    KEY_FEELS_LIKE_C: "feels_like",
+    KEY_ZAMBRETTI_FORECAST: "zambretti_forecast",
+    KEY_ZAMBRETTI_NUMBER: "zambretti_number",
+    KEY_WIND_BEAUFORT: "wind_beaufort",
+    KEY_WIND_QUADRANT: "wind_quadrant",
+    KEY_WIND_DIR_SMOOTH_DEG: "wind_direction_smooth",
+    KEY_CURRENT_CONDITION: "current_condition",
+    KEY_RAIN_PROBABILITY: "rain_probability",
+    KEY_RAIN_PROBABILITY_COMBINED: "rain_probability_combined",
+    KEY_RAIN_DISPLAY: "rain_display",
+    KEY_RAIN_ACCUM_1H: "rain_last_1h",
+    KEY_RAIN_ACCUM_24H: "rain_last_24h",
+    KEY_PRESSURE_TREND_DISPLAY: "pressure_trend",
+    KEY_HEALTH_DISPLAY: "station_health",
+    KEY_FORECAST_TILES: "forecast_tiles",
+    KEY_TEMP_HIGH_24H: "temperature_high_24h",
+    KEY_TEMP_LOW_24H: "temperature_low_24h",
+    KEY_TEMP_AVG_24H: "temperature_avg_24h",
+    KEY_WIND_GUST_MAX_24H: "wind_gust_max_24h",
+    KEY_HUMIDITY_LEVEL_DISPLAY: "humidity_level",
+    KEY_UV_LEVEL_DISPLAY: "uv_level",
+    KEY_TEMP_DISPLAY: "temperature_display",
+    KEY_FIRE_RISK_SCORE: "fire_risk_score",
+    KEY_SENSOR_QUALITY_FLAGS: "sensor_quality_flags",
+    KEY_LUX: "illuminance",
+    KEY_UV: "uv_index",
+    KEY_ALERT_STATE: "alert_state",
+    KEY_ALERT_MESSAGE: "alert_message",
+    KEY_PACKAGE_STATUS: "package_status",
+    KEY_PRESSURE_CHANGE_WINDOW_HPA: "pressure_change_window",
+    KEY_PRESSURE_TREND_HPAH: "pressure_trend_raw",
+    KEY_SEA_SURFACE_TEMP: "sea_surface_temperature",
+    # v0.6.0
+    KEY_ET0_DAILY_MM: "et0_daily",
+    KEY_ET0_HOURLY_MM: "et0_hourly",
+    KEY_WU_STATUS: "wu_upload_status",
+    # v0.7.0
+    KEY_AQI: "air_quality_index",
+    KEY_PM2_5: "pm2_5",
+    KEY_PM10: "pm10",
+    KEY_NO2: "no2",
+    KEY_OZONE: "ozone",
+    KEY_POLLEN_OVERALL: "pollen_level",
+    KEY_POLLEN_GRASS: "pollen_grass",
+    KEY_POLLEN_TREE: "pollen_tree",
+    KEY_POLLEN_WEED: "pollen_weed",
+    # v0.8.0
+    KEY_MOON_DISPLAY: "moon",
+    KEY_MOON_ILLUMINATION_PCT: "moon_illumination",
+    # v0.9.0
+    KEY_SOLAR_FORECAST_TODAY_KWH: "solar_forecast_today",
+    KEY_SOLAR_FORECAST_TOMORROW_KWH: "solar_forecast_tomorrow",
+    KEY_ET0_PM_DAILY_MM: "et0_penman_monteith",
+    # v1.2.0
+    KEY_FOG_PROBABILITY: "fog_probability",
+    KEY_THUNDERSTORM_RISK: "thunderstorm_risk",
+    KEY_DRY_STREAK: "dry_streak_days",
+    KEY_HEAT_STREAK: "heat_streak_days",
+    KEY_FROST_STREAK: "frost_streak_days",
+    KEY_SENSOR_DRIFT_FLAGS: "sensor_drift",
+    KEY_CONSISTENCY_FLAGS: "sensor_consistency",
+    KEY_CLIMATOLOGY_30D: "climatology_30d",
+    KEY_TEMP_ANOMALY_30D: "temperature_anomaly_30d",
+    KEY_RAIN_ANOMALY_30D: "rain_anomaly_30d",
+    KEY_TEMP_ANOMALY_90D: "temp_anomaly_90d",
+    KEY_RAIN_ANOMALY_90D: "rain_anomaly_90d",
+    KEY_FORECAST_AGREEMENT: "forecast_agreement",
+    KEY_FORECAST_SKILL: "forecast_skill",
+    KEY_FORECAST_BRIER_LOCAL: "forecast_brier_local",
+    KEY_FORECAST_BRIER_API: "forecast_brier_api",
+    KEY_FORECAST_BLEND_WEIGHT_LOCAL: "forecast_blend_weight_local",
+    KEY_SOLAR_LUX_FACTOR: "solar_lux_factor",
+    # v1.3.0 - FWI components
+    KEY_FWI_FFMC: "fwi_ffmc",
+    KEY_FWI_DMC: "fwi_dmc",
+    KEY_FWI_DC: "fwi_dc",
+    KEY_FWI_ISI: "fwi_isi",
+    KEY_FWI_BUI: "fwi_bui",
+    KEY_FWI: "fwi",
+    KEY_FWI_DSR: "fwi_dsr",
+    # v1.5.0 - comfort indices + agrometeorological
+    KEY_HEAT_INDEX: "heat_index",
+    KEY_WIND_CHILL: "wind_chill",
+    KEY_HUMIDEX: "humidex",
+    KEY_VPD: "vpd",
+    KEY_ABSOLUTE_HUMIDITY: "absolute_humidity",
+    KEY_DELTA_T: "delta_t",
+    KEY_THW_INDEX: "thw_index",
+    KEY_THSW_INDEX: "thsw_index",
+    KEY_WIND_RUN_KM: "wind_run",
+    KEY_CHILL_HOURS_TODAY: "chill_hours_today",
+    KEY_CHILL_HOURS_SEASON: "chill_hours_season",
+    KEY_CLEARNESS_INDEX: "clearness_index",
+    KEY_CLOUD_COVER_PCT: "cloud_cover",
+    KEY_VIGILANCE_MAX_LEVEL: "vigilance",
+    # river_level slugs are handled in WSRiverSensor directly
+    KEY_RAIN_NEXT_60MIN: "rain_next_60min",
+    KEY_MINUTES_UNTIL_RAIN: "minutes_until_rain",
+    KEY_MINUTES_UNTIL_DRY: "minutes_until_dry",
+    KEY_NOWCAST_INTENSITY: "nowcast_intensity",
+    # v2.0
+    KEY_CLOUD_BASE_M: "cloud_base",
+    KEY_FREEZING_LEVEL_M: "freezing_level",
+    KEY_WIND_GUST_FACTOR: "wind_gust_factor",
+    KEY_AIR_DENSITY: "air_density",
+    KEY_SPECIFIC_HUMIDITY: "specific_humidity",
+    KEY_WBGT: "wbgt",
+    KEY_RAIN_THIS_WEEK_MM: "rain_this_week",
+    KEY_RAIN_THIS_MONTH_MM: "rain_this_month",
+    KEY_RAIN_THIS_YEAR_MM: "rain_this_year",
+    KEY_RAIN_RATE_MAX_24H: "rain_rate_max_24h",
+    KEY_HDD_TODAY_MM: "hdd_today",
+    KEY_HDD_SEASON: "hdd_season",
+    KEY_CDD_TODAY_MM: "cdd_today",
+    KEY_CDD_SEASON: "cdd_season",
+    KEY_GDD_TODAY_V2: "gdd_today",
+    KEY_GDD_SEASON_V2: "gdd_season",
+    KEY_LEAF_WETNESS: "leaf_wetness",
+    # v2.0 batch 3
+    KEY_DOMINANT_WIND_DIR: "dominant_wind_direction",
+    KEY_WIND_DIR_VARIABILITY: "wind_direction_variability",
+    KEY_SOLAR_ENERGY_TODAY_WHM2: "solar_energy_today",
+    KEY_MAX_SOLAR_RADIATION: "max_solar_radiation",
+    KEY_PEAK_SUN_HOURS: "peak_sun_hours",
+    KEY_IRRIGATION_DEFICIT: "irrigation_deficit",
+    # v2.0 batch 4
+    KEY_FFDI: "ffdi",
+    KEY_FFWI: "ffwi",
+    KEY_UTCI: "utci",
+    # v2.0 batch 5 (lightning)
+    KEY_LIGHTNING_COUNT_1H: "lightning_count_1h",
+    KEY_LIGHTNING_DISTANCE_KM: "lightning_distance",
+    KEY_LIGHTNING_RATE_1H: "lightning_rate",
+    KEY_LIGHTNING_CLEARANCE_MIN: "lightning_clearance",
+    KEY_LIGHTNING_PROXIMITY: "lightning_proximity",
+    # v2.0 upload targets
+    KEY_WC_STATUS: "wc_upload_status",
+    KEY_PWS_STATUS: "pws_upload_status",
+    KEY_WOW_STATUS: "wow_upload_status",
+    KEY_AWEKAS_STATUS: "awekas_upload_status",
+    KEY_CWOP_STATUS_V2: "cwop_upload_status",
+    KEY_OWM_STATIONS_STATUS: "owm_stations_upload_status",
+    KEY_WINDY_STATUS: "windy_upload_status",
+    # v2.0 indoor sensors
+    KEY_INDOOR_TEMP_C: "indoor_temperature",
+    KEY_INDOOR_HUMIDITY: "indoor_humidity",
+    KEY_INDOOR_CO2_PPM: "indoor_co2",
+    KEY_INDOOR_TEMP_DELTA: "indoor_temp_delta",
+    KEY_INDOOR_HUMIDITY_DELTA: "indoor_humidity_delta",
+    KEY_INDOOR_COMFORT: "indoor_comfort",
+    # v2.0 data quality
+    KEY_SENSOR_STUCK: "sensor_stuck",
+    KEY_DATA_QUALITY_SCORE: "data_quality_score",
+    KEY_NEIGHBOR_QC: "neighbor_qc",
+    KEY_SENSOR_SPIKE: "sensor_spike",
+    # v2.0 finishing items
+    KEY_WIND_RUN_MONTH_KM: "wind_run_month",
+    KEY_NET_RADIATION: "net_radiation",
+    KEY_RAIN_TODAY_MM: "rain_today_mm",
+    KEY_CONDITIONS_SUMMARY: "conditions_summary",
+}
+
+
 class WSSensor(RestoreEntity, CoordinatorEntity, SensorEntity):
     """A single derived sensor for Weather Station Core.
 
@@ -2649,6 +2838,11 @@ class WSSensor(RestoreEntity, CoordinatorEntity, SensorEntity):
             }.get(desc.unit_group, desc.native_unit)
         else:
             self._attr_native_unit_of_measurement = desc.native_unit
+        # The display unit is fixed for the entity's lifetime (a unit change in
+        # options reloads the entry), so resolve the conversion factor once.
+        self._unit_factor = _UNIT_GROUP_FACTORS.get(desc.unit_group or "", {}).get(
+            self._attr_native_unit_of_measurement, 1.0
+        )
         self._attr_state_class = desc.state_class
         if desc.suggested_display_precision is not None:
             self._attr_suggested_display_precision = desc.suggested_display_precision
@@ -2691,204 +2885,14 @@ class WSSensor(RestoreEntity, CoordinatorEntity, SensorEntity):
 
     @staticmethod
     def _slug_for_key(key: str) -> str:
-        overrides = {
-            KEY_DATA_QUALITY: "data_quality_banner",
-            KEY_FORECAST: "forecast_daily",
-            KEY_NORM_TEMP_C: "temperature",
-            KEY_DEW_POINT_C: "dew_point",
-            KEY_FROST_POINT_C: "frost_point",
-            KEY_WET_BULB_C: "wet_bulb",
-            KEY_NORM_HUMIDITY: "humidity",
-            KEY_NORM_PRESSURE_HPA: "station_pressure",
-            KEY_SEA_LEVEL_PRESSURE_HPA: "sea_level_pressure",
-            KEY_NORM_WIND_SPEED_MS: "wind_speed",
-            KEY_NORM_WIND_GUST_MS: "wind_gust",
-            KEY_NORM_WIND_DIR_DEG: "wind_direction",
-            KEY_NORM_RAIN_TOTAL_MM: "rain_total",
-            KEY_RAIN_RATE_FILT: "rain_rate",
-            KEY_BATTERY_PCT: "battery",
-            KEY_FEELS_LIKE_C: "feels_like",
-            KEY_ZAMBRETTI_FORECAST: "zambretti_forecast",
-            KEY_ZAMBRETTI_NUMBER: "zambretti_number",
-            KEY_WIND_BEAUFORT: "wind_beaufort",
-            KEY_WIND_QUADRANT: "wind_quadrant",
-            KEY_WIND_DIR_SMOOTH_DEG: "wind_direction_smooth",
-            KEY_CURRENT_CONDITION: "current_condition",
-            KEY_RAIN_PROBABILITY: "rain_probability",
-            KEY_RAIN_PROBABILITY_COMBINED: "rain_probability_combined",
-            KEY_RAIN_DISPLAY: "rain_display",
-            KEY_RAIN_ACCUM_1H: "rain_last_1h",
-            KEY_RAIN_ACCUM_24H: "rain_last_24h",
-            KEY_PRESSURE_TREND_DISPLAY: "pressure_trend",
-            KEY_HEALTH_DISPLAY: "station_health",
-            KEY_FORECAST_TILES: "forecast_tiles",
-            KEY_TEMP_HIGH_24H: "temperature_high_24h",
-            KEY_TEMP_LOW_24H: "temperature_low_24h",
-            KEY_TEMP_AVG_24H: "temperature_avg_24h",
-            KEY_WIND_GUST_MAX_24H: "wind_gust_max_24h",
-            KEY_HUMIDITY_LEVEL_DISPLAY: "humidity_level",
-            KEY_UV_LEVEL_DISPLAY: "uv_level",
-            KEY_TEMP_DISPLAY: "temperature_display",
-            KEY_FIRE_RISK_SCORE: "fire_risk_score",
-            KEY_SENSOR_QUALITY_FLAGS: "sensor_quality_flags",
-            KEY_LUX: "illuminance",
-            KEY_UV: "uv_index",
-            KEY_ALERT_STATE: "alert_state",
-            KEY_ALERT_MESSAGE: "alert_message",
-            KEY_PACKAGE_STATUS: "package_status",
-            KEY_PRESSURE_CHANGE_WINDOW_HPA: "pressure_change_window",
-            KEY_PRESSURE_TREND_HPAH: "pressure_trend_raw",
-            KEY_SEA_SURFACE_TEMP: "sea_surface_temperature",
-            # v0.6.0
-            KEY_ET0_DAILY_MM: "et0_daily",
-            KEY_ET0_HOURLY_MM: "et0_hourly",
-            KEY_WU_STATUS: "wu_upload_status",
-            # v0.7.0
-            KEY_AQI: "air_quality_index",
-            KEY_PM2_5: "pm2_5",
-            KEY_PM10: "pm10",
-            KEY_NO2: "no2",
-            KEY_OZONE: "ozone",
-            KEY_POLLEN_OVERALL: "pollen_level",
-            KEY_POLLEN_GRASS: "pollen_grass",
-            KEY_POLLEN_TREE: "pollen_tree",
-            KEY_POLLEN_WEED: "pollen_weed",
-            # v0.8.0
-            KEY_MOON_DISPLAY: "moon",
-            KEY_MOON_ILLUMINATION_PCT: "moon_illumination",
-            # v0.9.0
-            KEY_SOLAR_FORECAST_TODAY_KWH: "solar_forecast_today",
-            KEY_SOLAR_FORECAST_TOMORROW_KWH: "solar_forecast_tomorrow",
-            KEY_ET0_PM_DAILY_MM: "et0_penman_monteith",
-            # v1.2.0
-            KEY_FOG_PROBABILITY: "fog_probability",
-            KEY_THUNDERSTORM_RISK: "thunderstorm_risk",
-            KEY_DRY_STREAK: "dry_streak_days",
-            KEY_HEAT_STREAK: "heat_streak_days",
-            KEY_FROST_STREAK: "frost_streak_days",
-            KEY_SENSOR_DRIFT_FLAGS: "sensor_drift",
-            KEY_CONSISTENCY_FLAGS: "sensor_consistency",
-            KEY_CLIMATOLOGY_30D: "climatology_30d",
-            KEY_TEMP_ANOMALY_30D: "temperature_anomaly_30d",
-            KEY_RAIN_ANOMALY_30D: "rain_anomaly_30d",
-            KEY_TEMP_ANOMALY_90D: "temp_anomaly_90d",
-            KEY_RAIN_ANOMALY_90D: "rain_anomaly_90d",
-            KEY_FORECAST_AGREEMENT: "forecast_agreement",
-            KEY_FORECAST_SKILL: "forecast_skill",
-            KEY_FORECAST_BRIER_LOCAL: "forecast_brier_local",
-            KEY_FORECAST_BRIER_API: "forecast_brier_api",
-            KEY_FORECAST_BLEND_WEIGHT_LOCAL: "forecast_blend_weight_local",
-            KEY_SOLAR_LUX_FACTOR: "solar_lux_factor",
-            # v1.3.0 - FWI components
-            KEY_FWI_FFMC: "fwi_ffmc",
-            KEY_FWI_DMC: "fwi_dmc",
-            KEY_FWI_DC: "fwi_dc",
-            KEY_FWI_ISI: "fwi_isi",
-            KEY_FWI_BUI: "fwi_bui",
-            KEY_FWI: "fwi",
-            KEY_FWI_DSR: "fwi_dsr",
-            # v1.5.0 - comfort indices + agrometeorological
-            KEY_HEAT_INDEX: "heat_index",
-            KEY_WIND_CHILL: "wind_chill",
-            KEY_HUMIDEX: "humidex",
-            KEY_VPD: "vpd",
-            KEY_ABSOLUTE_HUMIDITY: "absolute_humidity",
-            KEY_DELTA_T: "delta_t",
-            KEY_THW_INDEX: "thw_index",
-            KEY_THSW_INDEX: "thsw_index",
-            KEY_WIND_RUN_KM: "wind_run",
-            KEY_CHILL_HOURS_TODAY: "chill_hours_today",
-            KEY_CHILL_HOURS_SEASON: "chill_hours_season",
-            KEY_CLEARNESS_INDEX: "clearness_index",
-            KEY_CLOUD_COVER_PCT: "cloud_cover",
-            KEY_VIGILANCE_MAX_LEVEL: "vigilance",
-            # river_level slugs are handled in WSRiverSensor directly
-            KEY_RAIN_NEXT_60MIN: "rain_next_60min",
-            KEY_MINUTES_UNTIL_RAIN: "minutes_until_rain",
-            KEY_MINUTES_UNTIL_DRY: "minutes_until_dry",
-            KEY_NOWCAST_INTENSITY: "nowcast_intensity",
-            # v2.0
-            KEY_CLOUD_BASE_M: "cloud_base",
-            KEY_FREEZING_LEVEL_M: "freezing_level",
-            KEY_WIND_GUST_FACTOR: "wind_gust_factor",
-            KEY_AIR_DENSITY: "air_density",
-            KEY_SPECIFIC_HUMIDITY: "specific_humidity",
-            KEY_WBGT: "wbgt",
-            KEY_RAIN_THIS_WEEK_MM: "rain_this_week",
-            KEY_RAIN_THIS_MONTH_MM: "rain_this_month",
-            KEY_RAIN_THIS_YEAR_MM: "rain_this_year",
-            KEY_RAIN_RATE_MAX_24H: "rain_rate_max_24h",
-            KEY_HDD_TODAY_MM: "hdd_today",
-            KEY_HDD_SEASON: "hdd_season",
-            KEY_CDD_TODAY_MM: "cdd_today",
-            KEY_CDD_SEASON: "cdd_season",
-            KEY_GDD_TODAY_V2: "gdd_today",
-            KEY_GDD_SEASON_V2: "gdd_season",
-            KEY_LEAF_WETNESS: "leaf_wetness",
-            # v2.0 batch 3
-            KEY_DOMINANT_WIND_DIR: "dominant_wind_direction",
-            KEY_WIND_DIR_VARIABILITY: "wind_direction_variability",
-            KEY_SOLAR_ENERGY_TODAY_WHM2: "solar_energy_today",
-            KEY_MAX_SOLAR_RADIATION: "max_solar_radiation",
-            KEY_PEAK_SUN_HOURS: "peak_sun_hours",
-            KEY_IRRIGATION_DEFICIT: "irrigation_deficit",
-            # v2.0 batch 4
-            KEY_FFDI: "ffdi",
-            KEY_FFWI: "ffwi",
-            KEY_UTCI: "utci",
-            # v2.0 batch 5 (lightning)
-            KEY_LIGHTNING_COUNT_1H: "lightning_count_1h",
-            KEY_LIGHTNING_DISTANCE_KM: "lightning_distance",
-            KEY_LIGHTNING_RATE_1H: "lightning_rate",
-            KEY_LIGHTNING_CLEARANCE_MIN: "lightning_clearance",
-            KEY_LIGHTNING_PROXIMITY: "lightning_proximity",
-            # v2.0 upload targets
-            KEY_WC_STATUS: "wc_upload_status",
-            KEY_PWS_STATUS: "pws_upload_status",
-            KEY_WOW_STATUS: "wow_upload_status",
-            KEY_AWEKAS_STATUS: "awekas_upload_status",
-            KEY_CWOP_STATUS_V2: "cwop_upload_status",
-            KEY_OWM_STATIONS_STATUS: "owm_stations_upload_status",
-            KEY_WINDY_STATUS: "windy_upload_status",
-            # v2.0 indoor sensors
-            KEY_INDOOR_TEMP_C: "indoor_temperature",
-            KEY_INDOOR_HUMIDITY: "indoor_humidity",
-            KEY_INDOOR_CO2_PPM: "indoor_co2",
-            KEY_INDOOR_TEMP_DELTA: "indoor_temp_delta",
-            KEY_INDOOR_HUMIDITY_DELTA: "indoor_humidity_delta",
-            KEY_INDOOR_COMFORT: "indoor_comfort",
-            # v2.0 data quality
-            KEY_SENSOR_STUCK: "sensor_stuck",
-            KEY_DATA_QUALITY_SCORE: "data_quality_score",
-            KEY_NEIGHBOR_QC: "neighbor_qc",
-            KEY_SENSOR_SPIKE: "sensor_spike",
-            # v2.0 finishing items
-            KEY_WIND_RUN_MONTH_KM: "wind_run_month",
-            KEY_NET_RADIATION: "net_radiation",
-            KEY_RAIN_TODAY_MM: "rain_today_mm",
-            KEY_CONDITIONS_SUMMARY: "conditions_summary",
-        }
-        if key in overrides:
-            return overrides[key]
+        slug = _SLUG_OVERRIDES.get(key)
+        if slug is not None:
+            return slug
         # Fallback: strip common prefixes/suffixes for a clean slug
         return key.replace("_mmph", "").replace("_ms", "").replace("_hpa", "").replace("_c", "")
 
     def _apply_unit_conversion(self, val: float) -> float:
-        unit = self._attr_native_unit_of_measurement
-        group = self._unit_group
-        if group == "wind":
-            return val * _WIND_FACTORS.get(unit, 1.0)
-        if group == "pressure":
-            return val * _PRESSURE_FACTORS.get(unit, 1.0)
-        if group == "rain":
-            return val / 25.4 if unit == "in" else val
-        if group == "rain_rate":
-            return val / 25.4 if unit == "in/h" else val
-        if group == "distance":
-            return val * _DISTANCE_FACTORS.get(unit, 1.0)
-        if group == "altitude":
-            return val * _ALTITUDE_FACTORS.get(unit, 1.0)
-        return val
+        return val * self._unit_factor
 
     @property
     def native_value(self):
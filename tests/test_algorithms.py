@@ -46,6 +46,7 @@ from custom_components.ws_core.algorithms import (
     moon_display_string,
     pollen_level,
     pollen_overall,
+    pressure_trend_arrow,
     pressure_trend_display,
     uv_burn_time_minutes,
     uv_level,
@@ -120,6 +121,26 @@ class TestPressureTrend:
         label = pressure_trend_display(-2.5)
         assert label
 
+    @pytest.mark.parametrize(
+        ("trend", "label"),
+        [
+            (1.6, "rising_rapidly"),
+            (1.59, "rising"),
+            (0.8, "rising"),
+            (0.79, "steady"),
+            (-0.79, "steady"),
+            (-0.8, "falling"),
+            (-1.59, "falling"),
+            (-1.6, "falling_rapidly"),
+            (float("nan"), "falling_rapidly"),
+        ],
+    )
+    def test_class_boundaries(self, trend, label):
+        assert pressure_trend_display(trend) == label
+
+    def test_nan_arrow_matches_label(self):
+        assert pressure_trend_arrow(float("nan")) == "\u2193\u2193"
+
 
 class TestZambretti:
     def test_returns_tuple(self):
@@ -131,6 +152,16 @@ class TestZambretti:
         forecast, num = zambretti_forecast(1030.0, 1.5, "SW", 50.0, 6, "northern", "mediterranean")
         assert num >= 1
 
+    def test_every_climate_region_has_wind_table(self):
+        from custom_components.ws_core.algorithms import _ZAMBRETTI_WIND_ADJ
+        from custom_components.ws_core.const import CLIMATE_REGION_OPTIONS
+
+        assert set(_ZAMBRETTI_WIND_ADJ) == set(CLIMATE_REGION_OPTIONS)
+
+    def test_unknown_region_uses_mediterranean(self):
+        args = (1010.0, 0.0, "S", 60.0, 6, "northern")
+        assert zambretti_forecast(*args, climate="nowhere") == zambretti_forecast(*args, climate="mediterranean")
+
 
 class TestUV:
     def test_uv_3_reasonable(self):
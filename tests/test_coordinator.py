@@ -7,6 +7,7 @@ state machine and test each _compute_* sub-method in isolation.
 
 import os
 import sys
+import time
 from collections import deque
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
@@ -21,6 +22,7 @@ from custom_components.ws_core.const import (
     CONF_SOURCES,
     CONF_STALENESS_S,
     KEY_ALERT_STATE,
+    KEY_CURRENT_CONDITION,
     KEY_DATA_QUALITY,
     KEY_DEW_POINT_C,
     KEY_FEELS_LIKE_C,
@@ -28,6 +30,9 @@ from custom_components.ws_core.const import (
     KEY_HEALTH_DISPLAY,
     KEY_NORM_WIND_GUST_MS,
     KEY_PACKAGE_OK,
+    KEY_PACKAGE_STATUS,
+    KEY_PRESSURE_CHANGE_WINDOW_HPA,
+    KEY_PRESSURE_TREND_HPAH,
     KEY_SEA_LEVEL_PRESSURE_HPA,
     KEY_WET_BULB_C,
     KEY_WIND_BEAUFORT,
@@ -173,6 +178,8 @@ def _make_coordinator(
     coord._solar_energy_today_whm2 = 0.0
     coord._solar_energy_date = ""
     coord._solar_energy_last_ts = None
+    coord._indoor_rooms = []
+    coord._blitzortung_sources = {}
     # degree days (off by default)
     coord.degree_days_enabled = False
     coord._hdd_base_c = 18.0
@@ -272,6 +279,111 @@ class TestComputeRawReadings:
 # ---------------------------------------------------------------------------
 
 
+class TestSourceChangeFilter:
+    def _event(self, old, new):
+        return MagicMock(data={"old_state": old, "new_state": new})
+
+    def test_unchanged_value_is_ignored(self):
+        coord = _make_coordinator()
+        coord._source_debouncer = MagicMock()
+        coord._handle_source_change(self._event(_make_state("21.5", "°C"), _make_state("21.5", "°C")))
+        coord._source_debouncer.async_schedule_call.assert_not_called()
+
+    def test_changed_value_or_unit_schedules_compute(self):
+        coord = _make_coordinator()
+        coord._source_debouncer = MagicMock()
+        coord._handle_source_change(self._event(_make_state("21.5", "°C"), _make_state("21.6", "°C")))
+        coord._handle_source_change(self._event(_make_state("21.5", "°C"), _make_state("21.5", "°F")))
+        coord._handle_source_change(self._event(None, _make_state("21.5", "°C")))
+        assert coord._source_debouncer.async_schedule_call.call_count == 3
+
+    def test_battery_update_patches_last_result(self):
+        from custom_components.ws_core.const import KEY_BATTERY_PCT, SRC_BATTERY
+
+        coord = _make_coordinator()
+        coord.sources = {**coord.sources, SRC_BATTERY: "sensor.battery"}
+        coord._source_debouncer = MagicMock()
+        coord.async_set_updated_data = MagicMock()
+        coord.data = {KEY_DEW_POINT_C: 12.3, KEY_BATTERY_PCT: 80}
+        event = self._event(_make_state("80", "%"), _make_state("79", "%"))
+        event.data["entity_id"] = "sensor.battery"
+        coord._handle_source_change(event)
+        coord._source_debouncer.async_schedule_call.assert_not_called()
+        patched = coord.async_set_updated_data.call_args[0][0]
+        assert patched[KEY_BATTERY_PCT] == 79
+        assert patched[KEY_DEW_POINT_C] == 12.3
+        assert coord.data[KEY_BATTERY_PCT] == 80  # previous snapshot untouched
+
+    def test_tick_skipped_only_while_inputs_and_result_are_current(self):
+        from custom_components.ws_core.const import IDLE_RECOMPUTE_MIN_S
+
+        coord = _make_coordinator()
+        coord.data = {KEY_DEW_POINT_C: 12.3}
+        coord.async_set_updated_data = MagicMock()
+        rt = coord.runtime
+        rt.compute_sig = coord._source_signature()
+        rt.compute_mono = time.monotonic()
+        with patch.object(coord, "_compute", return_value={}) as compute:
+            coord._handle_tick(None)
+            compute.assert_not_called()
+            # The last pass is old enough: time-based outputs need a refresh
+            rt.compute_mono -= IDLE_RECOMPUTE_MIN_S
+            coord._handle_tick(None)
+            assert compute.call_count == 1
+            # A source state changed since the last pass
+            rt.compute_mono = time.monotonic()
+            get_state = coord.hass.states.get
+            new_temp = _make_state("23.0", "°C")
+            coord.hass.states.get = lambda eid: new_temp if eid == "sensor.temp" else get_state(eid)
+            coord._handle_tick(None)
+            assert compute.call_count == 2
+
+    def test_detected_blitzortung_sensors_are_compute_inputs(self):
+        from custom_components.ws_core.const import SRC_LIGHTNING_COUNT
+
+        coord = _make_coordinator()
+        coord._source_signature()
+        # Detected after the fixed ids were cached
+        coord._blitzortung_sources[SRC_LIGHTNING_COUNT] = "sensor.blitzortung_lightning_counter"
+        sig = coord._source_signature()
+        strikes = _make_state("3", "")
+        get_state = coord.hass.states.get
+        coord.hass.states.get = lambda eid: strikes if eid == "sensor.blitzortung_lightning_counter" else get_state(eid)
+        assert coord._source_signature() != sig
+
+    async def test_requested_refresh_always_recomputes(self):
+        coord = _make_coordinator()
+        coord.data = {KEY_DEW_POINT_C: 12.3}
+        rt = coord.runtime
+        rt.compute_sig = coord._source_signature()
+        rt.compute_mono = time.monotonic()
+        # A fetcher filled its cache and asked for a refresh within the idle
+        # window; no source State changed, but the new data must be published.
+        fresh = {KEY_DEW_POINT_C: 12.3, "aqi": 42}
+        with patch.object(coord, "_compute", return_value=fresh) as compute:
+            assert await coord._async_update_data() is fresh
+            compute.assert_called_once()
+
+    def test_indoor_room_sensors_are_compute_inputs(self):
+        coord = _make_coordinator()
+        coord._indoor_rooms = [
+            {
+                "id": "office",
+                "name": "Office",
+                "temp": "sensor.office_temp",
+                "humidity": None,
+                "co2": "sensor.office_co2",
+            }
+        ]
+        assert {"sensor.office_temp", "sensor.office_co2"} <= set(coord._signature_entity_ids)
+        assert None not in coord._signature_entity_ids
+        sig = coord._source_signature()
+        get_state = coord.hass.states.get
+        co2 = _make_state("650", "ppm")
+        coord.hass.states.get = lambda eid: co2 if eid == "sensor.office_co2" else get_state(eid)
+        assert coord._source_signature() != sig
+
+
 class TestComputeDerivedTemperature:
     def test_computes_dew_point(self):
         coord = _make_coordinator()
@@ -333,6 +445,24 @@ class TestComputeDerivedPressure:
             coord._compute_derived_pressure(data, t, 20.0, 1013.0 + i * 0.1, 60.0)
         assert len(coord.runtime.pressure_history) >= 2
 
+    def test_trend_refit_only_on_new_sample(self):
+        from custom_components.ws_core import coordinator as coord_mod
+
+        coord = _make_coordinator()
+        now = datetime.now(UTC)
+        with patch.object(
+            coord_mod, "least_squares_pressure_trend", wraps=coord_mod.least_squares_pressure_trend
+        ) as fit:
+            for minutes in (0, 16, 17, 18, 32):
+                data = {}
+                coord._compute_derived_pressure(
+                    data, now + timedelta(minutes=minutes), 20.0, 1013.0 + minutes / 10, 60.0
+                )
+            # Samples land at 0, 16 and 32 min; the fit runs once per landed sample
+            assert fit.call_count == 2
+        assert data[KEY_PRESSURE_TREND_HPAH] == coord.runtime.last_trend_3h
+        assert data[KEY_PRESSURE_CHANGE_WINDOW_HPA] == round(1016.2 - 1013.0, 2)
+
     def test_zambretti_computed(self):
         coord = _make_coordinator()
         data = {KEY_WIND_QUADRANT: "N"}
@@ -343,6 +473,20 @@ class TestComputeDerivedPressure:
         assert data[KEY_ZAMBRETTI_NUMBER] is not None
         assert 1 <= data[KEY_ZAMBRETTI_NUMBER] <= 26
 
+    def test_zambretti_reused_for_unchanged_inputs(self):
+        from custom_components.ws_core import coordinator as coord_mod
+
+        coord = _make_coordinator()
+        now = datetime.now(UTC)
+        with patch.object(coord_mod, "zambretti_forecast", wraps=coord_mod.zambretti_forecast) as zf:
+            first, second = {}, {}
+            coord._compute_derived_pressure(first, now, 20.0, 1013.0, 60.0, "N")
+            coord._compute_derived_pressure(second, now, 20.0, 1013.0, 60.0, "N")
+            assert zf.call_count == 1
+            assert second[KEY_ZAMBRETTI_NUMBER] == first[KEY_ZAMBRETTI_NUMBER]
+            coord._compute_derived_pressure({}, now, 20.0, 1013.0, 60.0, "S")
+            assert zf.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Tests: Derived Wind
@@ -360,8 +504,9 @@ class TestComputeDerivedWind:
     def test_computes_quadrant(self):
         coord = _make_coordinator()
         data = {}
-        coord._compute_derived_wind(data, datetime.now(UTC), 3.0, 5.0, 90.0)
+        quadrant = coord._compute_derived_wind(data, datetime.now(UTC), 3.0, 5.0, 90.0)
         assert data[KEY_WIND_QUADRANT] == "E"
+        assert quadrant == "E"
 
     def test_smoothes_direction(self):
         coord = _make_coordinator()
@@ -377,6 +522,48 @@ class TestComputeDerivedWind:
         assert 0 < smooth < 180 or smooth > 300  # accounts for circular averaging
 
 
+# ---------------------------------------------------------------------------
+# Tests: Current Condition
+# ---------------------------------------------------------------------------
+
+
+class TestComputeCondition:
+    def test_repeated_inputs_hit_cache(self):
+        from custom_components.ws_core import coordinator as coord_mod
+
+        coord = _make_coordinator()
+        coord_mod._classify_condition.cache_clear()
+        with patch.object(coord_mod, "determine_current_condition", wraps=coord_mod.determine_current_condition) as dcc:
+            first, second = {}, {}
+            coord._compute_condition(first, 22.0, 55.0, 3.5, 6.0, 0.0, 12.0, 40000.0, 3.0)
+            coord._compute_condition(second, 22.0, 55.0, 3.5, 6.0, 0.0, 12.0, 40000.0, 3.0)
+            assert dcc.call_count == 1
+            assert second == first
+            rainy = {}
+            coord._compute_condition(rainy, 22.0, 55.0, 3.5, 6.0, 4.0, 12.0, 40000.0, 3.0)
+            assert dcc.call_count == 2
+            assert rainy[KEY_CURRENT_CONDITION] == "rainy"
+            assert rainy["_condition_icon"] == "mdi:weather-rainy"
+
+    def test_zero_lux_reading_is_not_replaced_by_default(self):
+        coord = _make_coordinator()
+        with patch.object(coord, "_sun_position", return_value=(-20.0, 0.0, False)):
+            dark, missing = {}, {}
+            coord._compute_condition(dark, 15.0, 40.0, 1.0, 2.0, 0.0, 1.5, 0.0, 0.0)
+            coord._compute_condition(missing, 15.0, 40.0, 1.0, 2.0, 0.0, 1.5, None, None)
+        assert dark[KEY_CURRENT_CONDITION] == "clear-night"
+        assert missing[KEY_CURRENT_CONDITION] == "overcast-night"
+
+    def test_sun_position_parsed_once_per_state(self):
+        coord = _make_coordinator()
+        first = coord._sun_position()
+        assert first == (45.0, 180.0, True)
+        assert coord._sun_position() is first
+
+        coord.hass.states.get = lambda eid: MagicMock(state="below_horizon", attributes={"elevation": -6})
+        assert coord._sun_position() == (-6.0, 180.0, False)
+
+
 # ---------------------------------------------------------------------------
 # Tests: Health / Quality
 # ---------------------------------------------------------------------------
@@ -399,6 +586,17 @@ class TestComputeHealth:
         assert data[KEY_PACKAGE_OK] is False
         assert "ERROR" in data.get(KEY_DATA_QUALITY, "") or "missing" in data.get(KEY_DATA_QUALITY, "").lower()
 
+    def test_stale_source_detected(self):
+        coord = _make_coordinator()
+        now = datetime.now(UTC)
+        data = {}
+        coord._compute_health(data, now, missing=[], missing_entities=[])
+        assert "Stale" not in data[KEY_PACKAGE_STATUS]
+        # Same state objects, later clock: the cached deadline must still expire
+        data = {}
+        coord._compute_health(data, now + timedelta(seconds=901), missing=[], missing_entities=[])
+        assert "Stale" in data[KEY_PACKAGE_STATUS]
+
     def test_alerts_wind(self):
         coord = _make_coordinator()
         coord.entry_options = {"thresh_wind_gust_ms": 10.0}
@@ -516,3 +714,66 @@ class TestRollingWindows:
         accum = WSStationCoordinator._rain_accum_24h_from_totals(history)
         # Should count 0→1, 1→2, skip 2→0 (reset), 0→1 = total 3mm
         assert abs(accum - 3.0) < 0.1
+
+    def test_incremental_rain_rise_matches_full_walk(self):
+        from custom_components.ws_core.coordinator import WSStationCoordinator
+
+        history, rise = deque(), 0.0
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        # Rises, a counter reset, a small dip, same-minute bursts and hour gaps
+        totals = [0.0, 0.2, 0.2, 0.5, 0.0, 0.3, 0.2, 1.0, 1.4, 1.4, 2.0]
+        steps = [0, 20, 20, 600, 3600, 30, 30, 7200, 40000, 50000, 60]
+        for step, total in zip(steps, totals, strict=True):
+            now += timedelta(seconds=step)
+            rise = WSStationCoordinator._push_rain_total(history, now, total, rise)
+            assert abs(rise - WSStationCoordinator._rain_accum_24h_from_totals(history)) < 1e-9
+
+    def test_monotonic_extremes_match_window(self):
+        from custom_components.ws_core.coordinator import WSStationCoordinator
+
+        history, hi, lo = deque(), deque(), deque()
+        start = datetime.now(UTC)
+        vals = [12.0, 18.5, 9.0, 18.5, 15.0, 7.5, 20.0, 11.0, 11.0, 6.0]
+        for i, v in enumerate(vals):
+            now = start + timedelta(hours=4 * i)
+            WSStationCoordinator._append_and_prune_24h(history, now, v)
+            WSStationCoordinator._track_extreme_24h(hi, now, v, True)
+            WSStationCoordinator._track_extreme_24h(lo, now, v, False)
+            window = WSStationCoordinator._rolling_values(history)
+            assert hi[0][1] == max(window)
+            assert lo[0][1] == min(window)
+
+    def test_minute_panes_coalesce_bursts(self):
+        from custom_components.ws_core.coordinator import WSStationCoordinator
+
+        history = deque()
+        start = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+        evicted = 0.0
+        # Four samples in 12:00, two in 12:01
+        for sec, v in [(0, 5.0), (10, 9.0), (20, 7.0), (50, 6.0), (60, 3.0), (70, 4.0)]:
+            evicted += WSStationCoordinator._append_and_prune_24h(history, start + timedelta(seconds=sec), v, max)
+        assert [v for _, v in history] == [9.0, 4.0]
+        assert history[-1][0] == start + timedelta(seconds=70)
+        # Replaced values are reported as dropped, keeping running sums exact
+        assert evicted + sum(v for _, v in history) == 5.0 + 9.0 + 9.0 + 9.0 + 3.0 + 4.0
+
+    def test_extremes_keep_one_entry_per_minute(self):
+        from custom_components.ws_core.coordinator import WSStationCoordinator
+
+        lo = deque()
+        start = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+        # A steady 1 Hz rise would otherwise keep every sample in the min deque
+        for sec in range(180):
+            WSStationCoordinator._track_extreme_24h(lo, start + timedelta(seconds=sec), 10.0 + sec / 100, False)
+        assert [v for _, v in lo] == [10.0, 10.6, 11.2]
+        assert lo[-1][0] == start + timedelta(seconds=179)
+
+    def test_rain_reset_inside_one_minute_keeps_new_tips(self):
+        from custom_components.ws_core.coordinator import WSStationCoordinator
+
+        history, rise = deque(), 0.0
+        start = datetime(2026, 1, 1, 12, 0, 0, tzinfo=UTC)
+        for sec, total in [(0, 100.0), (10, 0.0), (20, 0.2)]:
+            rise = WSStationCoordinator._push_rain_total(history, start + timedelta(seconds=sec), total, rise)
+        assert abs(rise - 0.2) < 1e-9
+        assert abs(WSStationCoordinator._rain_accum_24h_from_totals(history) - 0.2) < 1e-9
@@ -10,7 +10,7 @@ from __future__ import annotations
 import os
 import sys
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -96,6 +96,8 @@ class TestHistoryRoundTrip:
 
         assert len(dst.runtime.temp_history_24h) == 3
         assert [round(v, 1) for _, v in dst.runtime.temp_history_24h] == [20.0, 21.0, 22.0]
+        assert dst.runtime.temp_sum_24h == 63.0
+        assert dst.runtime.rain_rise_24h == 2.0
         assert list(dst.runtime.pressure_history) == [1010.0, 1011.0, 1012.0]
         assert dst._rain_today_mm == 12.5
         assert dst._rain_today_last_total == 137.0
@@ -103,6 +105,54 @@ class TestHistoryRoundTrip:
         assert dst._chill_hours_today == 3.5
         assert dst._chill_hours_season == 120.0
 
+    def test_spike_inside_one_minute_survives_restore(self):
+        from custom_components.ws_core.coordinator import WSStationCoordinator, _keep_latest
+
+        src = _coord()
+        rt = src.runtime
+        start = dt_util.utcnow().replace(second=0, microsecond=0) - timedelta(minutes=5)
+        # A 31.0 spike and a 12.0 dip inside the first minute; the pane keeps 20.0
+        for sec, v in [(0, 20.0), (10, 31.0), (20, 12.0), (30, 20.0), (60, 21.0), (120, 22.0)]:
+            ts = start + timedelta(seconds=sec)
+            WSStationCoordinator._append_and_prune_24h(rt.temp_history_24h, ts, v, _keep_latest)
+            WSStationCoordinator._track_extreme_24h(rt.temp_max_24h, ts, v, True)
+            WSStationCoordinator._track_extreme_24h(rt.temp_min_24h, ts, v, False)
+        assert (rt.temp_max_24h[0][1], rt.temp_min_24h[0][1]) == (31.0, 12.0)
+
+        dst = _coord()
+        dst._restore_history_state(src._dump_history_state())
+        assert list(dst.runtime.temp_max_24h) == list(rt.temp_max_24h)
+        assert list(dst.runtime.temp_min_24h) == list(rt.temp_min_24h)
+
+    async def test_failed_store_does_not_block_the_other(self):
+        from custom_components.ws_core.learning_state import LearningState
+
+        c = _coord()
+        c._learning_state = LearningState()
+        c._learning_store = AsyncMock()
+        c._history_store = AsyncMock()
+        c._history_store.async_save.side_effect = OSError("disk full")
+        await c._async_save_stores()
+        c._learning_store.async_save.assert_awaited_once()
+
+        c._learning_store.async_save.reset_mock(side_effect=True)
+        c._learning_store.async_save.side_effect = OSError("disk full")
+        c._history_store.async_save.reset_mock(side_effect=True)
+        await c._async_save_stores()
+        c._history_store.async_save.assert_awaited_once()
+
+    async def test_unserializable_history_still_saves_learning(self):
+        from custom_components.ws_core.learning_state import LearningState
+
+        c = _coord()
+        c._learning_state = LearningState()
+        c._learning_store = AsyncMock()
+        c._history_store = AsyncMock()
+        with patch.object(type(c), "_dump_history_state", side_effect=ValueError("bad sample")):
+            await c._async_save_stores()
+        c._history_store.async_save.assert_not_called()
+        c._learning_store.async_save.assert_awaited_once()
+
     def test_old_24h_entries_pruned_on_restore(self):
         src = _coord()
         now = dt_util.utcnow()
@@ -150,6 +200,19 @@ class TestHistoryRoundTrip:
         assert [v for _, v in dst.runtime.temp_history_24h] == [22.0]
         assert list(dst.runtime.pressure_history) == [1009.0]
 
+    def test_out_of_range_samples_dropped(self):
+        dst = _coord()
+        ts = dt_util.utcnow().isoformat()
+        blob = {
+            "temp_history_24h": [[ts, 999.0], [ts, 18.5], [ts, "nan"]],
+            "gust_history_24h": [[ts, -3.0], [ts, 7.0], [ts, 500.0]],
+            "rain_total_history_24h": [[ts, 1234.5]],
+        }
+        dst._restore_history_state(blob)
+        assert [v for _, v in dst.runtime.temp_history_24h] == [18.5]
+        assert [v for _, v in dst.runtime.gust_history_24h] == [7.0]
+        assert [v for _, v in dst.runtime.rain_total_history_24h] == [1234.5]
+
     def test_season_chill_persists_across_days(self):
         src = _coord()
         yesterday = (dt_util.now() - timedelta(days=1)).strftime("%Y-%m-%d")
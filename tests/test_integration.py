@@ -151,6 +151,34 @@ class TestConfigFlowStructure:
         features = strings["config"]["step"]["features"]["data"]
         assert "enable_zambretti" not in features, "Zambretti toggle should be removed"
 
+    def test_features_schema_built_once(self):
+        from custom_components.ws_core.config_flow import _features_schema
+
+        schema = _features_schema()
+        assert schema is _features_schema()
+        assert "enable_zambretti" not in {m.schema for m in schema.schema}
+
+    def test_toggle_tables_cover_options_steps(self):
+        """Config-flow features and options features/uploads share one toggle table."""
+        from custom_components.ws_core.config_flow import _FEATURE_TOGGLES, _UPLOAD_TOGGLES, _features_schema
+
+        with open("custom_components/ws_core/strings.json", encoding="utf-8") as f:
+            strings = json.load(f)
+        opt_steps = strings["options"]["step"]
+        assert {k for k, _ in _FEATURE_TOGGLES} <= set(opt_steps["features_opt"]["data"])
+        assert {k for k, _ in _UPLOAD_TOGGLES} <= set(opt_steps["upload_services_opt"]["data"])
+        keys = {m.schema for m in _features_schema().schema}
+        assert keys == {k for k, _ in (*_FEATURE_TOGGLES, *_UPLOAD_TOGGLES)} | {"_go_back"}
+
+    def test_show_step_reuses_cached_schema(self):
+        from types import SimpleNamespace
+
+        from custom_components.ws_core.config_flow import WSStationConfigFlow, _features_schema
+
+        flow = SimpleNamespace(_step_history=["user"], async_show_form=lambda **kw: kw)
+        shown = WSStationConfigFlow._show_step(flow, step_id="features", data_schema=_features_schema())
+        assert shown["data_schema"] is _features_schema()
+
     def test_go_back_in_all_non_user_steps(self):
         """Every config step except 'user' should have _go_back translation."""
         with open("custom_components/ws_core/strings.json", encoding="utf-8") as f:
@@ -449,6 +477,8 @@ class TestDiagnostics:
         assert "entry_data" in result
         assert "sensor_stats" in result
         assert "runtime" in result
+        assert result["runtime"]["gust_history_24h_samples"] == 0
+        assert result["runtime"]["rain_total_history_24h_samples"] == 0
         assert result["data_quality"] == "OK"
 
     def test_diagnostics_redacts_coords(self):
@@ -527,6 +557,9 @@ class TestOptionsFlowSourceValidation:
         hass.config.elevation = 100
         hass.states.get = lambda eid: _State(states[eid]) if eid in states else None
         hass.states.async_all = lambda: [type("S", (), {"entity_id": e, "attributes": {}})() for e in states]
+        hass.states.async_entity_ids = lambda domain=None: [
+            e for e in states if domain is None or e.startswith(f"{domain}.")
+        ]
 
         entry = MagicMock()
         entry.data = {CONF_SOURCES: dict(sources)}
@@ -607,3 +640,140 @@ class TestOptionsFlowSourceValidation:
 
         # Must not raise vol.Invalid for the empty weather entity.
         schema(user_input)
+
+    def test_source_defaults_guessed_once_per_flow(self):
+        """Re-rendering the source forms reuses the first auto-detection pass."""
+        import asyncio
+
+        from custom_components.ws_core.const import REQUIRED_SOURCES
+
+        sources = {k: f"sensor.{k}" for k in REQUIRED_SOURCES}
+        flow = self._make_flow(sources, {f"sensor.{k}": "1.0" for k in REQUIRED_SOURCES})
+        calls = []
+        entity_ids = flow.hass.states.async_entity_ids
+        flow.hass.states.async_entity_ids = lambda domain=None: calls.append(domain) or entity_ids(domain)
+
+        asyncio.run(flow.async_step_required_sources_opt(None))
+        bad = dict(sources)
+        bad[REQUIRED_SOURCES[0]] = "sensor.does_not_exist"
+        asyncio.run(flow.async_step_required_sources_opt(bad))
+        asyncio.run(flow.async_step_optional_sources_opt(None))
+        assert calls == ["sensor"]
+
+
+class TestSanitizePrefix:
+    """Entity-id prefix sanitizing used by both the config and options flows."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("ws", "ws"),
+            ("  My Station  ", "my_station"),
+            ("garden-ws 2", "garden_ws_2"),
+            ("a -- b", "a____b"),
+            ("wet·ter", "wet_ter"),
+            ("__ws__", "ws"),
+            ("stationé", "station"),
+            ("", "ws"),
+            ("!!!", "ws"),
+        ],
+    )
+    def test_sanitize(self, raw, expected):
+        from custom_components.ws_core.config_flow import _sanitize_prefix
+
+        assert _sanitize_prefix(raw) == expected
+
+
+class TestFormUnits:
+    """Threshold unit factors resolved once per config/options form."""
+
+    def test_metric_is_identity(self):
+        from custom_components.ws_core.config_flow import _FormUnits
+
+        u = _FormUnits.resolve(False, "auto", "auto", "auto")
+        assert (u.gust_u, u.rain_u, u.temp_u) == ("m/s", "mm/h", "°C")
+        assert u.gust_to_ms == u.rain_to_mmph == 1.0
+        assert u.temp_to_c(3.0) == 3.0
+
+    def test_imperial_round_trip(self):
+        from custom_components.ws_core.config_flow import _FormUnits
+
+        u = _FormUnits.resolve(True, "auto", "auto", "auto")
+        assert (u.gust_u, u.rain_u, u.temp_u) == ("mph", "in/h", "°F")
+        assert u.temp_to_display(0.0) == pytest.approx(32.0)
+        assert u.temp_to_c(u.temp_to_display(-7.5)) == pytest.approx(-7.5)
+        assert 17.0 * u.gust_to_display * u.gust_to_ms == pytest.approx(17.0)
+        assert 25.4 * u.rain_to_display == pytest.approx(1.0)
+        assert (u.freeze_min, u.freeze_max) == (-22.0, 50.0)
+
+    def test_explicit_units_override_auto(self):
+        from custom_components.ws_core.config_flow import _FormUnits
+
+        u = _FormUnits.resolve(False, "km/h", "in", "F")
+        assert (u.gust_u, u.rain_meas, u.temp_u) == ("km/h", "in", "°F")
+        assert 10.0 * u.gust_to_display == pytest.approx(36.0)
+
+    def test_resolve_is_cached(self):
+        from custom_components.ws_core.config_flow import _FormUnits
+
+        assert _FormUnits.resolve(True, "auto", "mm", "C") is _FormUnits.resolve(True, "auto", "mm", "C")
+
+    def test_alerts_schema_cached_per_units(self):
+        from custom_components.ws_core.config_flow import _alerts_schema, _FormUnits
+        from custom_components.ws_core.const import CONF_THRESH_FREEZE_C
+
+        metric = _alerts_schema(_FormUnits.resolve(False, "auto", "auto", "auto"))
+        imperial = _alerts_schema(_FormUnits.resolve(True, "auto", "auto", "auto"))
+        assert metric is _alerts_schema(_FormUnits.resolve(False, "auto", "auto", "auto"))
+        assert metric is not imperial
+        freeze = {m.schema: m.default() for m in imperial.schema}[CONF_THRESH_FREEZE_C]
+        assert freeze == pytest.approx(32.0)
+
+    def test_alerts_schema_shown_without_copy(self):
+        from types import SimpleNamespace
+
+        from custom_components.ws_core.config_flow import WSStationConfigFlow, _alerts_schema, _FormUnits
+
+        schema = _alerts_schema(_FormUnits.resolve(False, "auto", "auto", "auto"))
+        flow = SimpleNamespace(_step_history=["user", "features"], async_show_form=lambda **kw: kw)
+        assert WSStationConfigFlow._show_step(flow, step_id="alerts", data_schema=schema)["data_schema"] is schema
+
+
+class TestGuessDefaults:
+    """Source auto-detection ranks station-like suffix matches first."""
+
+    def test_prefers_station_suffix_over_substring(self):
+        from custom_components.ws_core.config_flow import _guess_defaults
+
+        ids = [
+            "sensor.kitchen_temperature_trend",
+            "sensor.living_room_temperature",
+            "sensor.gw2000_outdoor_temperature",
+            "sensor.gw2000_humidity",
+            "sensor.gw2000_outdoor_humidity",
+        ]
+        hass = MagicMock()
+        hass.states.async_entity_ids = lambda domain=None: list(ids)
+
+        guess = _guess_defaults(hass)
+        assert guess[SRC_TEMP] == "sensor.gw2000_outdoor_temperature"
+        assert guess[SRC_HUM] == "sensor.gw2000_outdoor_humidity"
+        assert SRC_PRESS not in guess
+
+
+class TestIsNumericState:
+    """The fast numeric-state predicate must agree with float()."""
+
+    @pytest.mark.parametrize(
+        "state",
+        ["21.4", "-3", "+7", "1013", "0.", ".5", "1e3", " 4 ", "nan", "-inf", "", "-", ".", "1.2.3", "--5", "²", "abc"],
+    )
+    def test_matches_float(self, state):
+        from custom_components.ws_core.config_flow import _is_numeric_state
+
+        try:
+            float(state)
+            expected = True
+        except ValueError:
+            expected = False
+        assert _is_numeric_state(state) is expected
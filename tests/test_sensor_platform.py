@@ -17,6 +17,8 @@ from __future__ import annotations
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
@@ -44,3 +46,13 @@ def test_wind_direction_classes_resolve_without_crashing():
     )
     # state class always falls back to a real member, never missing.
     assert isinstance(sensor._MEASUREMENT_ANGLE_STATE_CLASS, SensorStateClass)
+
+
+def test_every_unit_group_has_a_factor_table():
+    """Unit factors are resolved once per entity; each group must have a table."""
+    from custom_components.ws_core import sensor
+
+    groups = {s.unit_group for s in sensor.SENSORS if s.unit_group}
+    assert groups <= set(sensor._UNIT_GROUP_FACTORS)
+    assert sensor._UNIT_GROUP_FACTORS["rain"]["in"] * 25.4 == pytest.approx(1.0)
+    assert sensor._UNIT_GROUP_FACTORS["rain_rate"]["in/h"] * 25.4 == pytest.approx(1.0)
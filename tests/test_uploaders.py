@@ -111,12 +111,13 @@ def _data() -> dict:
 
 def _coord(session: _FakeSession | None = None) -> "coord_mod.WSStationCoordinator":
     """Build a coordinator with every uploader credential populated."""
-    from custom_components.ws_core.coordinator import WSStationCoordinator
+    from custom_components.ws_core.coordinator import WSStationCoordinator, WSStationRuntime
 
     with patch.object(WSStationCoordinator, "__init__", lambda self, *a, **kw: None):
         coord = WSStationCoordinator.__new__(WSStationCoordinator)
 
     coord.hass = MagicMock()
+    coord.runtime = WSStationRuntime()
     coord.entry_data = {}
     coord.entry_options = {}
     coord.data = _data()
@@ -223,6 +224,25 @@ class TestWUnderground:
             await coord._async_upload_wunderground()
         assert coord._wu_status == "error_network"
 
+    async def test_pwsweather_shares_the_observation_snapshot(self):
+        sess = _FakeSession(status=200, body="success\n")
+        coord = _coord()
+        with _patch_session(sess):
+            await coord._async_upload_wunderground()
+            obs = coord.runtime.upload_obs
+            await coord._async_upload_pwsweather()
+        assert coord.runtime.upload_obs is obs
+        wu, pws = (c["params"] for c in sess.calls)
+        assert {k: v for k, v in wu.items() if k not in ("ID", "PASSWORD", "dateutc")} == {
+            k: v for k, v in pws.items() if k not in ("ID", "PASSWORD", "dateutc")
+        }
+        # A newly published data dict is read again
+        coord.data = {**_data(), KEY_NORM_TEMP_C: 25.0}
+        with _patch_session(sess):
+            await coord._async_upload_wunderground()
+        assert coord.runtime.upload_obs is not obs
+        assert sess.last["params"]["tempf"] == pytest.approx(77.0)
+
     async def test_skips_when_unconfigured(self):
         sess = _FakeSession()
         coord = _coord()
@@ -483,6 +503,7 @@ class TestCWOP:
         # login line then APRS packet
         assert "user FW1234 pass -1" in sent
         assert "FW1234>APRS" in sent
+        assert "z3754.00N/02342.00E_" in sent  # 37.9, 23.7
         assert "_180/" in sent  # wind dir 180
         assert "t068" in sent  # 20°C -> 68°F
 